@@ -1,5 +1,5 @@
 
-__all__ = ["add_ontology_term", "convert_ttl_to_drawio", "domain_subdomain_viewer", "load_mds_ontology", "rdf_subject_extractor", "term_search_general"]
+__all__ = ["add_ontology_term", "convert_ttl_to_drawio", "domain_subdomain_viewer", "load_mds_ontology", "ontology_registry", "rdf_subject_extractor", "term_search_general"]
 
 from .add_ontology_term import add_term_to_ontology
 from .term_search_general import term_search_general, filter_interface
@@ -1,7 +1,7 @@
 import rdflib
 from rdflib import Graph, SKOS, RDF, RDFS, OWL, DCAT, DCTERMS, Namespace, Literal, URIRef
 import FAIRLinked.InterfaceMDS.load_mds_ontology
-from FAIRLinked.InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from FAIRLinked.InterfaceMDS.ontology_registry import get_shared_ontology_graph
 import os
 
 
@@ -15,7 +15,7 @@ def domain_subdomain_viewer():
     - Domains: Absolute top-level classes (no rdfs:subClassOf).
     - Subdomains: Any class in the hierarchy that IS a subclass of something else.
     """
-    mds_ontology_graph = load_mds_ontology_graph()
+    mds_ontology_graph = get_shared_ontology_graph()
 
     unique_domains = {}
     unique_subdomains = {}
@@ -104,7 +104,7 @@ def domain_subdomain_directory(onto_graph: Graph = None, output_dir: str = None)
     """
     # If no graph is passed, we fall back to loading the default one to draw the tree
     if onto_graph is None:
-        onto_graph = load_mds_ontology_graph()
+        onto_graph = get_shared_ontology_graph()
 
     # Generate the map dynamically from the graph metadata!
     dsm = build_dynamic_dsm(onto_graph)
@@ -185,7 +185,7 @@ def domain_subdomain_dir_interface():
             onto_graph = Graph()
             onto_graph.parse(onto_path, format="turtle")
         else:
-            onto_graph = load_mds_ontology_graph()
+            onto_graph = get_shared_ontology_graph()
 
         domain_subdomain_directory(onto_graph=onto_graph, output_dir=output_dir)
     else:
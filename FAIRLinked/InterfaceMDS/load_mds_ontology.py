@@ -1,10 +1,123 @@
+import os
+import json
+import pickle
+from datetime import datetime, timezone
 import rdflib
 from rdflib import Graph, OWL
 import requests
 
-def load_mds_ontology_graph():
+MDS_ONTOLOGY_URL = "https://w3id.org/mds/"
+
+# Environment overrides, mainly for batch nodes where the loader runs implicitly
+CACHE_DIR_ENV = "FAIRLINKED_CACHE_DIR"
+OFFLINE_ENV = "FAIRLINKED_OFFLINE"
+PINNED_VERSION_ENV = "FAIRLINKED_MDS_VERSION"
+
+_INDEX_FILE = "index.json"
+_SNAPSHOT_SUFFIX = ".pickle"
+
+
+def get_ontology_cache_dir(cache_dir=None):
+    """
+    Resolves the directory used to store MDS-Onto snapshots.
+
+    Resolution order: the explicit `cache_dir` argument, the FAIRLINKED_CACHE_DIR
+    environment variable, then `$XDG_CACHE_HOME/FAIRLinked` (falling back to
+    `~/.cache/FAIRLinked`). Snapshots live in an `mds_onto` subfolder.
+
+    Args:
+        cache_dir (str, optional): Base cache directory.
+
+    Returns:
+        str: Path to the MDS-Onto snapshot directory (not created here).
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir is None:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+        cache_dir = os.path.join(xdg_cache, "FAIRLinked")
+    return os.path.join(cache_dir, "mds_onto")
+
+
+def _read_cache_index(onto_cache_dir):
+    index_path = os.path.join(onto_cache_dir, _INDEX_FILE)
+    if not os.path.exists(index_path):
+        return {"latest": None, "versions": {}}
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"latest": None, "versions": {}}
+
+
+def _write_cache_index(onto_cache_dir, index):
+    index_path = os.path.join(onto_cache_dir, _INDEX_FILE)
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+    os.replace(tmp_path, index_path)
+
+
+def _snapshot_path(onto_cache_dir, version):
+    safe_version = "".join(c if c.isalnum() or c in "._-" else "_" for c in str(version))
+    return os.path.join(onto_cache_dir, f"mds_onto_{safe_version}{_SNAPSHOT_SUFFIX}")
+
+
+def _load_snapshot(onto_cache_dir, version):
+    path = _snapshot_path(onto_cache_dir, version)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"Cached MDS-Onto snapshot {path} could not be read - {e}")
+        return None
+
+
+def _save_snapshot(onto_cache_dir, graph, version, accept_header, response):
     """
-    Attempts to load the MDS ontology RDF graph by following redirects and 
+    Writes a pre-parsed snapshot of the graph and records its HTTP validators.
+    """
+    try:
+        os.makedirs(onto_cache_dir, exist_ok=True)
+        path = _snapshot_path(onto_cache_dir, version)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        index = _read_cache_index(onto_cache_dir)
+        index["latest"] = str(version)
+        index.setdefault("versions", {})[str(version)] = {
+            "file": os.path.basename(path),
+            "accept": accept_header,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": datetime.now(timezone.utc).isoformat()
+        }
+        _write_cache_index(onto_cache_dir, index)
+    except OSError as e:
+        print(f"Could not write MDS-Onto cache to {onto_cache_dir} - {e}")
+
+
+def list_cached_ontology_versions(cache_dir=None):
+    """
+    Lists the MDS-Onto versions that are available as local snapshots.
+
+    Args:
+        cache_dir (str, optional): Base cache directory. See `get_ontology_cache_dir`.
+
+    Returns:
+        list[str]: Cached `owl:versionInfo` values, sorted alphabetically.
+    """
+    index = _read_cache_index(get_ontology_cache_dir(cache_dir))
+    return sorted(index.get("versions", {}).keys())
+
+
+def load_mds_ontology_graph(cache_dir=None, offline=None, version=None, use_cache=True):
+    """
+    Attempts to load the MDS ontology RDF graph by following redirects and
     using content negotiation to request different RDF serialization formats.
 
     Tries to fetch the ontology in the following formats (in order of preference):
@@ -16,6 +129,25 @@ def load_mds_ontology_graph():
     It also prints the `owl:versionInfo` if available, to indicate the version
     of the ontology that was loaded.
 
+    Every successfully parsed ontology is stored as a pre-parsed snapshot in a local
+    cache, keyed by its `owl:versionInfo`, together with the ETag/Last-Modified
+    headers of the response. On later calls the request is made conditional on those
+    validators, so an unchanged ontology is served from the snapshot after a single
+    `304 Not Modified` round-trip. If the network is unreachable the latest snapshot
+    is used instead.
+
+    Args:
+        cache_dir (str, optional): Base cache directory. Defaults to the
+            FAIRLINKED_CACHE_DIR environment variable or `~/.cache/FAIRLinked`.
+        offline (bool, optional): If True, never touch the network and load from the
+            cache only. Defaults to the FAIRLINKED_OFFLINE environment variable.
+        version (str, optional): Pin a specific `owl:versionInfo`. A cached snapshot of
+            that version is loaded without any network access; otherwise the latest
+            ontology is fetched and only accepted if it matches. Defaults to the
+            FAIRLINKED_MDS_VERSION environment variable.
+        use_cache (bool, optional): If False, bypass the cache entirely (always fetch,
+            never write a snapshot). Defaults to True.
+
     Returns:
         rdflib.Graph:
             The parsed RDF graph of the MDS ontology, or `None` if all attempts fail.
@@ -23,9 +155,36 @@ def load_mds_ontology_graph():
     Raises:
         None explicitly. All exceptions are caught and printed.
     """
-    mds_ontology_url = "https://w3id.org/mds/"
     timeout = 10
 
+    if offline is None:
+        offline = os.environ.get(OFFLINE_ENV, "").strip().lower() in ("1", "true", "yes")
+    if version is None:
+        version = os.environ.get(PINNED_VERSION_ENV) or None
+
+    onto_cache_dir = get_ontology_cache_dir(cache_dir)
+    index = _read_cache_index(onto_cache_dir) if use_cache else {"latest": None, "versions": {}}
+
+    # A pinned version that is already cached never needs the network
+    if use_cache and version is not None:
+        mds_ontology_graph = _load_snapshot(onto_cache_dir, version)
+        if mds_ontology_graph is not None:
+            print(f"Successfully loaded MDS-Onto version: {version} from local cache")
+            return mds_ontology_graph
+
+    latest_version = index.get("latest")
+    latest_entry = index.get("versions", {}).get(latest_version, {}) if latest_version else {}
+
+    if offline:
+        target_version = version if version is not None else latest_version
+        if use_cache and target_version is not None:
+            mds_ontology_graph = _load_snapshot(onto_cache_dir, target_version)
+            if mds_ontology_graph is not None:
+                print(f"Successfully loaded MDS-Onto version: {target_version} from local cache (offline)")
+                return mds_ontology_graph
+        print(f"Offline mode: no cached MDS-Onto snapshot found in {onto_cache_dir}.")
+        return None
+
     headers_list = [
         ("text/turtle", "turtle"),
         ("application/ld+json", "json-ld"),
@@ -34,12 +193,36 @@ def load_mds_ontology_graph():
 
     for accept_header, rdflib_format in headers_list:
         try:
+            request_headers = {"Accept": accept_header}
+            # Conditional revalidation against the snapshot fetched with the same Accept header
+            revalidating = use_cache and latest_entry.get("accept") == accept_header
+            if revalidating:
+                if latest_entry.get("etag"):
+                    request_headers["If-None-Match"] = latest_entry["etag"]
+                if latest_entry.get("last_modified"):
+                    request_headers["If-Modified-Since"] = latest_entry["last_modified"]
+
             response = requests.get(
-                mds_ontology_url,
-                headers={"Accept": accept_header},
+                MDS_ONTOLOGY_URL,
+                headers=request_headers,
                 allow_redirects=True,
                 timeout=timeout
             )
+
+            if response.status_code == 304 and revalidating:
+                mds_ontology_graph = _load_snapshot(onto_cache_dir, latest_version)
+                if mds_ontology_graph is not None and (version is None or version == latest_version):
+                    print(f"Successfully loaded MDS-Onto version: {latest_version} from local cache (not modified)")
+                    return mds_ontology_graph
+                # Snapshot missing or unusable: fetch the full document instead
+                request_headers = {"Accept": accept_header}
+                response = requests.get(
+                    MDS_ONTOLOGY_URL,
+                    headers=request_headers,
+                    allow_redirects=True,
+                    timeout=timeout
+                )
+
             response.raise_for_status()
 
             mds_ontology_graph = Graph()
@@ -50,14 +233,26 @@ def load_mds_ontology_graph():
                 mds_ontology_graph.objects(subject=None, predicate=OWL.versionInfo),
                 "Unknown"
             )
+
+            if version is not None and str(ontology_version) != str(version):
+                print(f"Pinned MDS-Onto version {version} is not cached and the published version is {ontology_version}.")
+                return None
+
+            if use_cache:
+                _save_snapshot(onto_cache_dir, mds_ontology_graph, ontology_version, accept_header, response)
+
             print(f"Successfully loaded MDS-Onto version: {ontology_version} in {rdflib_format} format")
             return mds_ontology_graph
 
         except Exception as e:
             print(f"Attempt to retrieve {rdflib_format} version of MDS-Onto failed - {e}")
 
+    # Network unavailable: fall back to the most recent snapshot
+    if use_cache and version is None and latest_version is not None:
+        mds_ontology_graph = _load_snapshot(onto_cache_dir, latest_version)
+        if mds_ontology_graph is not None:
+            print(f"Successfully loaded MDS-Onto version: {latest_version} from local cache")
+            return mds_ontology_graph
+
     print("All attempts at retrieving MDS-Onto failed.")
     return None
-
-
-
@@ -0,0 +1,125 @@
+import threading
+import time
+from datetime import datetime, timezone
+from FAIRLinked.InterfaceMDS import load_mds_ontology
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Process-wide MDS-Onto graph, loaded on first access and shared by every caller
+_registry_lock = threading.Lock()
+_shared_graph = None
+_loaded = False
+_stats = {
+    "loaded": False,
+    "load_count": 0,
+    "load_seconds": None,
+    "triples": 0,
+    "rss_delta_bytes": None,
+    "loaded_at": None
+}
+
+
+def _current_rss():
+    if psutil is None:
+        return None
+    try:
+        return psutil.Process().memory_info().rss
+    except Exception:
+        return None
+
+
+def get_shared_ontology_graph(reload=False):
+    """
+    Returns the process-wide MDS-Onto graph, loading it on first access.
+
+    The graph is loaded once with `load_mds_ontology_graph()` (so the on-disk cache,
+    offline mode and version pinning environment variables all apply) and the same
+    rdflib Graph object is handed to every caller. Loading is guarded by a lock, so
+    concurrent first accesses from several threads trigger a single load. A failed
+    load is remembered as well; pass `reload=True` to try again.
+
+    Args:
+        reload (bool, optional): Discard the shared graph and load it again.
+            Defaults to False.
+
+    Returns:
+        rdflib.Graph: The shared MDS-Onto graph, or `None` if it could not be loaded.
+    """
+    global _shared_graph, _loaded
+
+    if _loaded and not reload:
+        return _shared_graph
+
+    with _registry_lock:
+        if _loaded and not reload:
+            return _shared_graph
+
+        rss_before = _current_rss()
+        start = time.perf_counter()
+        graph = load_mds_ontology.load_mds_ontology_graph()
+        elapsed = time.perf_counter() - start
+        rss_after = _current_rss()
+
+        _shared_graph = graph
+        _loaded = True
+        _stats["loaded"] = graph is not None
+        _stats["load_count"] += 1
+        _stats["load_seconds"] = round(elapsed, 4)
+        _stats["triples"] = len(graph) if graph is not None else 0
+        _stats["rss_delta_bytes"] = (rss_after - rss_before) if rss_before is not None and rss_after is not None else None
+        _stats["loaded_at"] = datetime.now(timezone.utc).isoformat()
+
+    return _shared_graph
+
+
+def clear_shared_ontology_graph():
+    """
+    Drops the shared MDS-Onto graph so that the next access loads it again.
+    Load statistics other than `load_count` are reset.
+    """
+    global _shared_graph, _loaded
+    with _registry_lock:
+        _shared_graph = None
+        _loaded = False
+        _stats.update({
+            "loaded": False,
+            "load_seconds": None,
+            "triples": 0,
+            "rss_delta_bytes": None,
+            "loaded_at": None
+        })
+
+
+def ontology_registry_stats():
+    """
+    Reports on the shared MDS-Onto graph.
+
+    Returns:
+        dict: With the keys
+            - "loaded": whether a graph is currently held,
+            - "load_count": number of loads performed in this process,
+            - "load_seconds": wall-clock time of the last load,
+            - "triples": number of triples in the shared graph,
+            - "rss_delta_bytes": growth of the process resident memory during the
+              last load (`None` if psutil is not installed),
+            - "loaded_at": UTC timestamp of the last load.
+    """
+    with _registry_lock:
+        return dict(_stats)
+
+
+class SharedOntologyGraph:
+    """
+    Class-attribute descriptor that resolves to the shared MDS-Onto graph.
+
+    Declaring `mds_graph = SharedOntologyGraph()` on a class defers loading the
+    ontology from import time to the first time `mds_graph` is read, and every
+    class declared this way sees the same graph object. The attribute can still be
+    replaced on the class, e.g. with `unittest.mock.patch.object`.
+    """
+
+    def __get__(self, instance, owner=None):
+        return get_shared_ontology_graph()
@@ -4,7 +4,7 @@ from rdflib import Graph, RDFS
 from rdflib.namespace import DCTERMS, DC, SKOS
 from fuzzysearch import find_near_matches
 import FAIRLinked.InterfaceMDS.load_mds_ontology
-from FAIRLinked.InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from FAIRLinked.InterfaceMDS.ontology_registry import get_shared_ontology_graph
 
 
 def extract_subject_details(graph):
@@ -107,7 +107,7 @@ def fuzzy_search_interface():
         print(f"❌ Directory not found: {output_dir}")
         return
 
-    graph = load_mds_ontology_graph()
+    graph = get_shared_ontology_graph()
     df = extract_subject_details(graph)
 
     keywords_input = input("🔍 Enter keywords (comma-separated): ").strip()
@@ -1,5 +1,5 @@
 from rdflib import Graph, RDFS, Namespace
-from FAIRLinked.InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from FAIRLinked.InterfaceMDS.ontology_registry import get_shared_ontology_graph
 from .domain_subdomain_viewer import build_dynamic_dsm
 
 
@@ -26,7 +26,7 @@ def term_search_general(mds_ontology_graph=None, query_term=None, search_types=N
 
     # Load ontology if not passed
     if mds_ontology_graph is None:
-        mds_ontology_graph = load_mds_ontology_graph()
+        mds_ontology_graph = get_shared_ontology_graph()
 
     if not search_types:
         print("No search types specified.")
@@ -144,7 +144,7 @@ def filter_interface(args):
     """
     
     if args.ontology_path == "default":
-        ontology_graph = load_mds_ontology_graph()
+        ontology_graph = get_shared_ontology_graph()
     else:
         ontology_graph = Graph()
         ontology_graph.parse(args.ontology_path)
@@ -1 +1,2 @@
-from .rdf_data_cube_workflow import rdf_data_cube_workflow_start
\ No newline at end of file
+from .rdf_data_cube_workflow import rdf_data_cube_workflow_start
+from .batch_workflow import load_run_spec, run_data_cube_batch, data_cube_batch_interface
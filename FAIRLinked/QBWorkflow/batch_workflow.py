@@ -0,0 +1,280 @@
+import os
+import glob
+import json
+import time
+import traceback
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+from FAIRLinked.QBWorkflow.utility import NAMESPACE_MAP, validate_orcid_format
+from FAIRLinked.QBWorkflow.namespace_parser import parse_excel_to_namespace_map
+from FAIRLinked.QBWorkflow.data_parser import read_excel_template
+from FAIRLinked.QBWorkflow.rdf_transformer import (
+    BUNDLE_FORMATS,
+    DEFAULT_USER_PREFIX,
+    prepare_namespaces,
+    run_rdf_conversion,
+)
+
+# =============================================================================
+#                            CONSTANTS
+# =============================================================================
+
+CONVERSION_MODES = ('entire', 'row-by-row', 'CRADLE')
+BATCH_MANIFEST_FILE = 'data_cube_batch.json'
+
+SPEC_KEYS = {
+    'orcid', 'namespace_excel', 'namespace_map', 'user_prefix', 'dataset_name', 'mode',
+    'id_columns', 'fixed_dimensions', 'output_folder', 'bundle', 'workers', 'streaming', 'jsonld', 'inputs'
+}
+
+
+# =============================================================================
+#                            RUN SPEC
+# =============================================================================
+
+def load_run_spec(spec_path: str) -> dict:
+    """
+    Description:
+        Reads and validates the run spec of a non-interactive RDF Data Cube run.
+        The spec answers everything the interactive workflow prompts for:
+
+            orcid: 0000-0000-0000-0000          # required
+            output_folder: ./out                # required
+            namespace_excel: namespaces.xlsx    # or namespace_map: {prefix: base URI}
+            mode: entire                        # entire | row-by-row | CRADLE
+            dataset_name: MyDataset             # entire mode, default: workbook name
+            id_columns: [ExperimentId]          # naming columns, default: none
+            fixed_dimensions: [...]             # entire mode, default: all dimensions
+            user_prefix: mds
+            bundle: tar                         # row-by-row/CRADLE: tar | zip | nquads
+            workers: 1
+            streaming: false                    # entire mode: write slice by slice
+            jsonld: true                        # entire mode: also write the .jsonld
+            inputs: [data/*.xlsx]               # workbooks, may be given on the command line
+
+    Algorithm:
+        1) Parse the file as JSON (.json) or YAML (anything else; needs PyYAML).
+        2) Reject unknown keys, check required keys, mode, bundle, workers and ORCID.
+        3) Resolve relative paths (namespace_excel, output_folder, inputs) against the
+           spec's folder and fill in defaults.
+
+    Args:
+        spec_path (str): Path to the .yaml/.yml/.json run spec.
+
+    Returns:
+        dict: The spec with every key of SPEC_KEYS present.
+
+    Raises:
+        ValueError if the spec is invalid; ImportError if a YAML spec is given without PyYAML.
+    """
+    with open(spec_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if spec_path.lower().endswith('.json'):
+        spec = json.loads(text)
+    else:
+        if yaml is None:
+            raise ImportError("Reading a YAML run spec requires PyYAML: pip install FAIRLinked[yaml]")
+        spec = yaml.safe_load(text)
+
+    if not isinstance(spec, dict):
+        raise ValueError(f"Run spec {spec_path} must be a mapping of settings.")
+    unknown = sorted(set(spec) - SPEC_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown run spec keys: {unknown}")
+
+    for key in ('orcid', 'output_folder'):
+        if not spec.get(key):
+            raise ValueError(f"Run spec is missing '{key}'.")
+    if not validate_orcid_format(str(spec['orcid'])):
+        raise ValueError(f"Invalid ORCID '{spec['orcid']}'. Expected 0000-0000-0000-0000.")
+    if spec.get('namespace_excel') and spec.get('namespace_map'):
+        raise ValueError("Give either 'namespace_excel' or 'namespace_map', not both.")
+
+    mode = spec.get('mode', 'entire')
+    if mode not in CONVERSION_MODES:
+        raise ValueError(f"Invalid mode '{mode}'. Choose one of {CONVERSION_MODES}.")
+    bundle = spec.get('bundle')
+    if bundle is not None and bundle not in BUNDLE_FORMATS:
+        raise ValueError(f"Invalid bundle '{bundle}'. Choose one of {BUNDLE_FORMATS}.")
+    if bundle is not None and mode == 'entire':
+        raise ValueError("'bundle' only applies to row-by-row and CRADLE mode.")
+    workers = spec.get('workers', 1)
+    if not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    for key in ('streaming', 'jsonld'):
+        if key in spec and not isinstance(spec[key], bool):
+            raise ValueError(f"'{key}' must be true or false.")
+    if mode != 'entire' and (spec.get('streaming') or spec.get('jsonld') is False):
+        raise ValueError("'streaming' and 'jsonld' only apply to entire mode.")
+
+    for key in ('id_columns', 'fixed_dimensions', 'inputs'):
+        value = spec.get(key)
+        if value is not None and (not isinstance(value, list) or not all(isinstance(v, str) for v in value)):
+            raise ValueError(f"'{key}' must be a list of strings.")
+
+    base_dir = os.path.dirname(os.path.abspath(spec_path))
+    resolve = lambda path: os.path.join(base_dir, os.path.expanduser(path))
+
+    return {
+        'orcid': str(spec['orcid']),
+        'namespace_excel': resolve(spec['namespace_excel']) if spec.get('namespace_excel') else None,
+        'namespace_map': spec.get('namespace_map'),
+        'user_prefix': spec.get('user_prefix', DEFAULT_USER_PREFIX),
+        'dataset_name': spec.get('dataset_name'),
+        'mode': mode,
+        'id_columns': spec.get('id_columns') or [],
+        'fixed_dimensions': spec.get('fixed_dimensions'),
+        'output_folder': resolve(spec['output_folder']),
+        'bundle': bundle,
+        'workers': workers,
+        'streaming': spec.get('streaming', False),
+        'jsonld': spec.get('jsonld', True),
+        'inputs': [resolve(path) for path in spec.get('inputs') or []],
+    }
+
+
+def load_spec_namespaces(spec: dict) -> dict:
+    """
+    Description:
+        Builds the namespace map of a run once, for all of its workbooks: the default
+        NAMESPACE_MAP updated from the spec's namespace Excel or inline map, then
+        validated and turned into rdflib.Namespace objects by prepare_namespaces.
+
+    Args:
+        spec (dict): A run spec from load_run_spec.
+
+    Returns:
+        dict: prefix => rdflib.Namespace.
+    """
+    if spec['namespace_excel']:
+        if not os.path.isfile(spec['namespace_excel']):
+            raise ValueError(f"Namespace Excel file not found: {spec['namespace_excel']}")
+        namespace_map = parse_excel_to_namespace_map(spec['namespace_excel'])
+    else:
+        namespace_map = NAMESPACE_MAP.copy()
+        for prefix, uri in (spec['namespace_map'] or {}).items():
+            namespace_map[str(prefix).strip().lower()] = str(uri).strip()
+    return prepare_namespaces(namespace_map, spec['user_prefix'])
+
+
+def expand_inputs(patterns: list) -> list:
+    """
+    Expands glob patterns (for shells that do not) into a sorted, de-duplicated list
+    of workbook paths. Paths without wildcards are kept as given.
+    """
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(m for m in matches if m not in paths)
+    return paths
+
+
+# =============================================================================
+#                            BATCH RUN
+# =============================================================================
+
+def _workbook_folder(output_folder: str, input_path: str, used: set) -> str:
+    # One folder per workbook, so that runs finishing within the same second
+    # (create_root_folder names folders by the second) never share a folder
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    name, n = stem, 1
+    while name in used:
+        n += 1
+        name = f"{stem}_{n}"
+    used.add(name)
+    return os.path.join(output_folder, name)
+
+
+def run_data_cube_batch(spec: dict, inputs: list = None) -> list:
+    """
+    Description:
+        Converts many data workbooks to RDF Data Cube in one process, without prompts.
+        The namespace map is parsed and validated once and shared by all workbooks.
+        A failing workbook is reported and the batch moves on to the next one.
+
+    Algorithm:
+        1) Expand the inputs (argument, else the spec's 'inputs').
+        2) load_spec_namespaces => shared namespace map.
+        3) For each workbook:
+             a) read_excel_template => variable_metadata + DataFrame
+             b) run_rdf_conversion into output_folder/{workbook name}/Output_{orcid}_{timestamp}
+             c) record status, rows, output folder, seconds and error.
+        4) Write 'data_cube_batch.json' (the records) to the output folder and print a summary.
+
+    Args:
+        spec (dict): A run spec from load_run_spec.
+        inputs (list or None): Workbook paths or glob patterns; overrides the spec's 'inputs'.
+
+    Returns:
+        list: One record (dict) per workbook, as written to the batch manifest.
+    """
+    paths = expand_inputs(inputs if inputs else spec['inputs'])
+    if not paths:
+        raise ValueError("No input workbooks given.")
+
+    ns_map = load_spec_namespaces(spec)
+    os.makedirs(spec['output_folder'], exist_ok=True)
+
+    results = []
+    used_folders = set()
+    for index, path in enumerate(paths, start=1):
+        print(f"\n📘 [{index}/{len(paths)}] {path}")
+        record = {'input': os.path.abspath(path), 'status': 'failed', 'rows': None,
+                  'output': None, 'seconds': None, 'error': None}
+        start = time.perf_counter()
+        try:
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"Input workbook not found: {path}")
+            variable_metadata, df = read_excel_template(path)
+            record['rows'] = len(df)
+
+            dataset_name = spec['dataset_name'] or os.path.splitext(os.path.basename(path))[0]
+            record['output'] = run_rdf_conversion(
+                df=df,
+                variable_metadata=variable_metadata,
+                namespace_map=ns_map,
+                user_chosen_prefix=spec['user_prefix'],
+                output_folder_path=_workbook_folder(spec['output_folder'], path, used_folders),
+                orcid=spec['orcid'],
+                dataset_name=dataset_name,
+                fixed_dimensions=spec['fixed_dimensions'],
+                conversion_mode=spec['mode'],
+                bundle=spec['bundle'],
+                workers=spec['workers'],
+                id_columns=spec['id_columns'],
+                streaming=spec['streaming'],
+                write_jsonld=spec['jsonld'],
+                namespaces_prepared=True
+            )
+            record['status'] = 'ok'
+            print(f"✅ Converted {len(df)} rows. Outputs in: {record['output']}")
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+            print(f"❌ Failed to convert {path}: {e}")
+            traceback.print_exc()
+        record['seconds'] = round(time.perf_counter() - start, 3)
+        results.append(record)
+
+    manifest_path = os.path.join(spec['output_folder'], BATCH_MANIFEST_FILE)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'mode': spec['mode'], 'orcid': spec['orcid'], 'workbooks': results}, f, indent=2)
+
+    converted = sum(record['status'] == 'ok' for record in results)
+    print(f"\n✅ Converted {converted}/{len(results)} workbooks. Batch report: {manifest_path}")
+    return results
+
+
+def data_cube_batch_interface(args):
+    """
+    CLI wrapper for run_data_cube_batch (`FAIRLinked data-cube --spec run.yaml --inputs *.xlsx`).
+    Exits with status 1 if any workbook failed.
+    """
+    spec = load_run_spec(args.spec)
+    results = run_data_cube_batch(spec, args.inputs)
+    if any(record['status'] != 'ok' for record in results):
+        raise SystemExit(1)
@@ -1,8 +1,17 @@
 import os
+import io
+import json
+import time
+import shutil
 import hashlib
+import tarfile
+import zipfile
+from itertools import islice
 import pandas as pd
 from rdflib import Graph, Namespace, URIRef, Literal, BNode
 from rdflib.namespace import RDF, XSD, DCTERMS
+from rdflib.plugins.serializers.jsonld import Converter
+from rdflib.plugins.shared.jsonld.context import Context
 from datetime import datetime
 import re
 import traceback
@@ -15,8 +24,15 @@ except ImportError:
     # If QB is not available in your environment:
     QB = Namespace('http://purl.org/linked-data/cube#')
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rdflib.namespace import SKOS
 from FAIRLinked.QBWorkflow.input_handler import get_approved_id_columns, get_identifiers,  get_row_identifier_columns
+from FAIRLinked.RDFTableConversion.records import iter_records
+from FAIRLinked.RDFTableConversion.parallel import run_ordered
 
 # =============================================================================
 #                            CONSTANTS
@@ -141,7 +157,9 @@ def write_naming_conventions_doc(root_folder_path: str,
                                  conversion_mode: str,
                                  orcid: str,
                                  overall_timestamp: str,
-                                 dataset_name: str) -> None:
+                                 dataset_name: str,
+                                 bundle: str = None,
+                                 write_jsonld: bool = True) -> None:
     """
     Description:
         Writes a text file (naming_conventions_{orcidDigits}_{timestamp}.txt) describing
@@ -160,6 +178,9 @@ def write_naming_conventions_doc(root_folder_path: str,
         orcid (str): The user's ORCID (for numeric extraction).
         overall_timestamp (str): The run-specific timestamp used for naming outputs.
         dataset_name (str): The sanitized dataset name to reference in the doc.
+        bundle (str or None): If row outputs were bundled ('tar', 'zip' or 'nquads'),
+            a note on where to find them is appended.
+        write_jsonld (bool): 'entire' mode => False if only the .ttl was written (and hashed).
 
     Returns:
         None
@@ -184,6 +205,11 @@ def write_naming_conventions_doc(root_folder_path: str,
             f"  {dataset_name}_{numeric_orcid}_{overall_timestamp}.jsonld.sha256\n\n"
             "Where {anyApprovedIDs} are user-approved ID columns (e.g. 'ExperimentId').\n"
         )
+        if not write_jsonld:
+            msg += (
+                "\nNo .jsonld file was written: the .ttl file is hashed instead, in\n"
+                f"  {dataset_name}_{numeric_orcid}_{overall_timestamp}.ttl.sha256\n"
+            )
     elif conversion_mode == "row-by-row":
         # row-by-row mode => each row => separate DataSet
         msg = (
@@ -216,6 +242,19 @@ def write_naming_conventions_doc(root_folder_path: str,
             "Where {enteredIDs} are additional top level concept IDs and {anyApprovedIDs} are user-approved ID columns, e.g. 'ExperimentId'.\n"
         )
 
+    if bundle in ('tar', 'zip'):
+        msg += (
+            f"\nAll row outputs are bundled in {BUNDLE_FILE_NAMES[bundle]}, with members\n"
+            "'ttl/...', 'jsonld/...' and 'hash/...' named as above, and hashed in "
+            f"{BUNDLE_FILE_NAMES[bundle]}.sha256.\n"
+        )
+    elif bundle == 'nquads':
+        msg += (
+            f"\nAll rows are written to {BUNDLE_FILE_NAMES[bundle]} (N-Quads) instead of TTL/JSON-LD files,\n"
+            "one named graph per row, named after the row's qb:DataSet (CRADLE: after the row's file name).\n"
+            f"The file is hashed in {BUNDLE_FILE_NAMES[bundle]}.sha256.\n"
+        )
+
     with open(txt_path, 'w', encoding='utf-8') as f:
         f.write(msg)
 
@@ -407,6 +446,28 @@ def extract_variables(variable_metadata: dict, df_columns: list) -> tuple:
     return dimensions, measures
 
 
+def check_id_columns(df: pd.DataFrame, id_columns: list) -> list:
+    """
+    Description:
+        Validates ID columns chosen without prompting (e.g. from a run spec), the
+        non-interactive counterpart of get_approved_id_columns / get_row_identifier_columns.
+
+    Args:
+        df (pd.DataFrame): The DataFrame being converted.
+        id_columns (list): Column names to use in naming, in naming order.
+
+    Returns:
+        list: The ID columns, as a new list.
+
+    Raises:
+        ValueError if a column is not in the DataFrame.
+    """
+    missing = [col for col in id_columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"ID columns not found in the data: {missing}")
+    return list(id_columns)
+
+
 def process_unit(unit_str: str, ns_map: dict, user_ns: Namespace) -> URIRef:
     """
     Description:
@@ -494,6 +555,15 @@ def add_component_to_dsd(dsd_graph: Graph,
     dsd_graph.add((prop_uri, RDF.type, prop_type))
 
 
+def _bind_namespaces(graph: Graph, ns_map: dict) -> None:
+    """
+    Binds every prefix of ns_map, plus 'skos', on graph.
+    """
+    for prefix, ns_obj in ns_map.items():
+        graph.bind(prefix, ns_obj)
+    graph.bind('skos', SKOS)
+
+
 def create_dsd(variable_metadata: dict,
                dimensions: list,
                measures: list,
@@ -527,9 +597,7 @@ def create_dsd(variable_metadata: dict,
             dsd_uri: The URIRef for the qb:DataStructureDefinition.
     """
     dsd_graph = Graph()
-    for prefix, ns_obj in ns_map.items():
-        dsd_graph.bind(prefix, ns_obj)
-    dsd_graph.bind('skos', SKOS)
+    _bind_namespaces(dsd_graph, ns_map)
 
     dsd_uri = user_ns["DataStructureDefinition"]
     dsd_graph.add((dsd_uri, RDF.type, QB.DataStructureDefinition))
@@ -588,13 +656,14 @@ def create_dsd(variable_metadata: dict,
 
 
 def create_observation(dataset_graph: Graph,
-                       row: pd.Series,
+                       row: dict,
                        variable_metadata: dict,
                        variable_dimensions: list,
                        measures: list,
                        ns_map: dict,
                        user_ns: Namespace,
-                       observation_counter: int) -> tuple:
+                       observation_counter: int,
+                       property_uris: dict = None) -> tuple:
     """
     Description:
         For each measure in 'measures', if the row has a non-null value, create a qb:Observation
@@ -612,13 +681,15 @@ def create_observation(dataset_graph: Graph,
 
     Args:
         dataset_graph (Graph): The graph where we store Observations and data.
-        row (pd.Series): A single row from the DataFrame.
+        row (dict): A single row from the DataFrame, as yielded by `iter_records`.
         variable_metadata (dict): column => metadata.
         variable_dimensions (list): the subset of dimensions that vary in this context.
         measures (list): measure column names.
         ns_map (dict): prefix => Namespace.
         user_ns (Namespace): the user-chosen prefix's Namespace object.
         observation_counter (int): the current global counter for numbering Observations.
+        property_uris (dict or None): column => property URI, precomputed with get_property_uri.
+            Columns missing from it are resolved on the fly.
 
     Returns:
         (list_of_obs_uris, updated_counter):
@@ -626,13 +697,15 @@ def create_observation(dataset_graph: Graph,
     """
     sdmx_attr = ns_map.get('sdmx-attribute')
     not_found_uri = user_ns['NotFound']
+    if property_uris is None:
+        property_uris = {}
 
     observations = []
     for measure_name in measures:
         measure_value = row.get(measure_name)
         if pd.notnull(measure_value):
             meta = variable_metadata[measure_name]
-            measure_prop = get_property_uri(measure_name, meta, ns_map, user_ns)
+            measure_prop = property_uris.get(measure_name) or get_property_uri(measure_name, meta, ns_map, user_ns)
             obs_uri = user_ns[f"observation_{observation_counter}"]
             observation_counter += 1
 
@@ -649,8 +722,7 @@ def create_observation(dataset_graph: Graph,
             # dimension values
             for dim_name in variable_dimensions:
                 dim_val = row.get(dim_name)
-                dim_meta = variable_metadata[dim_name]
-                dim_prop = get_property_uri(dim_name, dim_meta, ns_map, user_ns)
+                dim_prop = property_uris.get(dim_name) or get_property_uri(dim_name, variable_metadata[dim_name], ns_map, user_ns)
                 if pd.notnull(dim_val):
                     dataset_graph.add((obs_uri, dim_prop, Literal(dim_val)))
                 else:
@@ -668,7 +740,7 @@ def create_observation(dataset_graph: Graph,
     return observations, observation_counter
 
 
-def create_observation_2(row: pd.Series,
+def create_observation_2(row: dict,
                        variable_metadata: dict,
                        ns_map: dict,
                        user_ns: Namespace,
@@ -715,6 +787,273 @@ def create_observation_2(row: pd.Series,
 
 
 
+# =============================================================================
+#          SHARED DSD FOR ROW-BY-ROW OUTPUT
+# =============================================================================
+
+def _split_turtle(text: str) -> tuple:
+    """
+    Splits rdflib Turtle output into its '@prefix' lines and the statements that follow them.
+    """
+    if not text.startswith("@prefix"):
+        return [], text.lstrip("\n")
+    header, _, body = text.partition("\n\n")
+    return header.splitlines(), body
+
+
+def _dump_jsonld(obj) -> bytes:
+    """
+    Encodes a JSON-LD document the way rdflib's 'json-ld' serializer does (2-space indent, sorted keys).
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, separators=(",", ": "), sort_keys=True, ensure_ascii=False).encode("utf-8")
+
+
+def _jsonld_context(namespaces: tuple) -> tuple:
+    """
+    Returns the '@context' data and rdflib Context of the bound (prefix, namespace) pairs,
+    as auto_compact=True builds them.
+    """
+    context_data = {
+        pfx: str(ns) for pfx, ns in namespaces
+        if pfx and str(ns) != "http://www.w3.org/XML/1998/namespace"
+    }
+    return context_data, Context(context_data)
+
+
+def _jsonld_nodes(context: Context, graph: Graph) -> list:
+    """
+    Returns the JSON-LD node objects of a graph, compacted with context.
+    """
+    # Sorted by '@id': rdflib orders nodes by set iteration, which differs between processes
+    nodes = Converter(context, False, False).from_graph(graph)
+    return sorted(nodes, key=lambda node: node.get(context.id_key, ""))
+
+
+class RowGraphFactory:
+    """
+    Description:
+        Creates the per-row graphs of a row-by-row conversion and serializes them together
+        with one shared qb:DataStructureDefinition. The DSD is serialized once (as Turtle
+        statements, JSON-LD nodes and N-Triples) and joined with each row's own triples at
+        write time, instead of being copied into every row graph.
+
+    Algorithm:
+        1) Serialize the DSD graph to Turtle once => keep its '@prefix' lines and statements.
+        2) new_graph() => an empty Graph sharing the DSD graph's namespace bindings
+           (no per-row re-binding).
+        3) to_turtle(row_graph) => merged '@prefix' lines + DSD statements + row statements.
+        4) to_jsonld(row_graph) => one '@graph' with the DSD nodes followed by the row nodes,
+           compacted with the bound prefixes (as auto_compact=True does).
+        5) to_ntriples(row_graph) => DSD lines + row lines (used for N-Quads bundles).
+
+    Args:
+        dsd_graph (Graph): The DSD built by create_dsd, with namespaces already bound.
+            Its subjects must not appear as subjects of the row graphs.
+    """
+
+    def __init__(self, dsd_graph: Graph):
+        self.namespace_manager = dsd_graph.namespace_manager
+        self._dsd_graph = dsd_graph
+        self._dsd_prefixes, self._dsd_turtle = _split_turtle(dsd_graph.serialize(format='turtle'))
+        self._jsonld_key = None
+        self._jsonld_parts = None
+        self._dsd_ntriples = None
+
+    def new_graph(self) -> Graph:
+        """Returns an empty row graph bound to the shared namespaces."""
+        return Graph(namespace_manager=self.namespace_manager)
+
+    def to_turtle(self, row_graph: Graph) -> str:
+        """Returns the Turtle document of the DSD plus row_graph."""
+        row_prefixes, row_turtle = _split_turtle(row_graph.serialize(format='turtle'))
+        prefixes = sorted(set(self._dsd_prefixes).union(row_prefixes))
+        header = "".join(line + "\n" for line in prefixes)
+        return f"{header}\n{self._dsd_turtle}{row_turtle}"
+
+    def to_jsonld(self, row_graph: Graph) -> bytes:
+        """Returns the compacted JSON-LD document of the DSD plus row_graph."""
+        # The context follows the bound prefixes, which grow if Turtle output had to generate one
+        key = tuple(self.namespace_manager.namespaces())
+        if key != self._jsonld_key:
+            context_data, context = _jsonld_context(key)
+            dsd_nodes = _jsonld_nodes(context, self._dsd_graph)
+            self._jsonld_key, self._jsonld_parts = key, (context_data, context, dsd_nodes)
+        context_data, context, dsd_nodes = self._jsonld_parts
+        nodes = dsd_nodes + _jsonld_nodes(context, row_graph)
+        return _dump_jsonld({context.graph_key: nodes, "@context": context_data})
+
+    def to_ntriples(self, row_graph: Graph) -> bytes:
+        """Returns the N-Triples lines of the DSD plus row_graph."""
+        if self._dsd_ntriples is None:
+            self._dsd_ntriples = self._dsd_graph.serialize(format='nt', encoding='utf-8')
+        return self._dsd_ntriples + row_graph.serialize(format='nt', encoding='utf-8')
+
+
+# =============================================================================
+#          ROW OUTPUT WRITER
+# =============================================================================
+
+BUNDLE_FORMATS = ('tar', 'zip', 'nquads')
+BUNDLE_FILE_NAMES = {'tar': 'rows.tar', 'zip': 'rows.zip', 'nquads': 'rows.nq'}
+
+
+class _HashingWriter:
+    """
+    Write-only file wrapper that computes the SHA-256 of everything written through it.
+    It has no tell()/seek(), so tarfile and zipfile treat it as a stream.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data) -> int:
+        self.sha256.update(data)
+        return self.raw.write(data)
+
+    def flush(self) -> None:
+        self.raw.flush()
+
+
+def render_row_outputs(file_name: str, row_graph: Graph, graph_uri: URIRef,
+                       row_graphs: RowGraphFactory = None, nquads: bool = False) -> list:
+    """
+    Description:
+        Serializes one row's outputs into memory, ready for RowOutputWriter.write_rendered.
+
+    Args:
+        file_name (str): Base file name of the row (without extension).
+        row_graph (Graph): The row's triples.
+        graph_uri (URIRef): Name of the row's graph in an N-Quads bundle.
+        row_graphs (RowGraphFactory or None): Factory holding the shared DSD that is
+            written with the row, or None if row_graph is complete on its own.
+        nquads (bool): Render N-Quads lines instead of TTL/JSON-LD/hash files.
+
+    Returns:
+        list: (member_name, bytes) pairs, member_name being 'ttl/{file_name}.ttl',
+              'jsonld/{file_name}.jsonld' and 'hash/{file_name}.jsonld.sha256'
+              (None for N-Quads lines).
+    """
+    if nquads:
+        if row_graphs is not None:
+            lines = row_graphs.to_ntriples(row_graph)
+        else:
+            lines = row_graph.serialize(format='nt', encoding='utf-8')
+        suffix = f" {graph_uri.n3()} .\n".encode('utf-8')
+        return [(None, b"".join(line[:-2] + suffix for line in lines.splitlines() if line))]
+
+    if row_graphs is not None:
+        ttl = row_graphs.to_turtle(row_graph).encode('utf-8')
+        jsonld = row_graphs.to_jsonld(row_graph)
+    else:
+        ttl = row_graph.serialize(format='turtle', encoding='utf-8')
+        jsonld = row_graph.serialize(format='json-ld', auto_compact=True, encoding='utf-8')
+    file_hash = hashlib.sha256(jsonld).hexdigest().encode('ascii')
+    return [
+        (f"ttl/{file_name}.ttl", ttl),
+        (f"jsonld/{file_name}.jsonld", jsonld),
+        (f"hash/{file_name}.jsonld.sha256", file_hash),
+    ]
+
+
+class RowOutputWriter:
+    """
+    Description:
+        Writes the per-row outputs of a row-by-row conversion. Each format is serialized
+        once into memory and written in one go; the JSON-LD SHA-256 is computed from those
+        bytes instead of re-reading the file, and output folders are created once per run.
+
+    Algorithm:
+        1) bundle=None => create 'ttl', 'jsonld', 'hash' subfolders once; each row =>
+           {name}.ttl, {name}.jsonld, {name}.jsonld.sha256 (the original layout).
+        2) bundle='tar' or 'zip' => the same three files per row, as members
+           'ttl/...', 'jsonld/...', 'hash/...' of a single rows.tar / rows.zip.
+        3) bundle='nquads' => a single rows.nq, one named graph per row (no Turtle/JSON-LD).
+        4) Bundles are hashed while they are written => rows.*.sha256 on close().
+
+    Args:
+        root_folder_path (str): The run's output folder.
+        bundle (str or None): None, 'tar', 'zip' or 'nquads'.
+
+    Raises:
+        ValueError if bundle is not one of BUNDLE_FORMATS.
+    """
+
+    def __init__(self, root_folder_path: str, bundle: str = None):
+        if bundle is not None and bundle not in BUNDLE_FORMATS:
+            raise ValueError(f"Invalid bundle '{bundle}'. Choose one of {', '.join(BUNDLE_FORMATS)} or None.")
+        self.bundle = bundle
+        self.root_folder_path = root_folder_path
+        self.subfolders = None
+        self.bundle_path = None
+        self._file = None
+        self._stream = None
+        self._archive = None
+
+        if bundle is None:
+            self.subfolders = create_subfolders(root_folder_path)
+            return
+
+        self.bundle_path = os.path.join(root_folder_path, BUNDLE_FILE_NAMES[bundle])
+        self._file = open(self.bundle_path, 'wb')
+        self._stream = _HashingWriter(self._file)
+        if bundle == 'tar':
+            self._archive = tarfile.open(fileobj=self._stream, mode='w|')
+        elif bundle == 'zip':
+            self._archive = zipfile.ZipFile(self._stream, mode='w', compression=zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _add_member(self, member_name: str, data: bytes) -> None:
+        if self.bundle == 'tar':
+            info = tarfile.TarInfo(member_name)
+            info.size = len(data)
+            info.mtime = int(time.time())
+            self._archive.addfile(info, io.BytesIO(data))
+        else:
+            info = zipfile.ZipInfo(member_name, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            self._archive.writestr(info, data)
+
+    def write_row(self, file_name: str, row_graph: Graph, graph_uri: URIRef,
+                  row_graphs: RowGraphFactory = None) -> None:
+        """
+        Writes one row's outputs (see render_row_outputs for the arguments).
+        """
+        self.write_rendered(render_row_outputs(file_name, row_graph, graph_uri, row_graphs,
+                                               nquads=self.bundle == 'nquads'))
+
+    def write_rendered(self, rendered: list) -> None:
+        """
+        Writes one row's outputs as returned by render_row_outputs.
+        """
+        for member_name, data in rendered:
+            if self.bundle == 'nquads':
+                self._stream.write(data)
+            elif self.bundle is None:
+                with open(os.path.join(self.root_folder_path, *member_name.split('/')), 'wb') as f:
+                    f.write(data)
+            else:
+                self._add_member(member_name, data)
+
+    def close(self) -> None:
+        """Finishes the bundle (if any) and writes its .sha256 next to it."""
+        if self._file is None:
+            return
+        if self._archive is not None:
+            self._archive.close()
+        self._file.close()
+        with open(self.bundle_path + ".sha256", 'w') as hf:
+            hf.write(self._stream.sha256.hexdigest())
+        self._file = None
+
+
 # =============================================================================
 #          ROW-BY-ROW CONVERSION
 # =============================================================================
@@ -726,7 +1065,11 @@ def convert_row_by_row(
     user_chosen_prefix: str,
     orcid: str,
     root_folder_path: str,
-    overall_timestamp: str
+    overall_timestamp: str,
+    bundle: str = None,
+    workers: int = 1,
+    chunk_size: int = None,
+    id_columns: list = None
 ):
     """
     Description:
@@ -735,15 +1078,16 @@ def convert_row_by_row(
         the same folder timestamp to keep them grouped.
 
     Algorithm:
-        1) Identify candidate ID columns (contain 'id'), pass 'row-by-row' to get_approved_id_columns(...).
+        1) Identify candidate ID columns (contain 'id'), pass 'row-by-row' to get_approved_id_columns(...),
+           unless id_columns is given. This prompt runs here, before any worker process is started.
         2) Extract which columns are dimensions vs. measures => create a single DSD for entire DF.
-        3) For each row => build a new Graph that:
-            - Copies the DSD
+        3) For each row => build a new Graph (RowGraphFactory) that:
             - Creates a new qb:DataSet => mds:Dataset_{someIDs}_{orcid}_{timestamp}
             - Creates a SliceKey => mds:SliceKey_{someIDs}_{orcid}_{timestamp}
             - Creates a Slice => mds:Slice_{someIDs}_{orcid}_{timestamp}
             - Adds Observations for each measure
-        4) Write each row's TTL/JSON-LD + .sha256 hash in subfolders.
+        4) Write each row's TTL/JSON-LD (the DSD, serialized once, followed by the row's
+           triples) + .sha256 hash in subfolders, or into a bundle (RowOutputWriter).
 
     Args:
         df (pd.DataFrame): The entire DataFrame to convert row-by-row.
@@ -753,14 +1097,23 @@ def convert_row_by_row(
         orcid (str): The user's ORCID, from which we extract digits.
         root_folder_path (str): The top-level folder for outputs.
         overall_timestamp (str): The run's global timestamp for consistent naming.
+        bundle (str or None): None => per-row files in subfolders; 'tar', 'zip' or 'nquads'
+            => a single bundle file (see RowOutputWriter).
+        workers (int): Number of worker processes. With more than one, rows are built and
+            written in parallel (see write_rows_parallel); the files are the same as with one.
+        chunk_size (int or None): Rows sent to a worker at a time (default: about 4 chunks per worker).
+        id_columns (list or None): ID columns to use in naming. None => prompt the user.
 
     Returns:
         None
     """
     user_ns = ns_map[user_chosen_prefix]
 
-    candidate_id_cols = [c for c in df.columns if re.search(r'id', c, re.IGNORECASE)]
-    approved_id_cols = get_approved_id_columns(candidate_id_cols, mode='row-by-row')
+    if id_columns is None:
+        candidate_id_cols = [c for c in df.columns if re.search(r'id', c, re.IGNORECASE)]
+        approved_id_cols = get_approved_id_columns(candidate_id_cols, mode='row-by-row')
+    else:
+        approved_id_cols = check_id_columns(df, id_columns)
 
     # Build a single DSD for entire DF
     dimensions, measures = extract_variables(variable_metadata, df.columns)
@@ -769,97 +1122,112 @@ def convert_row_by_row(
 
     dsd_graph, dsd_uri = create_dsd(variable_metadata, dimensions, measures, ns_map, user_ns)
 
-    # For each row => new dataset
-    for idx, row in df.iterrows():
-        # naming: from approved ID columns
-        name_parts_file = []
-        name_parts_iri = []
-        for col in approved_id_cols:
-            val = row[col] if pd.notnull(row[col]) else "NotFound"
-            name_parts_file.append(_sanitize_for_filename(str(val)))
-            name_parts_iri.append(_sanitize_for_iri(str(val)))
+    # Resolved once per column rather than once per row
+    property_uris = {
+        var_name: get_property_uri(var_name, variable_metadata[var_name], ns_map, user_ns)
+        for var_name in dimensions + measures
+    }
+
+    # Everything the rows share; sent once to each worker in parallel mode
+    job = {
+        "mode": "row-by-row",
+        "variable_metadata": variable_metadata,
+        "ns_map": ns_map,
+        "user_chosen_prefix": user_chosen_prefix,
+        "orcid": orcid,
+        "overall_timestamp": overall_timestamp,
+        "approved_id_cols": approved_id_cols,
+        "dsd_triples": list(dsd_graph),
+        "dsd_uri": dsd_uri,
+        "measures": measures,
+        "property_uris": property_uris,
+        "fixed_dimensions": [(dim_name, property_uris[dim_name]) for dim_name in dimensions],
+    }
+    rows = (row for _, row in iter_records(df))
+    write_rows(job, rows, len(df), root_folder_path, bundle, workers, chunk_size)
+
+
+def _build_row_by_row_graph(job: dict, row_graphs: RowGraphFactory, row: dict) -> tuple:
+    """
+    Description:
+        Builds the graph of one row in row-by-row mode (without the DSD, which the
+        RowGraphFactory adds when the row is written).
 
-        numeric_orcid = ''.join(re.findall(r'\d+', orcid))
+    Returns:
+        (str, Graph, URIRef): The row's file name, its graph and its qb:DataSet URI.
+    """
+    user_ns = job["ns_map"][job["user_chosen_prefix"]]
+    orcid = job["orcid"]
+    overall_timestamp = job["overall_timestamp"]
+    numeric_orcid = ''.join(re.findall(r'\d+', orcid))
+    not_found_uri = user_ns['NotFound']
 
-        # fallback => orcid + timestamp
-        if any(name_parts_file):
-            combined_file = "_".join(name_parts_file + [numeric_orcid, overall_timestamp])
-        else:
-            combined_file = f"{numeric_orcid}_{overall_timestamp}"
-        combined_file = _sanitize_for_filename(combined_file)
+    # naming: from approved ID columns
+    name_parts_file = []
+    name_parts_iri = []
+    for col in job["approved_id_cols"]:
+        val = row[col] if pd.notnull(row[col]) else "NotFound"
+        name_parts_file.append(_sanitize_for_filename(str(val)))
+        name_parts_iri.append(_sanitize_for_iri(str(val)))
+
+    # fallback => orcid + timestamp
+    if any(name_parts_file):
+        combined_file = "_".join(name_parts_file + [numeric_orcid, overall_timestamp])
+    else:
+        combined_file = f"{numeric_orcid}_{overall_timestamp}"
+    combined_file = _sanitize_for_filename(combined_file)
 
-        if any(name_parts_iri):
-            combined_iri = "_".join(name_parts_iri + [numeric_orcid, overall_timestamp])
+    if any(name_parts_iri):
+        combined_iri = "_".join(name_parts_iri + [numeric_orcid, overall_timestamp])
+    else:
+        combined_iri = f"{numeric_orcid}_{overall_timestamp}"
+    combined_iri = _sanitize_for_iri(combined_iri)
+
+    dataset_id_str = _sanitize_for_iri(f"Dataset_{combined_iri}")
+    slice_id_str = _sanitize_for_iri(f"Slice_{combined_iri}")
+    slice_key_id = _sanitize_for_iri(f"SliceKey_{combined_iri}")
+
+    dataset_uri = user_ns[dataset_id_str]
+    slice_uri = user_ns[slice_id_str]
+    slice_key_uri = user_ns[slice_key_id]
+
+    # Row graph without the DSD: it is joined in when the row is written
+    row_graph = row_graphs.new_graph()
+
+    # qb:DataSet
+    row_graph.add((dataset_uri, RDF.type, QB.DataSet))
+    row_graph.add((dataset_uri, QB.structure, job["dsd_uri"]))
+    row_graph.add((dataset_uri, DCTERMS.title, Literal(dataset_id_str)))
+    row_graph.add((dataset_uri, DCTERMS.creator, Literal(orcid)))
+
+    # Single SliceKey for these dimensions
+    row_graph.add((slice_key_uri, RDF.type, QB.SliceKey))
+    for dim_name, dim_prop in job["fixed_dimensions"]:
+        row_graph.add((slice_key_uri, QB.componentProperty, dim_prop))
+
+    # Single Slice
+    row_graph.add((slice_uri, RDF.type, QB.Slice))
+    row_graph.add((slice_uri, QB.sliceStructure, slice_key_uri))
+    row_graph.add((dataset_uri, QB.slice, slice_uri))
+
+    for dim_name, dim_prop in job["fixed_dimensions"]:
+        dim_val = row.get(dim_name)
+        if pd.notnull(dim_val):
+            row_graph.add((slice_uri, dim_prop, Literal(dim_val)))
         else:
-            combined_iri = f"{numeric_orcid}_{overall_timestamp}"
-        combined_iri = _sanitize_for_iri(combined_iri)
-
-        dataset_id_str = _sanitize_for_iri(f"Dataset_{combined_iri}")
-        slice_id_str = _sanitize_for_iri(f"Slice_{combined_iri}")
-        slice_key_id = _sanitize_for_iri(f"SliceKey_{combined_iri}")
-
-        dataset_uri = user_ns[dataset_id_str]
-        slice_uri = user_ns[slice_id_str]
-        slice_key_uri = user_ns[slice_key_id]
-
-        # Copy the DSD graph into a fresh row_graph
-        row_graph = dsd_graph.__class__()
-        for prefix, ns_obj in ns_map.items():
-            row_graph.bind(prefix, ns_obj)
-        row_graph.bind('skos', SKOS)
-        for triple in dsd_graph:
-            row_graph.add(triple)
-
-        # qb:DataSet
-        row_graph.add((dataset_uri, RDF.type, QB.DataSet))
-        row_graph.add((dataset_uri, QB.structure, dsd_uri))
-        row_graph.add((dataset_uri, DCTERMS.title, Literal(dataset_id_str)))
-        row_graph.add((dataset_uri, DCTERMS.creator, Literal(orcid)))
-
-        # Single SliceKey for these dimensions
-        row_graph.add((slice_key_uri, RDF.type, QB.SliceKey))
-        fixed_dimensions = dimensions
-        for dim_name in fixed_dimensions:
-            dim_prop = get_property_uri(dim_name, variable_metadata[dim_name], ns_map, user_ns)
-            row_graph.add((slice_key_uri, QB.componentProperty, dim_prop))
+            row_graph.add((slice_uri, dim_prop, not_found_uri))
 
-        # Single Slice
-        row_graph.add((slice_uri, RDF.type, QB.Slice))
-        row_graph.add((slice_uri, QB.sliceStructure, slice_key_uri))
-        row_graph.add((dataset_uri, QB.slice, slice_uri))
+    # Observations
+    obs_counter = 1
+    variable_dims = []
+    observations, obs_counter = create_observation(
+        row_graph, row, job["variable_metadata"], variable_dims, job["measures"], job["ns_map"], user_ns,
+        obs_counter, property_uris=job["property_uris"]
+    )
+    for obs_uri in observations:
+        row_graph.add((slice_uri, QB.observation, obs_uri))
 
-        not_found_uri = user_ns['NotFound']
-        for dim_name in fixed_dimensions:
-            dim_val = row.get(dim_name)
-            dim_meta = variable_metadata[dim_name]
-            dim_prop = get_property_uri(dim_name, dim_meta, ns_map, user_ns)
-            if pd.notnull(dim_val):
-                row_graph.add((slice_uri, dim_prop, Literal(dim_val)))
-            else:
-                row_graph.add((slice_uri, dim_prop, not_found_uri))
-
-        # Observations
-        obs_counter = 1
-        variable_dims = []
-        observations, obs_counter = create_observation(
-            row_graph, row, variable_metadata, variable_dims, measures, ns_map, user_ns, obs_counter
-        )
-        for obs_uri in observations:
-            row_graph.add((slice_uri, QB.observation, obs_uri))
-
-        # Write to subfolders
-        subfolders = create_subfolders(root_folder_path)
-        ttl_path = os.path.join(subfolders["ttl"], f"{combined_file}.ttl")
-        jsonld_path = os.path.join(subfolders["jsonld"], f"{combined_file}.jsonld")
-        hash_path = os.path.join(subfolders["hash"], f"{combined_file}.jsonld.sha256")
-
-        row_graph.serialize(destination=ttl_path, format='turtle')
-        row_graph.serialize(destination=jsonld_path, format='json-ld', auto_compact=True)
-
-        # compute hash
-        file_hash = compute_file_hash(jsonld_path)
-        with open(hash_path, 'w') as hf:
-            hf.write(file_hash)
+    return combined_file, row_graph, dataset_uri
 
 # =============================================================================
 #          ROW-BY-ROW FOR CRADLE
@@ -872,7 +1240,11 @@ def convert_row_by_row_CRADLE(
     user_chosen_prefix: str,
     orcid: str,
     root_folder_path: str,
-    overall_timestamp: str
+    overall_timestamp: str,
+    bundle: str = None,
+    workers: int = 1,
+    chunk_size: int = None,
+    id_columns: list = None
 ):
     """
     Description:
@@ -881,7 +1253,8 @@ def convert_row_by_row_CRADLE(
         the same folder timestamp to keep them grouped.
 
     Algorithm:
-        1) Identify candidate ID columns (contain 'id'), pass 'row-by-row' to get_approved_id_columns(...).
+        1) Ask the user for the ID columns (get_row_identifier_columns), unless id_columns is given.
+           This prompt and the random file-name letters are resolved here, before any worker starts.
         2) Extract which columns are dimensions vs. measures => create a single DSD for entire DF.
         3) For each row => build a new Graph that:
             - Copies the DSD
@@ -889,7 +1262,7 @@ def convert_row_by_row_CRADLE(
             - Creates a SliceKey => mds:SliceKey_{someIDs}_{orcid}_{timestamp}
             - Creates a Slice => mds:Slice_{someIDs}_{orcid}_{timestamp}
             - Adds Observations for each measure
-        4) Write each row's TTL/JSON-LD + .sha256 hash in subfolders.
+        4) Write each row's TTL/JSON-LD + .sha256 hash in subfolders, or into a bundle (RowOutputWriter).
 
     Args:
         df (pd.DataFrame): The entire DataFrame to convert row-by-row.
@@ -899,14 +1272,20 @@ def convert_row_by_row_CRADLE(
         orcid (str): The user's ORCID, from which we extract digits.
         root_folder_path (str): The top-level folder for outputs.
         overall_timestamp (str): The run's global timestamp for consistent naming.
+        bundle (str or None): None => per-row files in subfolders; 'tar', 'zip' or 'nquads'
+            => a single bundle file (see RowOutputWriter).
+        workers (int): Number of worker processes. With more than one, rows are built and
+            written in parallel (see write_rows_parallel); the files are the same as with one.
+        chunk_size (int or None): Rows sent to a worker at a time (default: about 4 chunks per worker).
+        id_columns (list or None): ID columns to use in naming. None => prompt the user.
 
     Returns:
         None
     """
-    user_ns = ns_map[user_chosen_prefix]
-
-
-    approved_id_cols = get_row_identifier_columns(df=df)
+    if id_columns is None:
+        approved_id_cols = get_row_identifier_columns(df=df)
+    else:
+        approved_id_cols = check_id_columns(df, id_columns)
 
     # Build a single DSD for entire DF
     # dimensions, measures = extract_variables(variable_metadata, df.columns)
@@ -915,113 +1294,296 @@ def convert_row_by_row_CRADLE(
 
     # dsd_graph, dsd_uri = create_dsd(variable_metadata, dimensions, measures, ns_map, user_ns)
 
-    # For each row => new dataset
-    for idx, row in df.iterrows():
-        # naming: from approved ID columns
-        name_parts_file = []
-        name_parts_iri = []
-        for col in approved_id_cols:
-            val = row[col] if pd.notnull(row[col]) else "NotFound"
-            name_parts_file.append(_sanitize_for_filename(str(val)))
-            name_parts_iri.append(_sanitize_for_iri(str(val)))
+    job = {
+        "mode": "CRADLE",
+        "variable_metadata": variable_metadata,
+        "ns_map": ns_map,
+        "user_chosen_prefix": user_chosen_prefix,
+        "orcid": orcid,
+        "overall_timestamp": overall_timestamp,
+        "approved_id_cols": approved_id_cols,
+        "dsd_triples": None,
+    }
+    # The letters are drawn here, in row order, so that workers name files as the serial path does
+    rows = ((row, random.choice(string.ascii_lowercase)) for _, row in iter_records(df))
+    write_rows(job, rows, len(df), root_folder_path, bundle, workers, chunk_size)
+
+
+def _build_cradle_graph(job: dict, row: dict, letter: str) -> tuple:
+    """
+    Description:
+        Builds the graph of one row in CRADLE mode.
+
+    Returns:
+        (str, Graph, URIRef): The row's file name, its graph and the graph's identifier.
+    """
+    ns_map = job["ns_map"]
+    user_ns = ns_map[job["user_chosen_prefix"]]
+    orcid = job["orcid"]
+    overall_timestamp = job["overall_timestamp"]
+
+    # naming: from approved ID columns
+    name_parts_file = []
+    for col in job["approved_id_cols"]:
+        val = row[col] if pd.notnull(row[col]) else "NotFound"
+        name_parts_file.append(_sanitize_for_filename(str(val)))
+
+    numeric_orcid = ''.join(re.findall(r'\d+', orcid))
+
+    # fallback => orcid + timestamp
+    if any(name_parts_file):
+        combined_file = "-".join(name_parts_file + [numeric_orcid, overall_timestamp])
+    else:
+        combined_file = f"{numeric_orcid}_{overall_timestamp}"
+    combined_file = letter + "-" + combined_file
+
+    row_graph = create_observation_2(row=row,
+                   variable_metadata=job["variable_metadata"],
+                   ns_map=ns_map,
+                   user_ns=user_ns,
+                   file_name=combined_file)
+
+    return combined_file, row_graph, row_graph.identifier
+
+
+# =============================================================================
+#          WRITING ROWS (SERIAL OR IN WORKER PROCESSES)
+# =============================================================================
+
+def _job_row_graphs(job: dict) -> RowGraphFactory:
+    """
+    Rebuilds the shared DSD of a job (same triples and blank nodes, same prefixes) => RowGraphFactory.
+    None in CRADLE mode, whose row graphs are complete on their own.
+    """
+    if job["dsd_triples"] is None:
+        return None
+    dsd_graph = Graph()
+    _bind_namespaces(dsd_graph, job["ns_map"])
+    for triple in job["dsd_triples"]:
+        dsd_graph.add(triple)
+    return RowGraphFactory(dsd_graph)
+
+
+def _build_row(job: dict, row_graphs: RowGraphFactory, item) -> tuple:
+    if job["mode"] == "CRADLE":
+        return _build_cradle_graph(job, *item)
+    return _build_row_by_row_graph(job, row_graphs, item)
 
-        numeric_orcid = ''.join(re.findall(r'\d+', orcid))
 
-        # fallback => orcid + timestamp
-        if any(name_parts_file):
-            combined_file = "-".join(name_parts_file + [numeric_orcid, overall_timestamp])
+def write_rows(job: dict, rows, n_rows: int, root_folder_path: str, bundle: str = None,
+               workers: int = 1, chunk_size: int = None) -> None:
+    """
+    Description:
+        Builds and writes every row of a row-by-row or CRADLE conversion, in this process
+        or in a pool of worker processes.
+
+    Algorithm:
+        1) workers == 1 => build each row and write it through one RowOutputWriter.
+        2) workers > 1 => write_rows_parallel(...).
+
+    Args:
+        job (dict): What the rows share (naming inputs, metadata, DSD), see convert_row_by_row.
+        rows (iterable): Row dicts (CRADLE: (row, letter) tuples), in row order.
+        n_rows (int): Number of rows, used for the default chunk size.
+        root_folder_path (str): The run's output folder.
+        bundle (str or None): See RowOutputWriter.
+        workers (int): Number of worker processes.
+        chunk_size (int or None): Rows per worker task (default: about 4 tasks per worker).
+
+    Raises:
+        ValueError if workers < 1.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    if workers > 1:
+        if chunk_size is None:
+            chunk_size = max(1, -(-n_rows // (workers * 4)))
+        write_rows_parallel(job, rows, root_folder_path, bundle, workers, chunk_size)
+        return
+
+    row_graphs = _job_row_graphs(job)
+    with RowOutputWriter(root_folder_path, bundle) as writer:
+        for item in rows:
+            file_name, row_graph, graph_uri = _build_row(job, row_graphs, item)
+            # TTL/JSON-LD + hash (or one named graph of the bundle)
+            writer.write_row(file_name, row_graph, graph_uri, row_graphs)
+
+
+_qb_worker = None
+
+
+def _init_qb_worker(job: dict, root_folder_path: str, bundle: str):
+    global _qb_worker
+    writer = RowOutputWriter(root_folder_path) if bundle is None else None
+    _qb_worker = (job, _job_row_graphs(job), writer, bundle == 'nquads')
+
+
+def _write_rows_chunk(items: list) -> list:
+    # Runs in a worker: per-row files are written here, bundle members are sent back
+    # to the parent (which owns the bundle file)
+    job, row_graphs, writer, nquads = _qb_worker
+    rendered = []
+    for item in items:
+        file_name, row_graph, graph_uri = _build_row(job, row_graphs, item)
+        if writer is not None:
+            writer.write_row(file_name, row_graph, graph_uri, row_graphs)
         else:
-            combined_file = f"{numeric_orcid}_{overall_timestamp}"
-        letter = random.choice(string.ascii_lowercase)
-        combined_file = letter + "-" + combined_file
-        
-        row_graph = create_observation_2(row=row,
-                       variable_metadata=variable_metadata,
-                       ns_map=ns_map,
-                       user_ns=user_ns,
-                       file_name=combined_file)
+            rendered.append(render_row_outputs(file_name, row_graph, graph_uri, row_graphs, nquads))
+    return rendered
 
-        
 
-        # if any(name_parts_iri):
-        #     combined_iri = "-".join(name_parts_iri + [numeric_orcid, overall_timestamp])
-        # else:
-        #     combined_iri = f"{numeric_orcid}-{overall_timestamp}"
-        # combined_iri = letter + "-" + combined_iri
-
-        # dataset_id_str = "Dataset" + "-" + combined_iri
-        # slice_id_str = "Slice" + "-" + combined_iri
-        # slice_key_id = "SliceKey" + "-" + combined_iri
-
-        # dataset_uri = user_ns[dataset_id_str]
-        # slice_uri = user_ns[slice_id_str]
-        # slice_key_uri = user_ns[slice_key_id]
-
-        # # Copy the DSD graph into a fresh row_graph
-        # row_graph = dsd_graph.__class__()
-        # for prefix, ns_obj in ns_map.items():
-        #     row_graph.bind(prefix, ns_obj)
-        # row_graph.bind('skos', SKOS)
-        # for triple in dsd_graph:
-        #     row_graph.add(triple)
-
-        # # qb:DataSet
-        # row_graph.add((dataset_uri, RDF.type, QB.DataSet))
-        # row_graph.add((dataset_uri, QB.structure, dsd_uri))
-        # row_graph.add((dataset_uri, DCTERMS.title, Literal(dataset_id_str)))
-        # row_graph.add((dataset_uri, DCTERMS.creator, Literal(orcid)))
-
-        # # Single SliceKey for these dimensions
-        # row_graph.add((slice_key_uri, RDF.type, QB.SliceKey))
-        # fixed_dimensions = dimensions
-        # for dim_name in fixed_dimensions:
-        #     dim_prop = get_property_uri(dim_name, variable_metadata[dim_name], ns_map, user_ns)
-        #     row_graph.add((slice_key_uri, QB.componentProperty, dim_prop))
-
-        # # Single Slice
-        # row_graph.add((slice_uri, RDF.type, QB.Slice))
-        # row_graph.add((slice_uri, QB.sliceStructure, slice_key_uri))
-        # row_graph.add((dataset_uri, QB.slice, slice_uri))
-
-        # not_found_uri = user_ns['NotFound']
-        # for dim_name in fixed_dimensions:
-        #     dim_val = row.get(dim_name)
-        #     dim_meta = variable_metadata[dim_name]
-        #     dim_prop = get_property_uri(dim_name, dim_meta, ns_map, user_ns)
-        #     if pd.notnull(dim_val):
-        #         row_graph.add((slice_uri, dim_prop, Literal(dim_val)))
-        #     else:
-        #         row_graph.add((slice_uri, dim_prop, not_found_uri))
-
-        # # Observations
-        # obs_counter = 1
-        # variable_dims = []
-        # observations, obs_counter = create_observation(
-        #     row_graph, row, variable_metadata, variable_dims, measures, ns_map, user_ns, obs_counter
-        # )
-        # for obs_uri in observations:
-        #     row_graph.add((slice_uri, QB.observation, obs_uri))
-
-        # Write to subfolders
-        subfolders = create_subfolders(root_folder_path)
-        ttl_path = os.path.join(subfolders["ttl"], f"{combined_file}.ttl")
-        jsonld_path = os.path.join(subfolders["jsonld"], f"{combined_file}.jsonld")
-        hash_path = os.path.join(subfolders["hash"], f"{combined_file}.jsonld.sha256")
+def write_rows_parallel(job: dict, rows, root_folder_path: str, bundle: str, workers: int, chunk_size: int) -> None:
+    """
+    Description:
+        Builds and writes rows in a pool of `workers` processes.
 
-        row_graph.serialize(destination=ttl_path, format='turtle')
-        row_graph.serialize(destination=jsonld_path, format='json-ld', auto_compact=True)
+    Algorithm:
+        1) The job (metadata, namespace map, DSD triples) is sent to every worker once.
+        2) Rows are sent in contiguous chunks of `chunk_size`, with at most 2 * workers
+           chunks in flight.
+        3) Without a bundle, workers write their rows' files themselves. With a bundle,
+           they return the rendered rows and the parent appends them to the bundle.
+        4) Chunks are collected in submission order, so the bundle content, printed
+           output and warnings are in row order whatever the scheduling.
 
+    Args:
+        job (dict): See write_rows.
+        rows (iterable): See write_rows.
+        root_folder_path (str): The run's output folder.
+        bundle (str or None): See RowOutputWriter.
+        workers (int): Number of worker processes.
+        chunk_size (int): Rows per worker task.
+    """
+    from concurrent.futures import ProcessPoolExecutor
 
-        # compute hash
-        file_hash = compute_file_hash(jsonld_path)
-        with open(hash_path, 'w') as hf:
-            hf.write(file_hash)
+    rows = iter(rows)
+    chunks = iter(lambda: list(islice(rows, chunk_size)), [])
+    with RowOutputWriter(root_folder_path, bundle) as writer, \
+         ProcessPoolExecutor(max_workers=workers, initializer=_init_qb_worker,
+                             initargs=(job, root_folder_path, bundle)) as pool:
+        for rendered in run_ordered(pool, chunks, _write_rows_chunk, workers):
+            for row_outputs in rendered:
+                writer.write_rendered(row_outputs)
 
 
 # =============================================================================
 #          ENTIRE-DATASET CONVERSION
 # =============================================================================
 
+class StreamingDatasetWriter:
+    """
+    Description:
+        Writes one qb:DataSet to Turtle (and optionally JSON-LD) a block of triples at a
+        time, so that memory stays flat in the number of rows. Used by convert_entire_dataset
+        in streaming mode, with one block per slice.
+
+    Algorithm:
+        1) new_graph() => an empty block graph sharing the header graph's namespace bindings,
+           so every block uses the same prefixes.
+        2) write_block(graph) => appends the block's Turtle statements to '{ttl}.part' and,
+           with JSON-LD, its node objects to '{jsonld}.part'; the block can then be dropped.
+        3) close() => post-pass over the part files: writes the '@prefix' lines of all
+           blocks, the header statements (DSD, qb:DataSet, qb:SliceKey) and the Turtle
+           part; then '@context' + '@graph' (header nodes, streamed nodes) for JSON-LD,
+           hashed while it is written. The part files are removed.
+
+    A subject may appear in several blocks (e.g. the qb:DataSet's qb:slice links, or a
+    slice shared by rows with the same IDs). Turtle and JSON-LD parsers merge them, so the
+    files describe the same graph as the in-memory conversion.
+
+    Args:
+        header_graph (Graph): The triples written once, with namespaces already bound.
+        ttl_path (str): The Turtle file to write.
+        jsonld_path (str or None): The JSON-LD file to write, or None for Turtle only.
+    """
+
+    def __init__(self, header_graph: Graph, ttl_path: str, jsonld_path: str = None):
+        self.namespace_manager = header_graph.namespace_manager
+        self.ttl_path = ttl_path
+        self.jsonld_path = jsonld_path
+        self.jsonld_sha256 = None
+        self._header_graph = header_graph
+        self._prefixes = set()
+        self._jsonld_key = None
+        self._context = None
+        self._nodes_written = 0
+        self._ttl_part = open(ttl_path + ".part", 'w', encoding='utf-8')
+        self._jsonld_part = open(jsonld_path + ".part", 'wb') if jsonld_path else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def new_graph(self) -> Graph:
+        """Returns an empty block graph bound to the shared namespaces."""
+        return Graph(namespace_manager=self.namespace_manager)
+
+    def write_block(self, graph: Graph) -> None:
+        """Appends the triples of graph to the output."""
+        # Turtle first: it may bind a generated prefix that the JSON-LD context then includes
+        prefixes, body = _split_turtle(graph.serialize(format='turtle'))
+        self._prefixes.update(prefixes)
+        self._ttl_part.write(body)
+        if self._jsonld_part is None:
+            return
+        key = tuple(self.namespace_manager.namespaces())
+        if key != self._jsonld_key:
+            self._jsonld_key, (_, self._context) = key, _jsonld_context(key)
+        for node in _jsonld_nodes(self._context, graph):
+            self._jsonld_part.write((b",\n" if self._nodes_written else b"") + self._graph_member(node))
+            self._nodes_written += 1
+
+    @staticmethod
+    def _graph_member(node: dict) -> bytes:
+        # A node object indented as an item of the top-level '@graph' list
+        return b"    " + _dump_jsonld(node).replace(b"\n", b"\n    ")
+
+    def close(self) -> None:
+        """Writes the final Turtle (and JSON-LD) files from the part files."""
+        if self._ttl_part is None:
+            return
+        self._ttl_part.close()
+        header_prefixes, header_body = _split_turtle(self._header_graph.serialize(format='turtle'))
+        prefixes = sorted(self._prefixes.union(header_prefixes))
+        with open(self.ttl_path, 'w', encoding='utf-8') as out, \
+                open(self.ttl_path + ".part", 'r', encoding='utf-8') as part:
+            out.write("".join(line + "\n" for line in prefixes) + "\n" + header_body)
+            shutil.copyfileobj(part, out)
+        os.remove(self.ttl_path + ".part")
+        self._ttl_part = None
+
+        if self._jsonld_part is None:
+            return
+        self._jsonld_part.close()
+        # Every streamed node was compacted with a subset of this final context
+        context_data, context = _jsonld_context(tuple(self.namespace_manager.namespaces()))
+        header_nodes = b",\n".join(self._graph_member(n) for n in _jsonld_nodes(context, self._header_graph))
+        with open(self.jsonld_path, 'wb') as raw, open(self.jsonld_path + ".part", 'rb') as part:
+            out = _HashingWriter(raw)
+            out.write(b'{\n  "@context": ' + _dump_jsonld(context_data).replace(b"\n", b"\n  ")
+                      + b',\n  "@graph": [\n' + header_nodes)
+            if header_nodes and self._nodes_written:
+                out.write(b",\n")
+            shutil.copyfileobj(part, out)
+            out.write(b"\n  ]\n}")
+        os.remove(self.jsonld_path + ".part")
+        self.jsonld_sha256 = out.sha256.hexdigest()
+        self._jsonld_part = None
+
+    def _discard(self) -> None:
+        # Removes the part files of a failed conversion
+        for part, path in ((self._ttl_part, self.ttl_path), (self._jsonld_part, self.jsonld_path)):
+            if part is not None:
+                part.close()
+                os.remove(path + ".part")
+        self._ttl_part = self._jsonld_part = None
+
+
 def convert_entire_dataset(
     df: pd.DataFrame,
     variable_metadata: dict,
@@ -1031,7 +1593,10 @@ def convert_entire_dataset(
     orcid: str,
     output_folder_paths: dict,
     fixed_dimensions: list = None,
-    overall_timestamp: str = None
+    overall_timestamp: str = None,
+    id_columns: list = None,
+    streaming: bool = False,
+    write_jsonld: bool = True
 ):
     """
     Description:
@@ -1040,12 +1605,16 @@ def convert_entire_dataset(
         If user picks ID columns => these become part of the slice's name.
 
     Algorithm:
-        1) Identify columns with 'id'. Prompt user with mode='entire' => get_approved_id_columns(...).
+        1) Identify columns with 'id'. Prompt user with mode='entire' => get_approved_id_columns(...),
+           unless id_columns is given.
         2) Create a DataStructureDefinition for the entire DF => dimensions + measures.
         3) Add a single qb:DataSet => e.g. mds:Dataset_{datasetName}.
         4) Create a single qb:SliceKey referencing dimension properties.
         5) For each row => create qb:Slice => name derived from (someIDs + orcid + timestamp).
         6) Within that slice => create Observations (one per measure).
+           - default: all slices go into one in-memory graph, serialized at the end.
+           - streaming: each slice goes into its own small graph, appended to the output
+             files right away (StreamingDatasetWriter), so memory stays flat in the rows.
         7) Write a single .ttl/.jsonld + .sha256 hash to the respective subfolders.
 
     Args:
@@ -1058,6 +1627,11 @@ def convert_entire_dataset(
         output_folder_paths (dict): subfolders => their paths.
         fixed_dimensions (list or None): optionally specify columns that remain fixed in every slice.
         overall_timestamp (str or None): If provided, used for consistent naming across slices.
+        id_columns (list or None): ID columns to use in slice naming. None => prompt the user.
+        streaming (bool): Write slice by slice instead of building the whole graph in memory.
+            The files hold the same graph; the Turtle repeats the qb:DataSet subject per slice.
+        write_jsonld (bool): Also write the .jsonld file. If False, only the .ttl is written
+            and hashed ({name}.ttl.sha256).
 
     Returns:
         None
@@ -1065,8 +1639,11 @@ def convert_entire_dataset(
     from rdflib import Graph
     user_ns = ns_map[user_chosen_prefix]
 
-    candidate_id_cols = [c for c in df.columns if re.search(r'id', c, re.IGNORECASE)]
-    approved_id_cols = get_approved_id_columns(candidate_id_cols, mode='entire')
+    if id_columns is None:
+        candidate_id_cols = [c for c in df.columns if re.search(r'id', c, re.IGNORECASE)]
+        approved_id_cols = get_approved_id_columns(candidate_id_cols, mode='entire')
+    else:
+        approved_id_cols = check_id_columns(df, id_columns)
 
     safe_iri_name  = _sanitize_for_iri(dataset_name)
     safe_file_name = _sanitize_for_filename(dataset_name)
@@ -1100,19 +1677,24 @@ def convert_entire_dataset(
     if fixed_dimensions is None:
         fixed_dimensions = dimensions
 
+    # Resolved once per column rather than once per row
+    property_uris = {
+        var_name: get_property_uri(var_name, variable_metadata[var_name], ns_map, user_ns)
+        for var_name in dict.fromkeys(dimensions + measures + list(fixed_dimensions))
+    }
+
     for dim_name in fixed_dimensions:
-        dim_prop = get_property_uri(dim_name, variable_metadata[dim_name], ns_map, user_ns)
-        entire_graph.add((global_slice_key_uri, QB.componentProperty, dim_prop))
+        entire_graph.add((global_slice_key_uri, QB.componentProperty, property_uris[dim_name]))
 
     if not overall_timestamp:
         overall_timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
     numeric_orcid = ''.join(re.findall(r'\d+', orcid))
 
-    observation_counter = 1
     not_found_uri = user_ns['NotFound']
+    variable_dimensions = [d for d in dimensions if d not in fixed_dimensions]
 
-    # Build slices for each row
-    for idx, row in df.iterrows():
+    def add_slice(graph: Graph, row: dict, observation_counter: int) -> int:
+        # Adds one row's qb:Slice and its Observations to graph; returns the next counter
         name_parts_for_iri = []
         for col in approved_id_cols:
             val = row[col] if pd.notnull(row[col]) else "NotFound"
@@ -1127,42 +1709,59 @@ def convert_entire_dataset(
         slice_id_str = _sanitize_for_iri(f"Slice_{slice_key_iri}")
         slice_uri = user_ns[slice_id_str]
 
-        entire_graph.add((slice_uri, RDF.type, QB.Slice))
-        entire_graph.add((slice_uri, QB.sliceStructure, global_slice_key_uri))
-        entire_graph.add((dataset_uri, QB.slice, slice_uri))
+        graph.add((slice_uri, RDF.type, QB.Slice))
+        graph.add((slice_uri, QB.sliceStructure, global_slice_key_uri))
+        graph.add((dataset_uri, QB.slice, slice_uri))
 
         for dim_name in fixed_dimensions:
             dim_val = row.get(dim_name)
-            dim_meta = variable_metadata[dim_name]
-            dim_prop = get_property_uri(dim_name, dim_meta, ns_map, user_ns)
+            dim_prop = property_uris[dim_name]
             if pd.notnull(dim_val):
-                entire_graph.add((slice_uri, dim_prop, Literal(dim_val)))
+                graph.add((slice_uri, dim_prop, Literal(dim_val)))
             else:
-                entire_graph.add((slice_uri, dim_prop, not_found_uri))
+                graph.add((slice_uri, dim_prop, not_found_uri))
 
-        variable_dimensions = [d for d in dimensions if d not in fixed_dimensions]
         obs_list, observation_counter = create_observation(
-            entire_graph,
+            graph,
             row,
             variable_metadata,
             variable_dimensions,
             measures,
             ns_map,
             user_ns,
-            observation_counter
+            observation_counter,
+            property_uris=property_uris
         )
         for obs_uri in obs_list:
-            entire_graph.add((slice_uri, QB.observation, obs_uri))
+            graph.add((slice_uri, QB.observation, obs_uri))
+        return observation_counter
 
     # Write out single TTL/JSON-LD + hash
     ttl_path = os.path.join(output_folder_paths["ttl"], f"{safe_file_name}.ttl")
-    jsonld_path = os.path.join(output_folder_paths["jsonld"], f"{safe_file_name}.jsonld")
-    hash_path = os.path.join(output_folder_paths["hash"], f"{safe_file_name}.jsonld.sha256")
+    jsonld_path = os.path.join(output_folder_paths["jsonld"], f"{safe_file_name}.jsonld") if write_jsonld else None
+    if write_jsonld:
+        hash_path = os.path.join(output_folder_paths["hash"], f"{safe_file_name}.jsonld.sha256")
+    else:
+        hash_path = os.path.join(output_folder_paths["hash"], f"{safe_file_name}.ttl.sha256")
 
-    entire_graph.serialize(destination=ttl_path, format='turtle')
-    entire_graph.serialize(destination=jsonld_path, format='json-ld', auto_compact=True)
+    observation_counter = 1
+    if streaming:
+        with StreamingDatasetWriter(entire_graph, ttl_path, jsonld_path) as writer:
+            for idx, row in iter_records(df):
+                slice_graph = writer.new_graph()
+                observation_counter = add_slice(slice_graph, row, observation_counter)
+                writer.write_block(slice_graph)
+        file_hash = writer.jsonld_sha256 if write_jsonld else compute_file_hash(ttl_path)
+    else:
+        # Build slices for each row
+        for idx, row in iter_records(df):
+            observation_counter = add_slice(entire_graph, row, observation_counter)
+
+        entire_graph.serialize(destination=ttl_path, format='turtle')
+        if write_jsonld:
+            entire_graph.serialize(destination=jsonld_path, format='json-ld', auto_compact=True)
+        file_hash = compute_file_hash(jsonld_path if write_jsonld else ttl_path)
 
-    file_hash = compute_file_hash(jsonld_path)
     with open(hash_path, 'w') as hash_file:
         hash_file.write(file_hash)
 
@@ -1172,7 +1771,7 @@ def convert_entire_dataset(
 #           MASTER FUNCTION
 # =============================================================================
 
-def convert_dataset_to_rdf_with_mode(
+def run_rdf_conversion(
     df: pd.DataFrame,
     variable_metadata: dict,
     namespace_map: dict,
@@ -1181,28 +1780,147 @@ def convert_dataset_to_rdf_with_mode(
     orcid: str = '',
     dataset_name: str = DEFAULT_DATASET_NAME,
     fixed_dimensions: list = None,
-    conversion_mode: str = 'entire'
-) -> None:
+    conversion_mode: str = 'entire',
+    bundle: str = None,
+    workers: int = 1,
+    id_columns: list = None,
+    streaming: bool = False,
+    write_jsonld: bool = True,
+    namespaces_prepared: bool = False
+) -> str:
     """
     Description:
-        Main entry point for converting a Pandas DataFrame to RDF using either:
+        Converts a Pandas DataFrame to RDF using either:
          - 'entire': single qb:DataSet with multiple qb:Slices
          - 'row-by-row': each row => a separate qb:DataSet
+         - 'CRADLE': row-by-row with CRADLE file naming
         Also writes a naming conventions .txt file describing how URIs and filenames are formed.
+        Unlike convert_dataset_to_rdf_with_mode, errors are raised to the caller.
 
     Algorithm:
         1) create_root_folder => get a top-level folder named "Output_{orcidDigits}_{timestamp}".
-        2) prepare_namespaces => validate prefix => namespace URIs.
+        2) prepare_namespaces => validate prefix => namespace URIs
+           (skipped if namespace_map is already prepared).
         3) If conversion_mode == 'entire':
              a) create_subfolders => 'ttl', 'jsonld', 'hash'
              b) build combined_iri => dataset_name_for_iri
              c) call convert_entire_dataset(...)
            elif conversion_mode == 'row-by-row':
              call convert_row_by_row(...)
+           elif conversion_mode == 'CRADLE':
+             call convert_row_by_row_CRADLE(...)
            else:
              raise ValueError if mode is invalid
         4) write_naming_conventions_doc => describing the chosen naming approach
-        5) Print success message.
+
+    Args:
+        See convert_dataset_to_rdf_with_mode.
+        namespaces_prepared (bool): namespace_map is already the output of prepare_namespaces
+            (prefix => rdflib.Namespace), e.g. shared by the workbooks of a batch.
+
+    Returns:
+        str: The root output folder of this conversion.
+    """
+    # 1) create the root folder
+    root_folder_path, overall_timestamp, sanitized_dataset_name, sanitized_orcid = create_root_folder(
+        output_folder_path, dataset_name, orcid
+    )
+
+    # 2) prepare namespaces
+    ns_map = namespace_map if namespaces_prepared else prepare_namespaces(namespace_map, user_chosen_prefix)
+
+    # 3) entire or row-by-row
+    if conversion_mode == 'entire':
+        subfolders = create_subfolders(root_folder_path)
+        combined_iri = f"{sanitized_dataset_name}_{sanitized_orcid}_{overall_timestamp}"
+        dataset_name_for_iri = _sanitize_for_iri(combined_iri)
+
+        convert_entire_dataset(
+            df=df,
+            variable_metadata=variable_metadata,
+            ns_map=ns_map,
+            user_chosen_prefix=user_chosen_prefix,
+            dataset_name=dataset_name_for_iri,
+            orcid=orcid,
+            output_folder_paths=subfolders,
+            fixed_dimensions=fixed_dimensions,
+            overall_timestamp=overall_timestamp,
+            id_columns=id_columns,
+            streaming=streaming,
+            write_jsonld=write_jsonld
+        )
+
+    elif conversion_mode == 'row-by-row':
+        convert_row_by_row(
+            df=df,
+            variable_metadata=variable_metadata,
+            ns_map=ns_map,
+            user_chosen_prefix=user_chosen_prefix,
+            orcid=orcid,
+            root_folder_path=root_folder_path,
+            overall_timestamp=overall_timestamp,
+            bundle=bundle,
+            workers=workers,
+            id_columns=id_columns
+        )
+
+    elif conversion_mode == "CRADLE":
+        convert_row_by_row_CRADLE(
+            df=df,
+            variable_metadata=variable_metadata,
+            ns_map=ns_map,
+            user_chosen_prefix=user_chosen_prefix,
+            orcid=orcid,
+            root_folder_path=root_folder_path,
+            overall_timestamp=overall_timestamp,
+            bundle=bundle,
+            workers=workers,
+            id_columns=id_columns
+        )
+
+    else:
+        raise ValueError("Invalid conversion_mode. Choose 'entire' or 'row-by-row'.")
+
+    # 4) Write naming conventions doc
+    write_naming_conventions_doc(
+         root_folder_path=root_folder_path,
+         conversion_mode=conversion_mode,
+         orcid=orcid,
+         overall_timestamp=overall_timestamp,
+         dataset_name=sanitized_dataset_name,
+         bundle=bundle if conversion_mode != 'entire' else None,
+         write_jsonld=write_jsonld or conversion_mode != 'entire'
+     )
+
+    return root_folder_path
+
+
+def convert_dataset_to_rdf_with_mode(
+    df: pd.DataFrame,
+    variable_metadata: dict,
+    namespace_map: dict,
+    user_chosen_prefix: str = DEFAULT_USER_PREFIX,
+    output_folder_path: str = '.',
+    orcid: str = '',
+    dataset_name: str = DEFAULT_DATASET_NAME,
+    fixed_dimensions: list = None,
+    conversion_mode: str = 'entire',
+    bundle: str = None,
+    workers: int = 1,
+    id_columns: list = None,
+    streaming: bool = False,
+    write_jsonld: bool = True
+) -> None:
+    """
+    Description:
+        Main entry point for converting a Pandas DataFrame to RDF using either:
+         - 'entire': single qb:DataSet with multiple qb:Slices
+         - 'row-by-row': each row => a separate qb:DataSet
+        Also writes a naming conventions .txt file describing how URIs and filenames are formed.
+
+    Algorithm:
+        1) run_rdf_conversion => root folder, namespaces, conversion and naming conventions doc.
+        2) Print success message, or the error if the conversion failed.
 
     Args:
         df (pd.DataFrame): The data to convert.
@@ -1215,71 +1933,35 @@ def convert_dataset_to_rdf_with_mode(
         fixed_dimensions (list or None): used in entire mode to specify columns that
                                          remain the same across slices
         conversion_mode (str): 'entire' or 'row-by-row'
+        bundle (str or None): row-by-row/CRADLE only => write all rows into a single
+                              'tar', 'zip' or 'nquads' file instead of per-row files
+        workers (int): row-by-row/CRADLE only => number of worker processes writing rows
+        id_columns (list or None): ID columns used in naming; None => prompt the user
+        streaming (bool): 'entire' only => write slice by slice instead of building the
+                          whole dataset graph in memory (see convert_entire_dataset)
+        write_jsonld (bool): 'entire' only => also write the .jsonld file
 
     Returns:
         None
     """
     try:
-        # 1) create the root folder
-        root_folder_path, overall_timestamp, sanitized_dataset_name, sanitized_orcid = create_root_folder(
-            output_folder_path, dataset_name, orcid
+        root_folder_path = run_rdf_conversion(
+            df=df,
+            variable_metadata=variable_metadata,
+            namespace_map=namespace_map,
+            user_chosen_prefix=user_chosen_prefix,
+            output_folder_path=output_folder_path,
+            orcid=orcid,
+            dataset_name=dataset_name,
+            fixed_dimensions=fixed_dimensions,
+            conversion_mode=conversion_mode,
+            bundle=bundle,
+            workers=workers,
+            id_columns=id_columns,
+            streaming=streaming,
+            write_jsonld=write_jsonld
         )
 
-        # 2) prepare namespaces
-        ns_map = prepare_namespaces(namespace_map, user_chosen_prefix)
-
-        # 3) entire or row-by-row
-        if conversion_mode == 'entire':
-            subfolders = create_subfolders(root_folder_path)
-            combined_iri = f"{sanitized_dataset_name}_{sanitized_orcid}_{overall_timestamp}"
-            dataset_name_for_iri = _sanitize_for_iri(combined_iri)
-
-            convert_entire_dataset(
-                df=df,
-                variable_metadata=variable_metadata,
-                ns_map=ns_map,
-                user_chosen_prefix=user_chosen_prefix,
-                dataset_name=dataset_name_for_iri,
-                orcid=orcid,
-                output_folder_paths=subfolders,
-                fixed_dimensions=fixed_dimensions,
-                overall_timestamp=overall_timestamp
-            )
-
-        elif conversion_mode == 'row-by-row':
-            convert_row_by_row(
-                df=df,
-                variable_metadata=variable_metadata,
-                ns_map=ns_map,
-                user_chosen_prefix=user_chosen_prefix,
-                orcid=orcid,
-                root_folder_path=root_folder_path,
-                overall_timestamp=overall_timestamp
-            )
-
-        elif conversion_mode == "CRADLE":
-            convert_row_by_row_CRADLE(
-                df=df,
-                variable_metadata=variable_metadata,
-                ns_map=ns_map,
-                user_chosen_prefix=user_chosen_prefix,
-                orcid=orcid,
-                root_folder_path=root_folder_path,
-                overall_timestamp=overall_timestamp
-            )
-
-        else:
-            raise ValueError("Invalid conversion_mode. Choose 'entire' or 'row-by-row'.")
-
-        # 4) Write naming conventions doc
-        write_naming_conventions_doc(
-             root_folder_path=root_folder_path,
-             conversion_mode=conversion_mode,
-             orcid=orcid,
-             overall_timestamp=overall_timestamp,
-             dataset_name=sanitized_dataset_name
-         )
-
         print(
             f"Conversion completed under mode='{conversion_mode}'. "
             f"Outputs in: {root_folder_path}"
@@ -11,7 +11,7 @@ import os
 from .main import MatDatSciDf
 import sys
 from rdflib import Graph, Namespace
-from ...InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from ...InterfaceMDS.ontology_registry import SharedOntologyGraph
 from .metadata_manager import Metadata
 import warnings
 import requests
@@ -30,7 +30,7 @@ class AnalysisTracker:
     and generating semantic JSON-LD metadata.
     """
 
-    mds_graph = load_mds_ontology_graph()
+    mds_graph = SharedOntologyGraph()
 
     def __init__(self, 
                 proj_name: str, 
@@ -1006,7 +1006,7 @@ class AnalysisGroup:
     Manages a collection of related AnalysisTracker instances, facilitating 
     group-level reporting and master graph generation.
     """
-    mds_graph = load_mds_ontology_graph()
+    mds_graph = SharedOntologyGraph()
 
     def __init__(self,
                 proj_name: str, 
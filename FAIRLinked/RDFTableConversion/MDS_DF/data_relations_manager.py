@@ -3,8 +3,83 @@ import json
 import warnings
 from datetime import datetime
 import pandas as pd
-from rdflib import Graph
-from typing import Optional
+from rdflib import Graph, URIRef
+from typing import NamedTuple, Optional
+from .utility import resolve_predicate, ontology_fingerprint
+
+
+#### RESOLVED RELATIONS TABLE ####
+
+class RelationPair(NamedTuple):
+    """
+    A (subject column, object column) pair with the columns' positions in the 
+    DataFrame the table was resolved for (None if the column is not in it).
+    """
+    subj_col: str
+    obj_col: str
+    subj_idx: Optional[int]
+    obj_idx: Optional[int]
+
+
+class ResolvedRelation(NamedTuple):
+    """
+    One property group of a DataRelationsDict, with its predicate resolved against the ontology.
+
+    Attributes:
+        prop_key (str): The key as written in the DataRelationsDict (label, CURIE or URI).
+        predicate (URIRef): The resolved predicate IRI.
+        prop_type (str): "Object Property" or "Datatype Property".
+        pairs (tuple[RelationPair]): The column pairs linked by the predicate.
+    """
+    prop_key: str
+    predicate: URIRef
+    prop_type: str
+    pairs: tuple
+
+
+def resolve_relations(prop_pair_dict: dict, 
+                      ontology_graph: Graph, 
+                      onto_props: dict, 
+                      columns: Optional[list] = None, 
+                      labels_first: bool = False) -> list[ResolvedRelation]:
+    """
+    Resolves every property key of a relations dictionary to a predicate IRI and type.
+
+    By default a key is first resolved as a full IRI or CURIE with `resolve_predicate` 
+    and then looked up as an rdfs:label in `onto_props`; `labels_first=True` swaps the 
+    order. Keys that cannot be resolved, or that resolve to an IRI which is neither an 
+    Object nor a Datatype property, are left out since no triples can be built for them.
+
+    Args:
+        prop_pair_dict (dict): Property key → list of (subject_column, object_column).
+        ontology_graph (rdflib.Graph): The ontology used to expand CURIEs and look up property types.
+        onto_props (dict): Label → (URI, type), as returned by `MatDatSciDf.get_relations()`.
+        columns (list, optional): DataFrame columns used to fill in the pair positions.
+        labels_first (bool, optional): Try `onto_props` labels before IRIs/CURIEs. Defaults to False.
+
+    Returns:
+        list[ResolvedRelation]: The resolved property groups, in dictionary order.
+    """
+    positions = {col: i for i, col in enumerate(columns)} if columns is not None else {}
+    table = []
+    for prop_key, pairs in prop_pair_dict.items():
+        prop_uri, prop_type = None, None
+        if labels_first and prop_key in onto_props:
+            prop_uri, prop_type = onto_props[prop_key]
+        elif ontology_graph is not None:
+            prop_uri, prop_type = resolve_predicate(prop_key, ontology_graph)
+        if prop_uri is None and not labels_first and prop_key in onto_props:
+            prop_uri, prop_type = onto_props[prop_key]
+        if prop_uri is None or prop_type not in ("Object Property", "Datatype Property"):
+            continue
+
+        table.append(ResolvedRelation(
+            prop_key=prop_key,
+            predicate=URIRef(prop_uri),
+            prop_type=prop_type,
+            pairs=tuple(RelationPair(s, o, positions.get(s), positions.get(o)) for s, o in pairs)
+        ))
+    return table
 
 
 #### DATA RELATIONS DICTIONARY OBJECT #####
@@ -34,6 +109,34 @@ class DataRelationsDict:
             """
 
             self.prop_pair_dict = prop_col_pair_dict
+            self._resolved = None
+
+
+        def resolve(self, ontology_graph: Graph, onto_props: dict, columns: Optional[list] = None) -> list[ResolvedRelation]:
+            """
+            Returns the resolved relations table (see `resolve_relations`) for the current relations.
+
+            The table is built once and reused until the relations, the ontology or the 
+            columns change, so serializing many rows or calling the serializers 
+            repeatedly does not resolve the same predicates again.
+
+            Args:
+                ontology_graph (rdflib.Graph): The ontology used to resolve property keys.
+                onto_props (dict): Label → (URI, type), as returned by `MatDatSciDf.get_relations()`.
+                columns (list, optional): DataFrame columns used to fill in the pair positions.
+
+            Returns:
+                list[ResolvedRelation]: The resolved property groups.
+            """
+            key = (
+                json.dumps(self.prop_pair_dict, sort_keys=True, default=str),
+                id(ontology_graph),
+                ontology_fingerprint(ontology_graph) if ontology_graph is not None else None,
+                tuple(columns) if columns is not None else None
+            )
+            if self._resolved is None or self._resolved[0] != key:
+                self._resolved = (key, resolve_relations(self.prop_pair_dict, ontology_graph, onto_props, columns))
+            return self._resolved[1]
 
 
         def add_relations(self, data_relations: dict, ontology_graph: Graph, onto_props: dict):
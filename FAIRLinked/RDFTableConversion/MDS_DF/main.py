@@ -6,6 +6,7 @@ import random
 import string
 import warnings
 from datetime import datetime, timezone
+from functools import partial
 import pandas as pd
 from rdflib import Graph, URIRef, Literal, Namespace, XSD
 from rdflib.collection import Collection
@@ -13,24 +14,42 @@ from rdflib.namespace import RDF, SKOS, OWL, RDFS, DCTERMS
 from urllib.parse import quote
 import traceback
 import requests
-from ...InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from ...InterfaceMDS.ontology_registry import SharedOntologyGraph
 from typing import Optional, List, Union
 from .utility import (
     load_licenses, 
     hash6, 
-    resolve_predicate, 
     write_license_triple, 
     normalize, 
     extract_terms_from_ontology, 
     find_best_match, 
+    get_ontology_term_index, 
     extract_qudt_units, 
     prompt_for_missing_fields,
-    load_units
+    load_units,
+    get_unit_index,
+    get_ontology_properties,
+    get_ontology_classes,
+    get_type_remap
 )
 import ast
 from tqdm import tqdm
 from .metadata_manager import Metadata
-from .data_relations_manager import DataRelationsDict
+from .data_relations_manager import DataRelationsDict, resolve_relations
+from .serialization_plan import SerializationPlan, STORED_ROW_KEY_COLUMN, TemplateMismatchError, string_literal
+from .row_serializer import (
+    RowSerializer,
+    remap_unknown_types,
+    serialize_rows_parallel,
+    open_stream,
+    write_rows_stream,
+    compact_stream,
+    STREAM_FORMATS
+)
+from .rdf_dir_reader import list_rdf_files, read_rdf_records
+from .rdf_dir_cache import RDFRecordCache
+from .rdf_dir_validation import entries_frame, validate_import, finding_messages
+from ..records import iter_records
 import tempfile
 
 class MatDatSciDf:
@@ -57,9 +76,11 @@ class MatDatSciDf:
         ontology (rdflib.Graph): The reference ontology graph used for fuzzy 
             matching and property resolution.
         base_uri (str): The namespace prefix used for generating semantic subjects.
+        import_findings (pd.DataFrame or None): Validation findings of the import, 
+            set by `from_rdf_dir`. None for instances built any other way.
     """
 
-    mds_graph = load_mds_ontology_graph()
+    mds_graph = SharedOntologyGraph()
 
     df_name = "Unnamed_Dataframe"
     
@@ -179,6 +200,7 @@ class MatDatSciDf:
         
 
         self.base_uri = base_uri
+        self.import_findings = None
 
         self.MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
         self.ontology.bind("mds", self.MDS)
@@ -199,7 +221,8 @@ class MatDatSciDf:
 
         This method scans the ontology graph for OWL ObjectProperties and 
         DatatypeProperties, mapping their human-readable rdfs:labels to their 
-        full URIs and property types.
+        full URIs and property types. The scan is done once per ontology graph 
+        and reused until the graph changes.
 
         Returns:
             dict: A dictionary (prop_metadata_dict) where:
@@ -207,16 +230,7 @@ class MatDatSciDf:
                 - Value: Tuple of (Property URI, Property Type)
         """
 
-        ontology_graph = self.ontology
-        prop_metadata_dict = {}
-
-        for prop_type, label_type in [(OWL.ObjectProperty, "Object Property"), (OWL.DatatypeProperty, "Datatype Property")]:
-            for prop in ontology_graph.subjects(RDF.type, prop_type):
-                label = ontology_graph.value(prop, RDFS.label)
-                if label:
-                    prop_metadata_dict[str(label)] = (str(prop), label_type)
-
-        return prop_metadata_dict
+        return dict(get_ontology_properties(self.ontology))
 
     def view_relations(self):
         """
@@ -519,7 +533,7 @@ class MatDatSciDf:
         template_labels = {item.get("skos:altLabel") for item in template_graph if "skos:altLabel" in item}
         
         # Filter out internal/helper columns from the DF set
-        internal_cols = {"__source_file__", "__rowkey__", "__Label__"}
+        internal_cols = {"__source_file__", "__rowkey__", "__Label__", STORED_ROW_KEY_COLUMN}
         df_columns = set(self.df.columns) - internal_cols
         
         all_clear = True
@@ -614,7 +628,10 @@ class MatDatSciDf:
         ontology_graph = self.ontology
 
         columns = h_df.columns
-        ontology_terms = extract_terms_from_ontology(ontology_graph)
+        skip_cols = ("__source_file__", "__Label__", "__rowkey__", STORED_ROW_KEY_COLUMN)
+        column_matches = get_ontology_term_index(ontology_graph).match_columns(
+            [col for col in columns if col not in skip_cols]
+        )
 
         bindings_dict = {prefix: str(namespace) for prefix, namespace in ontology_graph.namespaces()}
         if "mds" not in bindings_dict:
@@ -642,13 +659,14 @@ class MatDatSciDf:
         }   
 
         units = self.units
+        unit_index = get_unit_index(units)
 
         for col in columns:
-            if col == "__source_file__" or col == "__Label__" or col == "__rowkey__":
+            if col in skip_cols:
                 continue
             typ = h_df.loc[0,col]
 
-            match = find_best_match(col, ontology_terms)
+            match = column_matches[col]
             if(pd.isna(typ) or ":" not in typ):# if no type was explicitily included in csv
             
                 #get iri from closest match
@@ -710,17 +728,8 @@ class MatDatSciDf:
                     if ":" in target_str:
                         un = target_str.split(":")[1]
                     else:
-                        matches = []
-                        for key, details in units.items():
-                            # Clean up comparisons using .lower() and check both ucum and labels
-                            name = details.get('name', '')
-                            ucum_code = details.get('ucum_code', '')
-                            label = details.get('label', '')
-                            
-                            if ((name and un.lower() == name.lower()) or
-                                (ucum_code and un == ucum_code) or 
-                                (label and un.lower() == label.lower())):
-                                matches.append(key)
+                        # Case-insensitive name/label or exact UCUM code
+                        matches = unit_index.lookup(un, fields=("name", "ucum_code", "label"))
 
                         if len(matches) == 1 :
                             un = matches[0]
@@ -802,37 +811,156 @@ class MatDatSciDf:
         return metadata_template, matched_log, unmatched_log
 
     #### SERIALIZE INTO LINKED DATA #####     
-    def semantic_remapping(self, data_graph: Graph):
+    def semantic_remapping(self, data_graph: Graph, remapped: Optional[dict] = None):
         """
         Validates types against the reference ontology and remaps 
         unrecognized types to the base BFO Entity class.
+
+        Args:
+            data_graph (rdflib.Graph): The graph whose rdf:type triples are checked.
+            remapped (dict, optional): If given, the number of remapped subjects per 
+                unrecognized type is added to it and no warning is printed, so that 
+                callers remapping many graphs can report once. Otherwise a single 
+                summary warning is printed for this graph.
         """
         
-        # 1. Define the OBO Namespace and the BFO Entity class
-        OBO = Namespace("http://purl.obolibrary.org/obo/")
-        BFO_ENTITY = OBO.BFO_0000001
-        
-        # 2. Ensure OBO is bound for clean serialization
-        if data_graph.namespace_manager.store.prefix(URIRef("http://purl.obolibrary.org/obo/")) is None:
-            data_graph.bind("obo", OBO)
-
-        # 3. Cache valid classes from your reference ontology for speed
-        ref_classes = set(self.ontology.subjects(predicate=RDF.type, object=OWL.Class))
-        ref_classes.update(self.ontology.subjects(predicate=RDF.type, object=RDFS.Class))
-
-        # 4. Find all subjects that have an rdf:type
-        # We iterate over triples to identify which specific subjects need remapping
-        for s, p, o in data_graph.triples((None, RDF.type, None)):
-            if o not in ref_classes:
-                print(f"⚠️ Warning: {o} not in reference ontology. Remapping {s} to obo:BFO_0000001")
-                
-                # .set() removes all existing (s, RDF.type, ...) and adds (s, RDF.type, BFO_ENTITY)
-                data_graph.set((s, RDF.type, BFO_ENTITY))
+        # Valid classes and earlier decisions are cached per reference ontology
+        counts = {} if remapped is None else remapped
+        remap_unknown_types(data_graph, get_ontology_classes(self.ontology), get_type_remap(self.ontology), counts)
+
+        if remapped is None:
+            self._report_remapping(counts)
     
         return data_graph
 
+    @staticmethod
+    def _report_remapping(remapped: dict):
+        if not remapped:
+            return
+        summary = ", ".join(f"{o} ({n})" for o, n in remapped.items())
+        print(f"⚠️ Warning: {sum(remapped.values())} subject(s) had types not in the reference ontology "
+              f"and were remapped to obo:BFO_0000001: {summary}")
+
                 
 
+    def with_data(self, df: pd.DataFrame, metadata_rows: Optional[bool] = False) -> "MatDatSciDf":
+        """
+        Returns a MatDatSciDf for another DataFrame that shares this instance's 
+        metadata template, data relations, ontology and verified ORCID.
+
+        Nothing is re-validated or rediscovered, so this is much cheaper than 
+        constructing a new instance for every file of a batch with the same layout.
+
+        Args:
+            df (pd.DataFrame): The new data.
+            metadata_rows (bool, optional): If True, the first 3 rows of `df` are 
+                semantic headers, as in the constructor. Defaults to False.
+
+        Returns:
+            MatDatSciDf: A shallow copy holding `df`.
+        """
+        other = copy.copy(self)
+        if metadata_rows is False:
+            other.metadata_rows_skip = 0
+            other.header_df = pd.DataFrame(index=range(3), columns=df.columns)
+        else:
+            other.metadata_rows_skip = 3
+            other.header_df = df.iloc[:3]
+        other.df = df.iloc[other.metadata_rows_skip:]
+        return other
+
+    def with_metadata_rows(self, df: pd.DataFrame, data_relations_dict: Optional[dict] = None) -> "MatDatSciDf":
+        """
+        Returns a MatDatSciDf for another DataFrame whose first 3 rows are semantic 
+        headers, with a metadata template generated from those rows and relations 
+        discovered from that template, as the constructor does without a template.
+
+        The ontology, units and verified ORCID are shared with this instance, so 
+        the ORCID is not verified again. Use it for files of a batch whose layouts 
+        differ; for files with the same layout, `with_data` is cheaper.
+
+        Args:
+            df (pd.DataFrame): The new data, starting with its 3 metadata rows.
+            data_relations_dict (dict, optional): Links between columns, as in the 
+                constructor. Defaults to an empty dict.
+
+        Returns:
+            MatDatSciDf: A shallow copy with its own template and relations.
+        """
+        other = self.with_data(df, metadata_rows=True)
+        other._serialization_plan = None
+        other.import_findings = None
+        template, matched, unmatched = other.template_generator(skip_prompts=True)
+        other.metadata_template = template
+        other.matched_log = matched
+        other.unmatched_log = unmatched
+        other.data_relations = DataRelationsDict(prop_col_pair_dict=data_relations_dict or {})
+        other.metadata_obj = Metadata(metadata_template=template, matched_log=matched, unmatched_log=unmatched)
+        other.add_relations(data_relations=other.get_relation_pairs_onto())
+        return other
+
+    def get_serialization_plan(self, 
+                    row_key_cols: Optional[list[str]] = None, 
+                    id_cols: Optional[list[str]] = None) -> SerializationPlan:
+        """
+        Returns the compiled serialization plan for the current metadata template.
+
+        The plan is compiled on first use and reused for as long as the template and 
+        the row key / identifier columns are unchanged, so editing the metadata 
+        (e.g. with `update_metadata`) transparently triggers a recompile.
+
+        Args:
+            row_key_cols (list[str], optional): Column names used to generate row keys.
+            id_cols (list[str], optional): Column names used as entity identifiers.
+
+        Returns:
+            SerializationPlan: Flat per-column instructions for `serialize_row`.
+
+        Raises:
+            ValueError: If the metadata template cannot be compiled.
+        """
+        graph_template = self.metadata_obj.metadata_temp.get("@graph", [])
+        key = SerializationPlan.make_key(graph_template, row_key_cols, id_cols)
+        plan = getattr(self, "_serialization_plan", None)
+        if plan is None or plan.key != key:
+            plan = SerializationPlan(graph_template, row_key_cols=row_key_cols, id_cols=id_cols)
+            self._serialization_plan = plan
+        return plan
+
+    def compute_row_keys(self, row_key_cols: Optional[list[str]] = None) -> pd.Series:
+        """
+        Computes the row key of every row at once, as used by `serialize_row` to mint 
+        subject IRIs and file names.
+
+        Args:
+            row_key_cols (list[str], optional): Column names used to generate row keys. 
+                By default, keys are hashed from the columns of each study stage.
+
+        Returns:
+            pd.Series: Row keys named `__stored_rowkey__`, indexed like the DataFrame.
+
+        Raises:
+            KeyError: If a column of the metadata template is missing from the DataFrame.
+        """
+        plan = SerializationPlan(self.metadata_obj.metadata_temp.get("@graph", []), row_key_cols=row_key_cols)
+        return plan.row_keys(self.df).str.rstrip("-").rename(STORED_ROW_KEY_COLUMN)
+
+    def add_row_keys(self, row_key_cols: Optional[list[str]] = None):
+        """
+        Stores the row keys from `compute_row_keys` in a `__stored_rowkey__` column.
+
+        `serialize_row` and `serialize_bulk` reuse this column instead of computing 
+        keys again when they are called without `row_key_cols`. Call it again after 
+        editing the data or the metadata, since stored keys are not updated. A 
+        `__rowkey__` column (as written by `AnalysisTracker.create_arg_df`) is 
+        never used as row keys.
+
+        Args:
+            row_key_cols (list[str], optional): Column names used to generate row keys.
+        """
+        self.df[STORED_ROW_KEY_COLUMN] = self.compute_row_keys(row_key_cols)
+        print(f"✅ Added {STORED_ROW_KEY_COLUMN} column for {len(self.df)} rows.")
+
     def serialize_row(self, 
                     output_folder: str, 
                     format = 'json-ld', 
@@ -840,44 +968,96 @@ class MatDatSciDf:
                     id_cols: Optional[list[str]] = None,
                     label_pairs: Optional[list[tuple[str, str]]] = None, 
                     license: Optional[str]= None,
-                    write_files: Optional[bool] = True) -> list[Graph]:
+                    write_files: Optional[bool] = True,
+                    engine: str = "jsonld",
+                    workers: int = 1,
+                    chunk_size: Optional[int] = None,
+                    strict: bool = False) -> list:
 
         """
         Serializes each row of the DataFrame into individual RDF files using the 
         active semantic metadata template.
+
+        Args:
+            engine (str, optional): How row graphs are built. "jsonld" fills the 
+                template as JSON-LD and parses it for every row. "direct" expands the 
+                template to triples once and emits each row's triples directly, 
+                serializing only when files are written. Both produce isomorphic 
+                graphs. Defaults to "jsonld".
+            workers (int, optional): Number of worker processes. With more than one, 
+                contiguous chunks of rows are serialized in a process pool and each 
+                worker writes its rows' files itself. Printed output and warnings 
+                are replayed in row order. Defaults to 1.
+            chunk_size (int, optional): Rows per chunk sent to a worker. Defaults to 
+                about four chunks per worker.
+            strict (bool, optional): If True, raise `TemplateMismatchError` when the 
+                rows cannot be serialized with the metadata template (e.g. a template 
+                column is missing from the DataFrame). By default this is a warning 
+                and an empty list is returned.
+
+        Returns:
+            list: The row graphs, in row order. With `workers` > 1 the graphs are not 
+                sent back from the workers; the list holds the path of each written 
+                file instead, or each row graph's triple count if `write_files` is False.
+
+        Note:
+            Row keys are computed for all rows up front. If the DataFrame has a 
+            `__stored_rowkey__` column (see `add_row_keys`) and `row_key_cols` is not given, 
+            its values are used as the row keys instead.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        try:
+            serializer, rows = self._prepare_row_serializer(
+                output_folder, format, row_key_cols, id_cols, label_pairs, license, write_files, engine
+            )
+        except TemplateMismatchError as e:
+            if strict:
+                raise
+            warnings.warn(str(e))
+            return []
+        remapped = {}
+
+        if workers > 1:
+            if chunk_size is None:
+                chunk_size = max(1, -(-len(self.df) // (workers * 4)))
+            results = serialize_rows_parallel(serializer, rows, workers, chunk_size, remapped)
+        else:
+            results = serializer.serialize_rows(rows, remapped)
+
+        self._report_remapping(remapped)
+        return results
+
+    def _prepare_row_serializer(self, output_folder, format, row_key_cols, id_cols, label_pairs, license, write_files, engine, df=None):
+        """
+        Shared set-up of `serialize_row`, `serialize_row_chunks` and `serialize_stream`: 
+        checks the license, compiles the template, computes the row keys of `df` 
+        (defaults to 'self.df') and builds the `RowSerializer`.
+
+        Returns:
+            tuple: (RowSerializer, iterator of (row_key, idx, row)).
+
+        Raises:
+            TemplateMismatchError: If the rows cannot be serialized with this template.
         """
+        if engine not in ("jsonld", "direct"):
+            raise ValueError(f"Unknown serialization engine '{engine}'. Use 'jsonld' or 'direct'.")
 
-        df = self.df
+        if df is None:
+            df = self.df
         orcid = self.orcid
         metadata_obj = self.metadata_obj
         data_relation_dict = self.data_relations
-        prop_column_pair_dict = data_relation_dict.prop_pair_dict if data_relation_dict else None
-        results = []
         ontology_graph = self.ontology
         metadata_template = metadata_obj.metadata_temp
         base_uri = self.base_uri
         context = metadata_template.get("@context", {})
-        graph_template = metadata_template.get("@graph", [])
-        prop_metadata_dict = self.get_relations()
+        relations_table = data_relation_dict.resolve(ontology_graph, self.get_relations(), list(df.columns)) if data_relation_dict else []
 
         if write_files:
             os.makedirs(output_folder, exist_ok=True)
 
-        sskey = {
-            "Synthesis": "SYN", 
-            "Formulation": "FOR", 
-            "Material Processing": "MAT_PRO",
-            "Sample": "SA", 
-            "Tool": "TL", 
-            "Recipe": "REC", 
-            "Result": "RSLT", 
-            "Analysis": "AN", 
-            "Modeling": "MOD",
-            "": "UNK"
-        }
-
-        rowpredicate = URIRef("https://cwrusdle.bitbucket.io/mds/row")
-
         # check license
         if not license:
             license_uri = URIRef("https://spdx.org/licenses/CC0-1.0.html")
@@ -901,206 +1081,105 @@ class MatDatSciDf:
             write_license_triple(output_folder, base_uri, license_uri)
 
 
-        for idx, row in df.iterrows():
-            try:
-                # Deep copy the template and assign @id
-                template_copy = copy.deepcopy(graph_template)
-                subject_lookup = {}  # Maps skos:altLabel → generated @id
-
-                # Generate row key
-                c = [item["skos:altLabel"] for item in template_copy if "skos:altLabel" in item]
-                if row_key_cols is None or not any(x in c for x in row_key_cols):
-                    keys = {}
-                    for item in template_copy:
-                        if "skos:altLabel" not in item or not item["skos:altLabel"]:
-                            raise ValueError("Missing skos:altLabel in template")
-                        col = item["skos:altLabel"]
-                        studystage = item.get("mds:hasStudyStage", "")
-                        val = df.at[idx, col]
-
-                        if studystage not in keys:
-                            keys[studystage] = [val]
-                        else:
-                            keys[studystage].append(val)
-                    
-                    row_key = ""
-                    for key in keys:
-                        try:
-                            num = str(hash6("".join([str(x) for x in keys[key] if not pd.isna(x)])))
-                            row_key += sskey.get(key, "UNK") + num + "-"
-                        except Exception:
-                            traceback.print_exc()
-                else:
-                    row_key = ""
-                    for x in set(c) & set(row_key_cols):
-                        row_key += str(df.at[idx, x]).strip() + "-"
-                
-                orcid_rk = orcid.replace("-", "")
-                full_row_key = f"{row_key}or{orcid_rk}".replace(" ", "")
-                clean_row_key = row_key.rstrip("-")
-
-                # ==========================================
-                # Prepare Template Fields & Subject URIs
-                # ==========================================
-                for item in template_copy:
-                    if "@type" not in item or not item["@type"]:
-                        warnings.warn(f"Missing or empty @type in template item: {item}")
-                        continue
-                    if "skos:altLabel" not in item or not item["skos:altLabel"]:
-                        raise ValueError("Missing skos:altLabel in template")
-
-                    raw_type = str(item["@type"]).strip()
-    
-                    if "://" in raw_type:
-                        # Full IRI (e.g., "https://cwrusdle.bitbucket.io/mds/ShearRate")
-                        localname = raw_type.split("/")[-1].split("#")[-1]
-                    elif ":" in raw_type:
-                        # CURIE (e.g., "mds:ShearRate")
-                        _, localname = raw_type.split(":", 1)
-                    else:
-                        # Bare string (e.g., "ShearRate")
-                        localname = raw_type
-
-                    if id_cols is not None and item["skos:altLabel"] in id_cols:
-                        raw_identifier = row.get(item["skos:altLabel"])
-                        if not raw_identifier or pd.isna(raw_identifier):
-                            warnings.warn(f"Cannot find entity identifier in row {idx}")
-                            continue
-                        entity_identifier = normalize(re.sub(r'[^a-zA-Z0-9_\-\.]', '', str(raw_identifier)))
-                        subject_uri = self.MDS[f"{localname}.{entity_identifier}"]
-                    else:
-                        subject_uri = self.MDS[f"{localname}.{clean_row_key}"]
+        try:
+            plan = self.get_serialization_plan(row_key_cols=row_key_cols, id_cols=id_cols)
+        except (ValueError, TypeError) as e:
+            raise TemplateMismatchError(f"Cannot serialize rows with this metadata template: {e}") from e
+
+        serializer = RowSerializer(
+            plan=plan,
+            relations_table=relations_table,
+            context=context,
+            ref_classes=get_ontology_classes(ontology_graph),
+            type_remap=get_type_remap(ontology_graph),
+            base_uri=base_uri,
+            license_uri=license_uri,
+            orcid=orcid,
+            orcid_verified=getattr(self, 'orcid_verified', True),
+            label_pairs=label_pairs,
+            engine=engine,
+            output_folder=output_folder,
+            format=format,
+            write_files=write_files
+        )
+        return serializer, self._row_items(plan, df, row_key_cols)
 
-                    item["@id"] = URIRef(subject_uri)
-                    subject_lookup[item["skos:altLabel"]] = URIRef(subject_uri)
+    @staticmethod
+    def _row_items(plan, df, row_key_cols):
+        """
+        Computes the row keys of `df` and returns an iterator of (row_key, idx, row).
 
-                    if "prov:generatedAtTime" in item and isinstance(item["prov:generatedAtTime"], dict):
-                        item["prov:generatedAtTime"]["@value"] = datetime.now(timezone.utc).isoformat() + "Z"
+        Raises:
+            TemplateMismatchError: If the keys cannot be computed.
+        """
+        try:
+            row_keys = plan.row_keys(df, stored_column=STORED_ROW_KEY_COLUMN if row_key_cols is None else None)
+        except (ValueError, TypeError) as e:
+            raise TemplateMismatchError(f"Cannot serialize rows with this metadata template: {e}") from e
+        except KeyError as e:
+            raise TemplateMismatchError(f"Cannot serialize rows: column {e} of the metadata template is missing from the DataFrame") from e
+        return ((row_key, idx, row) for row_key, (idx, row) in zip(row_keys, iter_records(df)))
+
+    def serialize_row_chunks(self,
+                             chunks,
+                             output_folder: str,
+                             format = 'json-ld',
+                             row_key_cols: Optional[list[str]] = None,
+                             id_cols: Optional[list[str]] = None,
+                             label_pairs: Optional[list[tuple[str, str]]] = None,
+                             license: Optional[str] = None,
+                             write_files: Optional[bool] = True,
+                             engine: str = "jsonld",
+                             workers: int = 1,
+                             strict: bool = False) -> list:
+        """
+        Serializes rows like 'serialize_row', taking the data from an iterable of 
+        DataFrame chunks instead of 'self.df'.
 
-                    if "qudt:hasUnit" in item and not item["qudt:hasUnit"].get("@id"):
-                        del item["qudt:hasUnit"]
-                    if "qudt:hasQuantityKind" in item and not item["qudt:hasQuantityKind"].get("@id"):
-                        del item["qudt:hasQuantityKind"]
+        The template, relations and license are prepared once; each chunk is then 
+        serialized and dropped before the next one is read. No row graphs are kept, 
+        so memory use depends on the chunk size only. Typical use is streaming a 
+        large CSV with `pd.read_csv(..., chunksize=n)`, see `extract_data_from_csv`.
 
-                jsonld_data = {
-                    "@context": context,
-                    "@graph": template_copy
-                }
+        Args:
+            chunks (iterable[pd.DataFrame]): DataFrames with the same columns and 
+                no metadata rows. The template and relations are matched against 
+                the columns of the first chunk.
+            output_folder (str), format, row_key_cols, id_cols, label_pairs, license, 
+            write_files, engine, workers, strict: See 'serialize_row'. Without 
+            `strict`, a chunk that does not match the template ends the 
+            serialization with a warning.
 
-                # Convert to RDF Graph
-                g = Graph(identifier=URIRef(f"{base_uri}{full_row_key}{idx}"))
-                g.parse(data=json.dumps(jsonld_data), format="json-ld")
-                
-                QUDT = Namespace("http://qudt.org/schema/qudt/")
-                MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
-                OBO = Namespace("http://purl.obolibrary.org/obo/")
-                
-                g.bind("mds", MDS)
-                g.bind("qudt", QUDT)
-                g.bind("dcterms", DCTERMS)
-                g.bind("obo", OBO)
-
-                # Add triples from DataFrame row values
-                for alt_label, subj_uri in subject_lookup.items():
-                    if alt_label in row:
-                        g.remove((subj_uri, QUDT.value, None))
-                        if pd.notna(row[alt_label]) and str(row[alt_label]).strip() != "":
-                            data_value = row[alt_label]
-                            if hasattr(data_value, 'item'):
-                                data_value = data_value.item()
-                            g.add((subj_uri, QUDT.value, Literal(data_value, datatype=XSD.string)))
-                        else:
-                            print(f"Skipping NA value for {alt_label} on row {idx} with row key {clean_row_key}")
-                        
-                        g.add((subj_uri, rowpredicate, Literal(clean_row_key)))
-                        g.add((subj_uri, DCTERMS.license, license_uri))
-                        curator_uri = URIRef(f"https://orcid.org/{self.orcid}")
-                        g.add((subj_uri, DCTERMS.creator, curator_uri))
-                        
-                        if not getattr(self, 'orcid_verified', True):
-                            g.add((subj_uri, SKOS.note, Literal("Caution: Data curator ORCID was not verified at time of serialization.")))
-
-                # ==========================================
-                # Process Custom RDFS Label Pairs
-                # ==========================================
-                if label_pairs:
-                    for subj_col, label_col in label_pairs:
-                        subj_uri = subject_lookup.get(subj_col)
-                        if subj_uri and label_col in row:
-                            label_val = row[label_col]
-                            if pd.notna(label_val) and str(label_val).strip() != "":
-                                if hasattr(label_val, 'item'):
-                                    label_val = label_val.item()
-                                g.add((subj_uri, RDFS.label, Literal(str(label_val).strip(), datatype=XSD.string)))
-
-                # ==========================================
-                # Add Object & Datatype Properties
-                # ==========================================
-                if prop_column_pair_dict:
-                    for key, column_pair_list in prop_column_pair_dict.items():
-                        prop_uri, prop_type = resolve_predicate(key, ontology_graph)
-
-                        if prop_uri is None:
-                            prop_metadata = prop_metadata_dict.get(key)
-                            if not prop_metadata:
-                                continue
-                            prop_uri, prop_type = prop_metadata
-                            pred_uri = URIRef(prop_uri)
-                        else:
-                            pred_uri = URIRef(prop_uri)
+        Returns:
+            list: The path of each written file, in row order, or each row graph's 
+                triple count if `write_files` is False.
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
 
-                        for subj_col, obj_col in column_pair_list:
-                            if subj_col not in row or pd.isna(row[subj_col]):
-                                continue
-                            
-                            subj_uri = subject_lookup.get(subj_col)
-                            if not subj_uri:
-                                continue
-                            
-                            obj_val = row[obj_col]
-                            if hasattr(obj_val, 'item'):
-                                obj_val = obj_val.item()
-                            if pd.isna(obj_val):
-                                continue
-
-                            if prop_type == "Object Property":
-                                obj_uri = subject_lookup.get(obj_col)
-                                if obj_uri is None:
-                                    obj_val_str = str(obj_val).strip()
-                                    obj_uri = URIRef(f"{base_uri}{quote(obj_val_str, safe='')}")
-                                g.add((subj_uri, pred_uri, obj_uri))
-                            elif prop_type == "Datatype Property":
-                                g.add((subj_uri, pred_uri, Literal(obj_val)))
-
-                # Remove empty QUDT values
-                triples_to_remove = [
-                    (s, p, o) for s, p, o in g 
-                    if p == QUDT.value and len(str(o).strip()) == 0
-                ]
-                for triple in triples_to_remove:
-                    g.remove(triple)
-
-                # Execute Semantic Remapping Firewall
-                output_file = os.path.join(output_folder, f"{full_row_key}.jsonld")
-                g = self.semantic_remapping(g)
-                raw_jsonld = g.serialize(format="json-ld", context=context)
-
-                clean_graph = Graph()
-                clean_graph.parse(data=raw_jsonld, format='json-ld')
-                
-                if write_files:
-                    clean_graph.serialize(
-                        destination=output_file, 
-                        format=format, 
-                        context=context, 
-                        indent=2,
-                        auto_compact=True
+        serializer = None
+        results = []
+        remapped = {}
+        for chunk in chunks:
+            try:
+                if serializer is None:
+                    serializer, rows = self._prepare_row_serializer(
+                        output_folder, format, row_key_cols, id_cols, label_pairs, license, write_files, engine, df=chunk
                     )
-                results.append(clean_graph)
-
-            except Exception as e:
-                warnings.warn(f"Error processing row {idx} with key {row_key if 'row_key' in locals() else 'N/A'}: {e}")
+                else:
+                    rows = self._row_items(serializer.plan, chunk, row_key_cols)
+            except TemplateMismatchError as e:
+                if strict:
+                    raise
+                warnings.warn(str(e))
+                break
+            if workers > 1:
+                chunk_size = max(1, -(-len(chunk) // (workers * 4)))
+                results.extend(serialize_rows_parallel(serializer, rows, workers, chunk_size, remapped))
+            else:
+                results.extend(serializer.serialize_rows(rows, remapped, keep_graphs=False))
 
+        self._report_remapping(remapped)
         return results
 
     def serialize_bulk(self, 
@@ -1110,7 +1189,8 @@ class MatDatSciDf:
                       id_cols: Optional[list[str]] = None,
                       label_pairs: Optional[list[tuple[str, str]]] = None,  
                       license: Optional[str] = None,
-                      write_files: Optional[bool] = True) -> Graph:
+                      write_files: Optional[bool] = True,
+                      engine: str = "jsonld") -> Graph:
         """
         Aggregates all row-level RDF graphs into a single master file while preserving the original context.
 
@@ -1138,6 +1218,8 @@ class MatDatSciDf:
                 triples.
             write_files (bool, optional): Whether to write serialized data to disk. 
                 Defaults to True.
+            engine (str, optional): Row graph engine passed to 'serialize_row' 
+                ("jsonld" or "direct"). Defaults to "jsonld".
 
         Returns:
             Graph: A single aggregated RDFLib Graph object containing the triples 
@@ -1149,6 +1231,8 @@ class MatDatSciDf:
             - It maintains the exact same URI structure and namespace bindings as 
               individual row serializations to ensure interoperability.
             - The output directory is automatically created if it does not exist.
+            - Peak memory grows with the size of the dataset. For large datasets use 
+              'serialize_stream', which writes N-Triples/N-Quads incrementally.
         """
         # 1. Initialize the master graph
         master_graph = Graph()
@@ -1167,7 +1251,8 @@ class MatDatSciDf:
             id_cols=id_cols,
             label_pairs=label_pairs,
             license=license,
-            write_files = False
+            write_files = False,
+            engine=engine
         )
 
         # 4. Merge all triples into the master graph
@@ -1189,6 +1274,92 @@ class MatDatSciDf:
 
         return master_graph
 
+    def serialize_stream(self,
+                         output_path: str,
+                         format: str = "nt",
+                         row_key_cols: Optional[list[str]] = None,
+                         id_cols: Optional[list[str]] = None,
+                         label_pairs: Optional[list[tuple[str, str]]] = None,
+                         license: Optional[str] = None,
+                         engine: str = "jsonld",
+                         workers: int = 1,
+                         chunk_size: Optional[int] = None,
+                         compress: Optional[bool] = None,
+                         jsonld_path: Optional[str] = None) -> int:
+        """
+        Writes the whole dataset to a single N-Triples or N-Quads file, streaming 
+        each row's triples to disk as soon as they are produced.
+
+        Produces the same triples as 'serialize_bulk', but never holds more than 
+        a few chunks of row graphs in memory, so memory use does not grow with the 
+        number of rows.
+
+        Args:
+            output_path (str): Destination file, e.g. 'data.nt' or 'data.nq.gz'.
+            format (str, optional): "nt" (N-Triples) or "nquads" (N-Quads, with one 
+                named graph per row). Defaults to "nt".
+            row_key_cols (list[str], optional): Column names used to generate unique 
+                row identifiers.
+            id_cols (list[str], optional): Column names to be used as entity 
+                identifiers (@id) instead of row keys.
+            label_pairs (list[tuple[str, str]], optional): (X, Y) pairs, see 
+                'serialize_bulk'.
+            license (str, optional): SPDX license ID or URI to be applied to the 
+                triples.
+            engine (str, optional): Row graph engine, "jsonld" or "direct". 
+                Defaults to "jsonld".
+            workers (int, optional): Number of worker processes, see 'serialize_row'. 
+                Defaults to 1.
+            chunk_size (int, optional): Rows serialized and written at a time. 
+                Defaults to 256 rows, or fewer when split among workers.
+            compress (bool, optional): Gzip the output. Defaults to True if 
+                `output_path` ends with '.gz'.
+            jsonld_path (str, optional): If given, the streamed file is read back 
+                and saved here as compacted JSON-LD, using the template's '@context'. 
+                This post-pass loads the whole dataset into memory.
+
+        Returns:
+            int: The number of triples (or quads) written.
+
+        Note:
+            Triples that recur in several rows are written once per row. RDF stores 
+            and parsers merge them on load.
+        """
+        if format not in STREAM_FORMATS:
+            raise ValueError(f"Unsupported streaming format '{format}'. Use 'nt' or 'nquads'.")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if compress is None:
+            compress = output_path.endswith(".gz")
+
+        output_folder = os.path.dirname(output_path) or "."
+        os.makedirs(output_folder, exist_ok=True)
+        try:
+            serializer, rows = self._prepare_row_serializer(
+                output_folder, format, row_key_cols, id_cols, label_pairs, license, False, engine
+            )
+        except TemplateMismatchError as e:
+            warnings.warn(str(e))
+            return 0
+        serializer.stream_format = format
+
+        if chunk_size is None:
+            chunk_size = max(1, min(256, -(-len(self.df) // (workers * 4))))
+        remapped = {}
+        with open_stream(output_path, compress) as handle:
+            written = write_rows_stream(serializer, rows, handle, remapped, workers, chunk_size)
+        self._report_remapping(remapped)
+        print(f"✅ Streamed {written} triples to: {output_path}")
+
+        if jsonld_path:
+            jsonld_folder = os.path.dirname(jsonld_path)
+            if jsonld_folder:
+                os.makedirs(jsonld_folder, exist_ok=True)
+            compact_stream(output_path, format, jsonld_path, serializer.context, compress)
+            print(f"✅ Bulk file saved at: {jsonld_path}")
+
+        return written
+
 
 
     @classmethod
@@ -1199,7 +1370,11 @@ class MatDatSciDf:
                      data_relations_dict: Optional[dict] = None,
                      df_name: str = "Imported_RDF_Data",
                      ontology_graph: Optional[Graph] = None,
-                     base_uri: str = "https://cwrusdle.bitbucket.io/mds/"):
+                     base_uri: str = "https://cwrusdle.bitbucket.io/mds/",
+                     workers: int = 1,
+                     chunk_size: Optional[int] = None,
+                     fast_jsonld: bool = True,
+                     cache_dir: Optional[str] = None):
         """
         Factory method to reconstruct a MatDatSciDf instance and validate semantic integrity 
         from a directory of RDF files.
@@ -1221,10 +1396,31 @@ class MatDatSciDf:
                 labels and CURIEs during validation.
             base_uri (str, optional): The base URI used for semantic subject identification. 
                 Defaults to "https://cwrusdle.bitbucket.io/mds/".
+            workers (int, optional): Number of worker processes parsing files. Workers 
+                return compact per-file records (values, types, units and relation 
+                triples) that are validated and merged in directory order, so the 
+                result does not depend on the number of workers. Defaults to 1.
+            chunk_size (int, optional): Files per chunk sent to a worker. Defaults to 
+                about four chunks per worker, at most 256 files.
+            fast_jsonld (bool, optional): Read JSON-LD files written by 'serialize_row' 
+                directly as JSON instead of through rdflib's JSON-LD parser. Files of 
+                any other shape are still parsed with rdflib. Defaults to True.
+            cache_dir (str, optional): Directory of an incremental import cache, e.g. 
+                os.path.join(input_dir, ".fairlinked_cache"). It keeps a manifest 
+                (path, size, modification time, SHA-256) and the extracted per-file 
+                records as Parquet, so that a re-run only parses new or changed files 
+                and forgets deleted ones. Validation is re-run on all records, so the 
+                result and report are the same as without cache. Defaults to None 
+                (no cache).
 
         Returns:
             MatDatSciDf: A fully initialized and validated instance containing the 
-                reconstructed dataset and associated semantic logs.
+                reconstructed dataset and associated semantic logs. Its 
+                'import_findings' attribute holds the validation findings as a 
+                DataFrame with one row per issue: 'file', 'column', 'kind' ('type', 
+                'unit', 'object_relation' or 'datatype_relation'), 'expected', 
+                'actual' and 'reference' (the template, the file that first defined 
+                the column, or the relation's property key).
 
         Reports & Logs:
             - Generates '{df_name}_import_validation.txt' in the input directory.
@@ -1232,33 +1428,24 @@ class MatDatSciDf:
               encountered definition.
             - Logs Schema Mismatches: Flagged if expected semantic links are missing 
               within individual RDF graphs.
+            - All checks run once over the whole batch of files after reading, and 
+              the report is rendered from 'import_findings'.
 
         Note:
             - Supported extensions: .jsonld, .ttl, .nt, .rdf, .xml.
             - Missing data columns in specific files are filled with 'pd.NA' to maintain 
               tabular integrity.
         """
-        EXTENSIONS = {
-            ".jsonld": "json-ld", ".ttl": "turtle", 
-            ".nt": "nt", ".rdf": "xml", ".xml": "xml"
-        }
-        
-        MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
-        QUDT = Namespace("http://qudt.org/schema/qudt/")
-        UNIT = Namespace("https://qudt.org/vocab/unit/")
-        SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
 
         # Use the passed graph if available, otherwise fallback to class default
         target_onto = ontology_graph if ontology_graph is not None else cls.mds_graph
         
-        onto_props = {}
-        if target_onto:
-            for prop_type, label_type in [(OWL.ObjectProperty, "Object Property"), 
-                                          (OWL.DatatypeProperty, "Datatype Property")]:
-                for prop in target_onto.subjects(RDF.type, prop_type):
-                    label = target_onto.value(prop, RDFS.label)
-                    if label:
-                        onto_props[str(label)] = (str(prop), label_type)
+        onto_props = get_ontology_properties(target_onto) if target_onto else {}
+
+        # Predicates are resolved once for all files
+        relations_table = resolve_relations(data_relations_dict, target_onto, onto_props, labels_first=True) if data_relations_dict else []
 
         expected_metadata = {}
 
@@ -1281,10 +1468,6 @@ class MatDatSciDf:
             "unit": "https://qudt.org/vocab/unit/"     
         }
 
-        type_mismatches = []
-        relations_schema_mismatches = []
-        unit_conflicts = []
-        parsed_files_count = 0
         template_origins = {}
         if metadata_template and "@graph" in metadata_template:
             for item in metadata_template["@graph"]:
@@ -1298,113 +1481,88 @@ class MatDatSciDf:
                     }
                     template_origins[label] = "User-provided Template"
 
-        for root, _, files in os.walk(input_dir):
-            supported_files = [f for f in files if os.path.splitext(f)[1].lower() in EXTENSIONS]
+        # Files are parsed (possibly in worker processes) into compact records,
+        # which are merged here in directory order
+        predicates = tuple(dict.fromkeys(relation.predicate for relation in relations_table))
+        read_files = partial(read_rdf_records, predicates=predicates, workers=workers,
+                             chunk_size=chunk_size, desc=f"Initializing {df_name}",
+                             fast_jsonld=fast_jsonld)
+        if cache_dir:
+            record_cache = RDFRecordCache(cache_dir, input_dir, predicates)
+            records = record_cache.read(list_rdf_files(input_dir), read_files)
+        else:
+            record_cache = None
+            records = read_files(list_rdf_files(input_dir))
+
+        # Column entities and relation triples are gathered for all files and
+        # validated as a batch afterwards
+        column_entries = []
+        entry_counts = []
+        triple_rows = []
+        filenames = []
+
+        for record in records:
+            filename = record.filename
+            if record.error is not None:
+                print(f"❌ Error parsing {filename}: {record.error}")
+                continue
 
-            for filename in tqdm(supported_files, desc=f"Initializing {df_name}"):
-                path = os.path.join(root, filename)
-                ext = os.path.splitext(filename)[1].lower()
-                
-                try:
-                    g = Graph()
-                    g.parse(path, format=EXTENSIONS[ext])
-                    # PRE-BIND NAMESPACES BEFORE PARSING
-                    g.bind("mds", MDS)
-                    g.bind("qudt", QUDT)
-                    g.bind("unit", UNIT)
-                    g.bind("skos", SKOS)
-                    
-                    row = {}
-                    # Process every entity that represents a data column
-                    for subj in g.subjects(SKOS.altLabel, None):
-                        label = str(g.value(subj, SKOS.altLabel)).strip()
-                        val = g.value(subj, QUDT.value)
-                        unit_node = g.value(subj, QUDT.hasUnit)
-                        unit_uri = g.namespace_manager.curie(str(unit_node) if unit_node else "")
-                        semantic_type = str(g.value(subj, RDF.type) or "")
-
-                        # 1. Extract Value (Native Python type if Literal, else String/URI)
-                        if val is not None:
-                            row[label] = val.toPython() if isinstance(val, Literal) else str(val)
-                        else:
-                            row[label] = pd.NA
-                        
-                        if label in expected_metadata:
-                            expected = expected_metadata[label]
-                            
-                            # Validate Type
-                            if expected["type"] and semantic_type != expected["type"]:
-                                type_mismatches.append(f"{filename}: {label} Type is '{semantic_type}' (Expected '{expected['type']}')")
-                            
-                            # Validate Unit
-                            if expected["unit"] and unit_uri != expected["unit"]:
-                                unit_conflicts.append(f"{filename}: {label} Unit is '{unit_uri}' (Expected '{expected['unit']}')")
-
-                        # 2. Reconstruct Template Metadata
-                        if label not in template_items:
-                            if metadata_template:
-                                warnings.warn(f"⚠️ Discovery Warning: File {filename} contains column '{label}' not found in provided template.")
-
-                            template_origins[label] = filename
-                            template_items[label] = {
-                                "@id": semantic_type,
-                                "@type": semantic_type,
-                                "skos:altLabel": label,
-                                "skos:definition": str(g.value(subj, SKOS.definition) or ""),
-                                "qudt:hasUnit": {"@id": unit_uri},
-                                "mds:hasStudyStage": str(g.value(subj, MDS.hasStudyStage) or "")
-                            }
+            try:
+                file_no = len(filenames)
+                columns = record.columns
 
-                        else:
-                            if not expected_metadata:
-                                existing_unit = template_items[label]["qudt:hasUnit"]["@id"]
-                                existing_type = template_items[label]["@type"]
-                                
-                                if unit_uri != existing_unit and unit_uri != "":
-                                    unit_conflicts.append(f"{filename}: Unit mismatch for '{label}' vs {template_origins[label]}")
-                                if semantic_type != existing_type:
-                                    type_mismatches.append(f"{filename}: Type mismatch for '{label}' vs {template_origins[label]}")
-
-                    if data_relations_dict:
-                        for prop_key, pairs in data_relations_dict.items():
-                            # Determine property URI and type (ObjectProperty vs DatatypeProperty)
-                            if prop_key in onto_props:
-                                p_uri_str, prop_type = onto_props[prop_key]
-                                p_uri = URIRef(p_uri_str)
-                            else:
-                                p_uri, prop_type = resolve_predicate(prop_key, target_onto)
-
-                            for subj_col, obj_target in pairs:
-                                # Check only if subject variable exists in the current file
-                                if subj_col in row and row[subj_col] is not pd.NA:
-                                    s_uri = URIRef(template_items[subj_col]["@id"])
-
-                                    # --- CASE 1: Object Property (Entity -> Entity) ---
-                                    if prop_type == "Object Property" or "ObjectProperty" in str(prop_type):
-                                        if obj_target in row and row[obj_target] is not pd.NA:
-                                            o_uri = URIRef(template_items[obj_target]["@id"])
-                                            if (s_uri, p_uri, o_uri) not in g:
-                                                relations_schema_mismatches.append(
-                                                    f"{filename}: ObjectProperty Mismatch ({subj_col} -[{prop_key}]-> {obj_target})"
-                                                )
-
-                                    # --- CASE 2: Datatype Property (Entity -> Literal Value) ---
-                                    elif prop_type == "Datatype Property" or "DatatypeProperty" in str(prop_type):
-                                        # Check if s_uri has ANY triple with predicate p_uri in graph g
-                                        # or explicitly match against the parsed literal value
-                                        val = g.value(s_uri, p_uri)
-                                        if val is None:
-                                            relations_schema_mismatches.append(
-                                                f"{filename}: Missing DatatypeProperty ({subj_col} -[{prop_key}]-> Literal)"
-                                            )
-                    
-                    parsed_files_count += 1
+                # 1. Extract Values (Native Python type if Literal, else String/URI)
+                row = {entry.label: entry.value for entry in columns}
 
-                    row["__source_file__"] = filename
-                    data_rows.append(row)
+                # 2. Reconstruct Template Metadata from the first file defining each column
+                if not row.keys() <= template_items.keys():
+                    for entry in columns:
+                        label = entry.label
+                        if label in template_items:
+                            continue
+                        if metadata_template:
+                            warnings.warn(f"⚠️ Discovery Warning: File {filename} contains column '{label}' not found in provided template.")
+
+                        template_origins[label] = filename
+                        template_items[label] = {
+                            "@id": entry.semantic_type,
+                            "@type": entry.semantic_type,
+                            "skos:altLabel": label,
+                            "skos:definition": entry.definition,
+                            "qudt:hasUnit": {"@id": entry.unit_uri},
+                            "mds:hasStudyStage": entry.study_stage
+                        }
+
+                for predicate, pairs in record.relations.items():
+                    # Only IRIs can match a column subject, other terms are kept as None
+                    triple_rows.extend((file_no, str(predicate),
+                                        str(s) if type(s) is URIRef else None,
+                                        str(o) if type(o) is URIRef else None) for s, o in pairs)
+                column_entries.extend(columns)
+                entry_counts.append(len(columns))
+                filenames.append(filename)
+
+                row["__source_file__"] = filename
+                data_rows.append(row)
 
-                except Exception as e:
-                    print(f"❌ Error parsing {filename}: {e}")
+            except Exception as e:
+                print(f"❌ Error parsing {filename}: {e}")
+
+        if record_cache is not None:
+            record_cache.save()
+            print(f"♻️ RDF cache saved to: {cache_dir}")
+
+        findings = validate_import(
+            entries=entries_frame(column_entries, entry_counts, filenames),
+            triples=pd.DataFrame(triple_rows, columns=["file_no", "predicate", "subject", "object"], dtype=object),
+            expected_metadata=expected_metadata,
+            relations_table=relations_table,
+            subjects={label: item["@id"] for label, item in template_items.items()}
+        )
+        messages = finding_messages(findings)
+        type_mismatches = messages[findings["kind"] == "type"].tolist()
+        unit_conflicts = messages[findings["kind"] == "unit"].tolist()
+        relations_schema_mismatches = messages[findings["kind"].isin(["object_relation", "datatype_relation"])].tolist()
 
         if len(relations_schema_mismatches) > 0:
             warnings.warn(f"Schema Integrity Warning: {len(relations_schema_mismatches)} mismatches found.")
@@ -1470,7 +1628,7 @@ class MatDatSciDf:
         }
 
         if metadata_template:
-            return cls(
+            reconstructed = cls(
                 df=df_clean,
                 metadata_template=metadata_template,
                 orcid=orcid,
@@ -1480,7 +1638,7 @@ class MatDatSciDf:
                 base_uri=base_uri
             )
         else:
-            return cls(
+            reconstructed = cls(
                 df=df_clean,
                 metadata_template=recon_template,
                 orcid=orcid,
@@ -1489,6 +1647,8 @@ class MatDatSciDf:
                 ontology_graph=ontology_graph,
                 base_uri=base_uri
             )
+        reconstructed.import_findings = findings
+        return reconstructed
 
     @classmethod
     def from_jsonld_list(cls, 
@@ -1618,7 +1778,7 @@ class MatDatSciDf:
         relations_output_path = os.path.join(output_dir, f"{output_base_name}_relations")
         
         # 1. Standardize column order: Alphabetical + __source_file__ at the end
-        helper_cols = ["__source_file__", "__rowkey__", "__Label__"]
+        helper_cols = ["__source_file__", "__rowkey__", "__Label__", STORED_ROW_KEY_COLUMN]
         cols = [col for col in df.columns if col not in helper_cols]
         cols.sort()
         existing_helpers = [h for h in helper_cols if h in df.columns]
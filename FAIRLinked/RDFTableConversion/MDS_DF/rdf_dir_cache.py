@@ -0,0 +1,295 @@
+import os
+import json
+import hashlib
+import warnings
+from typing import Callable, Iterable, Optional
+import pandas as pd
+from rdflib import Literal, URIRef
+from rdflib.util import from_n3
+
+from .rdf_dir_reader import ColumnEntry, RDFRecord
+
+
+CACHE_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+COLUMNS_FILE = "columns.parquet"
+RELATIONS_FILE = "relations.parquet"
+
+COLUMN_FIELDS = [
+    "file", "label", "kind", "value", "value_int", "value_float", "value_bool",
+    "datatype", "lang", "semantic_type", "unit_uri", "definition", "study_stage"
+]
+RELATION_FIELDS = ["file", "predicate", "subject", "object"]
+
+
+def file_sha256(path: str) -> str:
+    """Returns the SHA-256 hex digest of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+#### VALUE ENCODING ####
+
+def encode_value(value) -> Optional[dict]:
+    """
+    Encodes a column value of an `RDFRecord` into the typed fields of a cache row.
+
+    Values are kept as native Parquet types where possible (str, int64, double,
+    bool). Other values (Decimal, dates, big integers, ill-typed literals, ...)
+    are stored as the lexical form and datatype of their RDF literal and turned
+    back into the same Python value by rdflib when decoded.
+
+    Returns:
+        dict: The value fields of the cache row, or None if the value does not
+            survive the round trip (the file is then not cached).
+    """
+    kind = type(value)
+    if value is pd.NA:
+        return {"kind": "na"}
+    if kind is str:
+        return {"kind": "str", "value": value}
+    if kind is bool:
+        return {"kind": "bool", "value_bool": value}
+    if kind is int and -2**63 <= value < 2**63:
+        return {"kind": "int", "value_int": value}
+    if kind is float:
+        return {"kind": "float", "value_float": value}
+    if isinstance(value, Literal):
+        # Literal that rdflib could not convert, kept as is
+        return {"kind": "literal", "value": str(value),
+                "datatype": str(value.datatype) if value.datatype else None,
+                "lang": value.language}
+    try:
+        literal = Literal(value)
+        decoded = Literal(str(literal), datatype=literal.datatype).toPython()
+    except Exception:
+        return None
+    if type(decoded) is not kind or decoded != value or literal.datatype is None:
+        return None
+    return {"kind": "typed", "value": str(literal), "datatype": str(literal.datatype)}
+
+
+def decode_value(kind, value, value_int, value_float, value_bool, datatype, lang):
+    """Inverse of `encode_value`."""
+    if kind == "str":
+        return value
+    if kind == "float":
+        return float(value_float)
+    if kind == "int":
+        return int(value_int)
+    if kind == "na":
+        return pd.NA
+    if kind == "bool":
+        return bool(value_bool)
+    if kind == "typed":
+        return Literal(value, datatype=datatype).toPython()
+    return Literal(value, datatype=datatype if isinstance(datatype, str) else None,
+                   lang=lang if isinstance(lang, str) else None)
+
+
+def _decode_term(text: str):
+    if text.startswith("<") and text.endswith(">"):
+        return URIRef(text[1:-1])
+    return from_n3(text)
+
+
+#### CACHE ####
+
+class RDFRecordCache:
+    """
+    Sidecar cache of the `RDFRecord`s of a directory of RDF files.
+
+    The cache directory holds a manifest ('manifest.json': relative path, size,
+    modification time and SHA-256 of every cached file) and the records of these
+    files as Parquet ('columns.parquet' and 'relations.parquet'). `read` gives the
+    records of a file listing, parsing only files that are new or whose content
+    changed, and `save` writes the cache back for the files of the last `read`,
+    which drops deleted files.
+
+    A file whose size and modification time are unchanged is reused without being
+    read. If either changed, its SHA-256 decides, so that a file copied or touched
+    without edits is not parsed again. Files that failed to parse are not cached.
+
+    Relation pairs are only cached for the predicates the cache was built with;
+    asking for other predicates rebuilds the cache.
+
+    Args:
+        cache_dir (str): Directory of the cache files. Created on `save`.
+        input_dir (str): Directory the file paths are relative to.
+        predicates (tuple): Predicates whose relation pairs are needed.
+    """
+
+    def __init__(self, cache_dir: str, input_dir: str, predicates: tuple = ()):
+        self.cache_dir = cache_dir
+        self.input_dir = input_dir
+        self.predicates = tuple(str(p) for p in predicates)
+
+        self.reused = 0
+        self.parsed = 0
+        self.dropped = 0
+
+        self._entries = {}
+        self._manifest = {}
+        self._kept_rows = None
+        self._new_columns = []
+        self._new_relations = []
+
+        manifest_path = os.path.join(cache_dir, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            warnings.warn(f"⚠️ Ignoring unreadable RDF cache manifest {manifest_path}: {e}")
+            return
+        if manifest.get("version") != CACHE_VERSION:
+            print(f"♻️ RDF cache at {cache_dir} is from another version, rebuilding it.")
+            return
+        if not set(self.predicates) <= set(manifest.get("predicates", [])):
+            print(f"♻️ RDF cache at {cache_dir} lacks relation predicates, rebuilding it.")
+            return
+        self._manifest = manifest.get("files", {})
+
+    def _lookup(self, path: str, rel: str) -> Optional[dict]:
+        # Returns the new manifest entry of a file: reused if "cached" is set
+        st = os.stat(path)
+        entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        old = self._manifest.get(rel)
+        if old and old["size"] == entry["size"] and old["mtime_ns"] == entry["mtime_ns"]:
+            return dict(old, cached=True)
+        entry["sha256"] = file_sha256(path)
+        return dict(entry, cached=bool(old) and old["sha256"] == entry["sha256"])
+
+    def _load(self, keep: set) -> dict:
+        # Cached records of the files in `keep`, by relative path
+        records = {rel: RDFRecord(os.path.basename(rel), [], {}) for rel in keep}
+        if not keep:
+            return records
+        try:
+            columns = pd.read_parquet(os.path.join(self.cache_dir, COLUMNS_FILE))
+            relations = pd.read_parquet(os.path.join(self.cache_dir, RELATIONS_FILE))
+        except Exception as e:
+            warnings.warn(f"⚠️ Ignoring unreadable RDF cache in {self.cache_dir}: {e}")
+            return None
+
+        columns = columns[columns["file"].isin(keep)]
+        relations = relations[relations["file"].isin(keep) & relations["predicate"].isin(self.predicates)]
+        self._kept_rows = (columns, relations)
+
+        arrays = [columns[field].to_numpy(dtype=object) for field in COLUMN_FIELDS]
+        for rel, label, kind, value, v_int, v_float, v_bool, datatype, lang, \
+                semantic_type, unit_uri, definition, study_stage in zip(*arrays):
+            records[rel].columns.append(ColumnEntry(
+                label=label,
+                value=decode_value(kind, value, v_int, v_float, v_bool, datatype, lang),
+                semantic_type=semantic_type,
+                unit_uri=unit_uri,
+                definition=definition,
+                study_stage=study_stage
+            ))
+
+        for rel in keep:
+            records[rel].relations.update({URIRef(p): set() for p in self.predicates})
+        arrays = [relations[field].to_numpy(dtype=object) for field in RELATION_FIELDS]
+        for rel, predicate, subj, obj in zip(*arrays):
+            pairs = records[rel].relations.get(URIRef(predicate))
+            if pairs is not None:
+                pairs.add((_decode_term(subj), _decode_term(obj)))
+        return records
+
+    def _encode(self, rel: str, record: RDFRecord) -> bool:
+        # Adds the rows of a parsed record to the new cache content
+        rows = []
+        for entry in record.columns:
+            fields = encode_value(entry.value)
+            if fields is None:
+                return False
+            rows.append(dict(fields, file=rel, label=entry.label,
+                             semantic_type=entry.semantic_type, unit_uri=entry.unit_uri,
+                             definition=entry.definition, study_stage=entry.study_stage))
+        self._new_columns.extend(rows)
+        for predicate, pairs in record.relations.items():
+            self._new_relations.extend(
+                {"file": rel, "predicate": str(predicate), "subject": s.n3(), "object": o.n3()}
+                for s, o in pairs
+            )
+        return True
+
+    def read(self, files: list, reader: Callable[[list], Iterable[RDFRecord]]):
+        """
+        Gives the records of `files`, from the cache or parsed by `reader`.
+
+        Args:
+            files (list): (path, filename) tuples, see `list_rdf_files`.
+            reader (callable): Called once with the (path, filename) tuples to
+                parse; must yield their records in the same order, e.g. a partial
+                of `read_rdf_records`.
+
+        Yields:
+            RDFRecord: One record per file, in the order of `files`.
+        """
+        self._entries = {}
+        self._new_columns, self._new_relations = [], []
+        self._kept_rows = (pd.DataFrame(columns=COLUMN_FIELDS), pd.DataFrame(columns=RELATION_FIELDS))
+
+        plan = []
+        for path, filename in files:
+            rel = os.path.relpath(path, self.input_dir).replace(os.sep, "/")
+            entry = self._lookup(path, rel)
+            plan.append((path, filename, rel, entry))
+
+        cached = self._load({rel for _, _, rel, entry in plan if entry["cached"]})
+        if cached is None:
+            cached = {}
+            for item in plan:
+                item[3]["cached"] = False
+                item[3].setdefault("sha256", file_sha256(item[0]))
+
+        todo = [(path, filename) for path, filename, _, entry in plan if not entry["cached"]]
+        self.reused = len(plan) - len(todo)
+        self.parsed = len(todo)
+        self.dropped = len(set(self._manifest) - {rel for _, _, rel, _ in plan})
+        print(f"♻️ RDF cache: {self.reused} files unchanged, {self.parsed} new or changed, {self.dropped} removed.")
+
+        parsed = iter(reader(todo))
+        for path, filename, rel, entry in plan:
+            cached_flag = entry.pop("cached")
+            if cached_flag:
+                self._entries[rel] = entry
+                yield cached[rel]._replace(filename=filename)
+                continue
+            record = next(parsed)
+            if record.error is None and self._encode(rel, record):
+                self._entries[rel] = entry
+            yield record
+
+    def save(self):
+        """Writes the manifest and records of the files of the last `read`."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        kept_columns, kept_relations = self._kept_rows
+        columns = pd.concat([kept_columns, pd.DataFrame(self._new_columns, columns=COLUMN_FIELDS)], ignore_index=True)
+        relations = pd.concat([kept_relations, pd.DataFrame(self._new_relations, columns=RELATION_FIELDS)], ignore_index=True)
+
+        columns["value_int"] = columns["value_int"].astype("Int64")
+        columns["value_float"] = columns["value_float"].astype("float64")
+        columns["value_bool"] = columns["value_bool"].astype("boolean")
+        for field in COLUMN_FIELDS:
+            if field not in ("value_int", "value_float", "value_bool"):
+                columns[field] = columns[field].astype(object)
+        relations = relations.astype(object)
+
+        # Records first and the manifest last, each replaced atomically
+        for frame, name in ((columns, COLUMNS_FILE), (relations, RELATIONS_FILE)):
+            target = os.path.join(self.cache_dir, name)
+            frame.to_parquet(target + ".tmp", index=False)
+            os.replace(target + ".tmp", target)
+
+        manifest = {"version": CACHE_VERSION, "predicates": list(self.predicates), "files": self._entries}
+        target = os.path.join(self.cache_dir, MANIFEST_FILE)
+        with open(target + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(target + ".tmp", target)
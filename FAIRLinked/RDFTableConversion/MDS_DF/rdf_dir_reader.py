@@ -0,0 +1,393 @@
+import os
+import re
+import json
+from functools import partial
+from typing import NamedTuple, Optional
+import pandas as pd
+from rdflib import Graph, Literal, Namespace, URIRef
+from rdflib.namespace import RDF, XSD
+from tqdm import tqdm
+from ..parallel import run_ordered
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+RDF_EXTENSIONS = {
+    ".jsonld": "json-ld", ".ttl": "turtle",
+    ".nt": "nt", ".rdf": "xml", ".xml": "xml"
+}
+
+MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
+QUDT = Namespace("http://qudt.org/schema/qudt/")
+UNIT = Namespace("https://qudt.org/vocab/unit/")
+SKOS = Namespace("http://www.w3.org/2004/02/skos/core#")
+
+
+class ColumnEntry(NamedTuple):
+    """One data column entity of an RDF file, see `read_rdf_record`."""
+    label: str
+    value: object
+    semantic_type: str
+    unit_uri: str
+    definition: str
+    study_stage: str
+
+
+class RDFRecord(NamedTuple):
+    """
+    Compact content of one RDF file, as needed by `MatDatSciDf.from_rdf_dir`.
+
+    Attributes:
+        filename (str): Name of the file.
+        columns (list[ColumnEntry]): The column entities, in graph order.
+        relations (dict): Predicate → set of (subject, object) pairs found in the
+            file, for the predicates asked for.
+        error (str): The parse error, if the file could not be read. `columns`
+            and `relations` are empty then.
+    """
+    filename: str
+    columns: list
+    relations: dict
+    error: Optional[str] = None
+
+
+def list_rdf_files(input_dir: str) -> list:
+    """
+    Lists the supported RDF files below `input_dir`, in `os.walk` order.
+
+    Returns:
+        list: (path, filename) tuples.
+    """
+    found = []
+    for root, _, files in os.walk(input_dir):
+        for filename in files:
+            if os.path.splitext(filename)[1].lower() in RDF_EXTENSIONS:
+                found.append((os.path.join(root, filename), filename))
+    return found
+
+
+#### FAST JSON-LD PATH ####
+
+class _NotInProfile(Exception):
+    """The JSON-LD document is not in the shape written by `serialize_row`."""
+
+
+_SCHEME = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+_CONTEXT_CACHE = {}
+
+
+class _CompactContext:
+    """
+    A plain prefix → namespace `@context`, with the namespace bindings rdflib
+    would give a graph parsed with it. Shared by every file with the same context.
+    """
+
+    def __init__(self, context: dict):
+        self.prefixes = context
+        # Let rdflib bind the context's prefixes exactly as when parsing a file
+        g = Graph()
+        g.parse(data=json.dumps({"@context": context, "@graph": []}), format="json-ld")
+        g.bind("mds", MDS)
+        g.bind("qudt", QUDT)
+        g.bind("unit", UNIT)
+        g.bind("skos", SKOS)
+        self.namespace_manager = g.namespace_manager
+        self._curies = {}
+        self._iris = {}
+
+    @classmethod
+    def get(cls, context) -> "_CompactContext":
+        if not isinstance(context, dict):
+            raise _NotInProfile("context is not a plain mapping")
+        key = json.dumps(context, sort_keys=True)
+        entry = _CONTEXT_CACHE.get(key)
+        if entry is None:
+            for prefix, iri in context.items():
+                if prefix.startswith("@") or not isinstance(iri, str) or not _SCHEME.match(iri):
+                    raise _NotInProfile(f"context entry '{prefix}' is not a prefix")
+            entry = _CONTEXT_CACHE[key] = cls(context)
+        return entry
+
+    def iri(self, value) -> str:
+        # Expands a CURIE or absolute IRI; anything else is left to rdflib
+        iri = self._iris.get(value)
+        if iri is None:
+            if not isinstance(value, str):
+                raise _NotInProfile("IRI is not a string")
+            prefix, sep, local = value.partition(":")
+            if sep and prefix in self.prefixes and not local.startswith("//"):
+                iri = self.prefixes[prefix] + local
+            elif _SCHEME.match(value) and prefix != "_":
+                iri = value
+            else:
+                raise _NotInProfile(f"cannot expand '{value}'")
+            self._iris[value] = iri
+        return iri
+
+    def curie(self, iri: str) -> str:
+        curie = self._curies.get(iri)
+        if curie is None:
+            try:
+                curie = self.namespace_manager.curie(iri, generate=False)
+            except (KeyError, ValueError):
+                # rdflib would mint a new prefix for this file
+                raise _NotInProfile(f"no prefix for '{iri}'")
+            self._curies[iri] = curie
+        return curie
+
+
+def _single(node: dict, key: str):
+    value = node.get(key)
+    if isinstance(value, list):
+        raise _NotInProfile(f"several values for '{key}'")
+    return value
+
+
+def _to_term(value, ctx: _CompactContext):
+    # Mirrors rdflib's JSON-LD parser for a context without term definitions
+    if isinstance(value, dict):
+        if set(value) == {"@id"}:
+            return URIRef(ctx.iri(value["@id"]))
+        if "@value" not in value or not set(value) <= {"@value", "@type", "@language"}:
+            raise _NotInProfile("unsupported value object")
+        if value["@value"] is None:
+            return None
+        if "@language" in value:
+            return Literal(value["@value"], lang=value["@language"])
+        if "@type" in value:
+            return Literal(value["@value"], datatype=URIRef(ctx.iri(value["@type"])))
+        return Literal(value["@value"])
+    if value is None:
+        return None
+    if isinstance(value, float):
+        return Literal(value, datatype=XSD.double)
+    if isinstance(value, (str, int)):
+        return Literal(value)
+    raise _NotInProfile("unsupported value")
+
+
+def _plain_string(node: dict, key: str):
+    value = _single(node, key)
+    if value is not None and not isinstance(value, str):
+        raise _NotInProfile(f"'{key}' is not a plain string")
+    return value
+
+
+def _read_jsonld_fast(path: str, filename: str, predicates: tuple) -> RDFRecord:
+    """
+    Reads a JSON-LD file written by `serialize_row` without building an rdflib graph.
+
+    Raises:
+        _NotInProfile: If the file is not in that shape; it is then read with rdflib.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    try:
+        doc = orjson.loads(data) if orjson is not None else json.loads(data)
+    except Exception:
+        raise _NotInProfile("not parsable as JSON")
+
+    if not isinstance(doc, dict) or "@context" not in doc:
+        raise _NotInProfile("no top-level @context")
+    ctx = _CompactContext.get(doc["@context"])
+    if "@graph" in doc:
+        if set(doc) != {"@context", "@graph"} or not isinstance(doc["@graph"], list):
+            raise _NotInProfile("unsupported top-level keys")
+        nodes = doc["@graph"]
+    else:
+        nodes = [{k: v for k, v in doc.items() if k != "@context"}]
+
+    wanted = {str(p): p for p in predicates}
+    columns = []
+    relations = {p: set() for p in predicates}
+    seen = set()
+    for node in nodes:
+        if not isinstance(node, dict) or not isinstance(node.get("@id"), str):
+            raise _NotInProfile("node without @id")
+
+        # Expand the keys once; each property must occur under one key only
+        props = {}
+        for key, value in node.items():
+            if key == "@id":
+                continue
+            if key == "@type":
+                iri = str(RDF.type)
+            elif key.startswith("@"):
+                raise _NotInProfile(f"unsupported keyword '{key}'")
+            else:
+                iri = ctx.iri(key)
+            if iri in props:
+                raise _NotInProfile(f"property '{iri}' given twice")
+            props[iri] = key
+            # Nested nodes and lists would add subjects of their own
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, (dict, list)) and not (
+                        isinstance(item, dict) and (set(item) == {"@id"} or "@value" in item)):
+                    raise _NotInProfile(f"nested value for '{key}'")
+
+        subj = URIRef(ctx.iri(node["@id"]))
+        if subj in seen:
+            raise _NotInProfile(f"node '{subj}' given twice")
+        seen.add(subj)
+
+        for iri, key in props.items():
+            if iri in wanted:
+                values = node[key] if isinstance(node[key], list) else [node[key]]
+                for value in values:
+                    obj = URIRef(ctx.iri(value)) if key == "@type" else _to_term(value, ctx)
+                    if obj is not None:
+                        relations[wanted[iri]].add((subj, obj))
+
+        label_key = props.get(str(SKOS.altLabel))
+        if label_key is None:
+            continue
+        label = _plain_string(node, label_key)
+        if label is None:
+            continue
+
+        val_key = props.get(str(QUDT.value))
+        val = _to_term(_single(node, val_key), ctx) if val_key else None
+        if val is not None:
+            value = val.toPython() if isinstance(val, Literal) else str(val)
+        else:
+            value = pd.NA
+
+        type_key = props.get(str(RDF.type))
+        semantic_type = ctx.iri(_single(node, type_key)) if type_key else ""
+
+        unit_key = props.get(str(QUDT.hasUnit))
+        unit = _single(node, unit_key) if unit_key else None
+        if not (isinstance(unit, dict) and set(unit) == {"@id"}):
+            raise _NotInProfile("qudt:hasUnit is not a single IRI")
+        unit_uri = ctx.curie(ctx.iri(unit["@id"]))
+
+        def_key = props.get(str(SKOS.definition))
+        stage_key = props.get(str(MDS.hasStudyStage))
+        columns.append(ColumnEntry(
+            label=label.strip(),
+            value=value,
+            semantic_type=semantic_type,
+            unit_uri=unit_uri,
+            definition=(_plain_string(node, def_key) if def_key else None) or "",
+            study_stage=(_plain_string(node, stage_key) if stage_key else None) or ""
+        ))
+
+    return RDFRecord(filename, columns, relations)
+
+
+def read_rdf_record(path: str, filename: str, predicates: tuple = (), fast_jsonld: bool = True) -> RDFRecord:
+    """
+    Parses one RDF file and extracts its column entities and relation triples.
+
+    JSON-LD files in the shape written by `serialize_row` (a plain prefix
+    `@context` and a `@graph` of column nodes) are read with `json` (or `orjson`
+    if installed) directly. Any other file is parsed with rdflib; both give the
+    same record.
+
+    Args:
+        path (str): Path of the file.
+        filename (str): Name reported for the file.
+        predicates (tuple): Predicates whose (subject, object) pairs are collected.
+        fast_jsonld (bool, optional): Use the direct JSON-LD reader when the file
+            allows it. Defaults to True.
+
+    Returns:
+        RDFRecord: The file's record. Parse errors are returned in `error`
+            instead of raised.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if fast_jsonld and RDF_EXTENSIONS.get(ext) == "json-ld":
+        try:
+            return _read_jsonld_fast(path, filename, predicates)
+        except _NotInProfile:
+            pass
+        except OSError as e:
+            return RDFRecord(filename, [], {}, str(e))
+    try:
+        g = Graph()
+        g.parse(path, format=RDF_EXTENSIONS[ext])
+        # PRE-BIND NAMESPACES BEFORE PARSING
+        g.bind("mds", MDS)
+        g.bind("qudt", QUDT)
+        g.bind("unit", UNIT)
+        g.bind("skos", SKOS)
+
+        columns = []
+        # Process every entity that represents a data column
+        for subj in g.subjects(SKOS.altLabel, None):
+            label = str(g.value(subj, SKOS.altLabel)).strip()
+            val = g.value(subj, QUDT.value)
+            unit_node = g.value(subj, QUDT.hasUnit)
+
+            # Native Python type if Literal, else String/URI
+            if val is not None:
+                value = val.toPython() if isinstance(val, Literal) else str(val)
+            else:
+                value = pd.NA
+
+            columns.append(ColumnEntry(
+                label=label,
+                value=value,
+                semantic_type=str(g.value(subj, RDF.type) or ""),
+                unit_uri=g.namespace_manager.curie(str(unit_node) if unit_node else ""),
+                definition=str(g.value(subj, SKOS.definition) or ""),
+                study_stage=str(g.value(subj, MDS.hasStudyStage) or "")
+            ))
+
+        relations = {p: set(g.subject_objects(p)) for p in predicates}
+    except Exception as e:
+        return RDFRecord(filename, [], {}, str(e))
+    return RDFRecord(filename, columns, relations)
+
+
+def _read_chunk(files: list, predicates: tuple, fast_jsonld: bool) -> list:
+    # Runs in a worker, see `read_rdf_records`
+    return [read_rdf_record(path, filename, predicates, fast_jsonld) for path, filename in files]
+
+
+def read_rdf_records(files: list, predicates: tuple = (), workers: int = 1, chunk_size: Optional[int] = None, desc: str = "Reading RDF files", fast_jsonld: bool = True):
+    """
+    Reads RDF files into `RDFRecord`s, in a pool of `workers` processes if more than one.
+
+    Files are sent to workers in contiguous chunks of `chunk_size` and records are
+    yielded in the order of `files`, whatever the number of workers, and warnings
+    raised in the workers are replayed in the same order. A single tqdm bar counts
+    the files of all workers.
+
+    Args:
+        files (list): (path, filename) tuples, see `list_rdf_files`.
+        predicates (tuple): Predicates whose (subject, object) pairs are collected.
+        workers (int, optional): Number of worker processes. Defaults to 1.
+        chunk_size (int, optional): Files per chunk sent to a worker. Defaults to
+            about four chunks per worker, at most 256 files.
+        desc (str, optional): Label of the progress bar.
+        fast_jsonld (bool, optional): See `read_rdf_record`. Defaults to True.
+
+    Yields:
+        RDFRecord: One record per file.
+    """
+    progress = tqdm(total=len(files), desc=desc)
+    try:
+        if workers <= 1:
+            for path, filename in files:
+                yield read_rdf_record(path, filename, predicates, fast_jsonld)
+                progress.update(1)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        if chunk_size is None:
+            chunk_size = max(1, min(256, -(-len(files) // (workers * 4))))
+        chunks = (files[i:i + chunk_size] for i in range(0, len(files), chunk_size))
+
+        read_chunk = partial(_read_chunk, predicates=predicates, fast_jsonld=fast_jsonld)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for records in run_ordered(pool, chunks, read_chunk, workers):
+                for record in records:
+                    progress.update(1)
+                    yield record
+    finally:
+        progress.close()
@@ -0,0 +1,191 @@
+from operator import attrgetter
+import numpy as np
+import pandas as pd
+
+
+FINDING_COLUMNS = ["file", "column", "kind", "expected", "actual", "reference"]
+
+FINDING_KINDS = ("type", "unit", "object_relation", "datatype_relation")
+
+
+def entries_frame(entries: list, counts: list, filenames: list) -> pd.DataFrame:
+    """
+    Gathers the column entities of all files of an import in one DataFrame.
+
+    Args:
+        entries (list[ColumnEntry]): The column entities of all files, file after file.
+        counts (list[int]): Number of entities of each file.
+        filenames (list[str]): Name of each file.
+
+    Returns:
+        pd.DataFrame: One row per entity, in read order, with 'file_no', 'file',
+            'label', 'has_value', 'semantic_type' and 'unit_uri'.
+    """
+    # Kept as object columns: the checks compare Python strings
+    columns = {}
+    for name in ("label", "value", "semantic_type", "unit_uri"):
+        values = np.empty(len(entries), dtype=object)
+        values[:] = list(map(attrgetter(name), entries))
+        columns[name] = values
+    file_no = np.repeat(np.arange(len(counts)), counts)
+    has_value = np.fromiter((value is not pd.NA for value in columns.pop("value")), dtype=bool, count=len(entries))
+    frame = pd.DataFrame({"file": np.asarray(filenames, dtype=object)[file_no], **columns}, dtype=object)
+    frame.insert(0, "file_no", file_no)
+    frame.insert(3, "has_value", has_value)
+    return frame
+
+
+def _truthy(mapping: dict) -> dict:
+    return {label: value for label, value in mapping.items() if value}
+
+
+def column_findings(entries: pd.DataFrame, expected_metadata: dict) -> pd.DataFrame:
+    """
+    Checks the type and unit of every column entity of an import.
+
+    With `expected_metadata`, entities are checked against the template;
+    otherwise against the entity of the file that first defined their column
+    (an empty unit is not a conflict then).
+
+    Args:
+        entries (pd.DataFrame): See `entries_frame`.
+        expected_metadata (dict): Label → {"type": ..., "unit": ...} from the template.
+
+    Returns:
+        pd.DataFrame: Type findings then unit findings, each in read order.
+    """
+    # Expectations are looked up once per distinct label and broadcast
+    codes, labels = pd.factorize(entries["label"])
+    types = entries["semantic_type"].to_numpy(dtype=object)
+    units = entries["unit_uri"].to_numpy(dtype=object)
+
+    if expected_metadata:
+        per_label = [expected_metadata.get(label, {}) for label in labels]
+        expected_type = np.array([m.get("type") or None for m in per_label] + [None], dtype=object)[codes]
+        expected_unit = np.array([m.get("unit") or None for m in per_label] + [None], dtype=object)[codes]
+        reference = np.full(len(entries), "template", dtype=object)
+        type_bad = (expected_type != None) & (types != expected_type)  # noqa: E711
+        unit_bad = (expected_unit != None) & (units != expected_unit)  # noqa: E711
+    else:
+        _, first = np.unique(codes, return_index=True)
+        first = first[codes]
+        expected_type, expected_unit = types[first], units[first]
+        reference = entries["file"].to_numpy(dtype=object)[first]
+        type_bad = types != expected_type
+        unit_bad = (units != expected_unit) & (units != "")
+
+    frames = []
+    for kind, expected, actual, mask in (("type", expected_type, types, type_bad),
+                                         ("unit", expected_unit, units, unit_bad)):
+        mask = mask.astype(bool)
+        frames.append(pd.DataFrame({
+            "file": entries["file"].to_numpy(dtype=object)[mask],
+            "column": entries["label"].to_numpy(dtype=object)[mask],
+            "kind": kind,
+            "expected": expected[mask],
+            "actual": actual[mask],
+            "reference": reference[mask],
+        }, columns=FINDING_COLUMNS))
+    return pd.concat(frames, ignore_index=True)
+
+
+def relation_findings(entries: pd.DataFrame, triples: pd.DataFrame, relations_table: list, subjects: dict) -> pd.DataFrame:
+    """
+    Checks the expected relations of every file of an import.
+
+    A relation is expected in a file when its subject column has a value there
+    (and, for object properties, its object column too). Object properties need
+    the (subject, object) triple, datatype properties any triple of the subject.
+
+    Args:
+        entries (pd.DataFrame): See `entries_frame`.
+        triples (pd.DataFrame): 'file_no', 'predicate', 'subject' and 'object' of
+            the relation triples found in the files, as IRI strings (None for
+            terms that are not IRIs).
+        relations_table (list): The resolved relations, see `resolve_relations`.
+        subjects (dict): Label → subject IRI of every column.
+
+    Returns:
+        pd.DataFrame: Relation findings, by file and then in relations order.
+    """
+    if not relations_table:
+        return pd.DataFrame(columns=FINDING_COLUMNS)
+
+    # A column has a value in a file if its last entity there has one
+    used = {col for relation in relations_table for pair in relation.pairs for col in pair[:2]}
+    present = entries[entries["label"].isin(used)].drop_duplicates(["file_no", "label"], keep="last")
+    present = present[present["has_value"]]
+    files_with = {label: pd.Index(group) for label, group in present.groupby("label", sort=False)["file_no"]}
+    no_files = pd.Index([], dtype=int)
+
+    frames = []
+    for r, relation in enumerate(relations_table):
+        found = triples[triples["predicate"] == str(relation.predicate)]
+        for k, (subj_col, obj_target, _, _) in enumerate(relation.pairs):
+            files = files_with.get(subj_col, no_files)
+            if files.empty:
+                continue
+            hits = found["subject"] == str(subjects[subj_col])
+            if relation.prop_type == "Object Property":
+                files = files.intersection(files_with.get(obj_target, no_files), sort=False)
+                if files.empty:
+                    continue
+                hits &= found["object"] == str(subjects[obj_target])
+                kind, expected = "object_relation", obj_target
+            else:
+                kind, expected = "datatype_relation", "Literal"
+            missing = files[~files.isin(found.loc[hits, "file_no"])]
+            frames.append(pd.DataFrame({
+                "file_no": missing, "relation": r, "pair": k, "column": subj_col, "kind": kind,
+                "expected": expected, "actual": None, "reference": relation.prop_key,
+            }))
+
+    if not frames:
+        return pd.DataFrame(columns=FINDING_COLUMNS)
+    findings = pd.concat(frames, ignore_index=True).sort_values(["file_no", "relation", "pair"], kind="stable")
+    files = entries.drop_duplicates("file_no").set_index("file_no")["file"]
+    findings["file"] = findings["file_no"].map(files)
+    return findings[FINDING_COLUMNS].reset_index(drop=True)
+
+
+def validate_import(entries: pd.DataFrame, triples: pd.DataFrame, expected_metadata: dict,
+                    relations_table: list, subjects: dict) -> pd.DataFrame:
+    """
+    Runs all checks of an import and gathers their findings.
+
+    Args:
+        entries (pd.DataFrame): See `entries_frame`.
+        triples (pd.DataFrame): See `relation_findings`.
+        expected_metadata (dict): See `column_findings`.
+        relations_table (list): See `relation_findings`.
+        subjects (dict): See `relation_findings`.
+
+    Returns:
+        pd.DataFrame: One row per finding with 'file', 'column', 'kind' (one of
+            FINDING_KINDS), 'expected', 'actual' and 'reference' (what the
+            expectation comes from: "template", the file that first defined the
+            column, or the relation's property key). Findings are grouped by
+            kind, in file order within each kind.
+    """
+    findings = pd.concat([
+        column_findings(entries, expected_metadata),
+        relation_findings(entries, triples, relations_table, subjects),
+    ], ignore_index=True)
+    return findings.astype(object)
+
+
+def _message(file, column, kind, expected, actual, reference) -> str:
+    if kind == "object_relation":
+        return f"{file}: ObjectProperty Mismatch ({column} -[{reference}]-> {expected})"
+    if kind == "datatype_relation":
+        return f"{file}: Missing DatatypeProperty ({column} -[{reference}]-> Literal)"
+    name = "Type" if kind == "type" else "Unit"
+    if reference == "template":
+        return f"{file}: {column} {name} is '{actual}' (Expected '{expected}')"
+    return f"{file}: {name} mismatch for '{column}' vs {reference}"
+
+
+def finding_messages(findings: pd.DataFrame) -> pd.Series:
+    """Renders findings (rows of `validate_import`) as their lines of the import report."""
+    rows = zip(*(findings[col].tolist() for col in FINDING_COLUMNS))
+    return pd.Series([_message(*row) for row in rows], index=findings.index, dtype=object)
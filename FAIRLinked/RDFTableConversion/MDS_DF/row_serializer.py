@@ -0,0 +1,428 @@
+import os
+import gzip
+import json
+import warnings
+from datetime import datetime, timezone
+from urllib.parse import quote
+import pandas as pd
+from rdflib import Graph, Dataset, URIRef, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, SKOS, DCTERMS
+from .serialization_plan import SerializationPlan, string_literal
+from ..parallel import run_ordered
+
+
+QUDT = Namespace("http://qudt.org/schema/qudt/")
+MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
+OBO = Namespace("http://purl.obolibrary.org/obo/")
+BFO_ENTITY = OBO.BFO_0000001
+ROW_PREDICATE = URIRef("https://cwrusdle.bitbucket.io/mds/row")
+STREAM_FORMATS = ("nt", "nquads")
+
+
+def remap_unknown_types(data_graph: Graph, ref_classes: frozenset, type_remap: dict, counts: dict) -> Graph:
+    """
+    Remaps every rdf:type of `data_graph` that is not in `ref_classes` to obo:BFO_0000001.
+
+    Args:
+        data_graph (rdflib.Graph): The graph whose rdf:type triples are checked.
+        ref_classes (frozenset): The classes declared in the reference ontology.
+        type_remap (dict): Memo of earlier decisions, type → replacement or None.
+        counts (dict): Number of remapped subjects per unrecognized type, updated in place.
+
+    Returns:
+        rdflib.Graph: `data_graph`, remapped in place.
+    """
+    if data_graph.namespace_manager.store.prefix(URIRef("http://purl.obolibrary.org/obo/")) is None:
+        data_graph.bind("obo", OBO)
+
+    # We collect the triples first to identify which specific subjects need remapping
+    for s, p, o in list(data_graph.triples((None, RDF.type, None))):
+        if o not in type_remap:
+            type_remap[o] = None if o in ref_classes else BFO_ENTITY
+        target = type_remap[o]
+        if target is not None:
+            counts[o] = counts.get(o, 0) + 1
+
+            # .set() removes all existing (s, RDF.type, ...) and adds (s, RDF.type, BFO_ENTITY)
+            data_graph.set((s, RDF.type, target))
+
+    return data_graph
+
+
+#### ROW SERIALIZER ####
+
+class RowSerializer:
+    """
+    Serializes single rows for `MatDatSciDf.serialize_row`.
+
+    Bundles the per-call state (compiled plan, resolved relations, ontology class
+    set, license and curator) so that it can be pickled and shipped to each worker
+    process once, instead of with every row.
+
+    Args:
+        plan (SerializationPlan): The compiled metadata template.
+        relations_table (list): Resolved relations, see `DataRelationsDict.resolve`.
+        context (dict): The metadata template's `@context`.
+        ref_classes (frozenset): Classes of the reference ontology, for type remapping.
+        type_remap (dict): Memo of type remapping decisions.
+        base_uri (str): Base URI for graph identifiers and object IRIs.
+        license_uri (URIRef): License attached to every subject.
+        orcid (str): ORCID of the data curator.
+        orcid_verified (bool): Whether the curator's ORCID was verified.
+        label_pairs (list[tuple[str, str]], optional): (subject column, label column) pairs.
+        engine (str): "jsonld" or "direct", see `MatDatSciDf.serialize_row`.
+        output_folder (str): Folder for per-row files.
+        format (str): rdflib serialization format of the per-row files.
+        write_files (bool): Whether per-row files are written.
+
+    Attributes:
+        stream_format (str): If set to "nt" or "nquads", `serialize_rows` returns each
+            row graph as N-Triples/N-Quads text, see `write_rows_stream`.
+    """
+
+    def __init__(self,
+                 plan: SerializationPlan,
+                 relations_table: list,
+                 context: dict,
+                 ref_classes: frozenset,
+                 type_remap: dict,
+                 base_uri: str,
+                 license_uri: URIRef,
+                 orcid: str,
+                 orcid_verified: bool,
+                 label_pairs,
+                 engine: str,
+                 output_folder: str,
+                 format: str,
+                 write_files: bool):
+        self.plan = plan
+        self.relations_table = relations_table
+        self.context = context
+        self.ref_classes = ref_classes
+        self.type_remap = type_remap
+        self.base_uri = base_uri
+        self.license_uri = license_uri
+        self.curator_uri = URIRef(f"https://orcid.org/{orcid}")
+        self.orcid_rk = orcid.replace("-", "")
+        self.orcid_verified = orcid_verified
+        self.label_pairs = label_pairs
+        self.engine = engine
+        self.output_folder = output_folder
+        self.format = format
+        self.write_files = write_files
+        self.stream_format = None
+
+        if engine == "direct":
+            # Expand the template before the serializer is shipped to workers
+            plan.triple_templates(context)
+
+    def output_path(self, row_key: str) -> str:
+        full_row_key = f"{row_key}or{self.orcid_rk}".replace(" ", "")
+        return os.path.join(self.output_folder, f"{full_row_key}.jsonld")
+
+    def graph_name(self, row_key: str, idx) -> URIRef:
+        full_row_key = f"{row_key}or{self.orcid_rk}".replace(" ", "")
+        return URIRef(f"{self.base_uri}{full_row_key}{idx}")
+
+    def row_text(self, g: Graph, row_key: str, idx) -> str:
+        """
+        Returns the triples of a row graph as N-Triples, or as N-Quads in the row's
+        named graph if `stream_format` is "nquads".
+        """
+        text = g.serialize(format="nt")
+        if self.stream_format == "nquads":
+            # N-Triples escapes line breaks, so every line is exactly one triple
+            name = self.graph_name(row_key, idx).n3()
+            text = "".join(f"{line[:-1]}{name} .\n" for line in text.splitlines() if line)
+        return text
+
+    def serialize(self, row_key: str, idx, row: dict, remapped: dict) -> Graph:
+        """
+        Builds (and, if enabled, writes) the graph of one row.
+
+        Args:
+            row_key (str): The row key, with trailing '-'.
+            idx: The row's index label.
+            row (dict): Column → value, as yielded by `iter_records`.
+            remapped (dict): Collects remapped type counts, see `remap_unknown_types`.
+
+        Returns:
+            rdflib.Graph: The row graph.
+        """
+        plan = self.plan
+        engine = self.engine
+        context = self.context
+        base_uri = self.base_uri
+
+        clean_row_key = row_key.rstrip("-")
+
+        # Splice row values into the compiled template
+        timestamp = datetime.now(timezone.utc).isoformat() + "Z"
+        g = Graph(identifier=self.graph_name(row_key, idx))
+        if engine == "direct":
+            subject_lookup = plan.emit_row(g, row, idx, clean_row_key, timestamp, context)
+        else:
+            graph_items, subject_lookup = plan.build_row(row, idx, clean_row_key, timestamp)
+
+            jsonld_data = {
+                "@context": context,
+                "@graph": graph_items
+            }
+
+            # Convert to RDF Graph
+            g.parse(data=json.dumps(jsonld_data), format="json-ld")
+
+        g.bind("mds", MDS)
+        g.bind("qudt", QUDT)
+        g.bind("dcterms", DCTERMS)
+        g.bind("obo", OBO)
+
+        # Add triples from DataFrame row values
+        for alt_label, subj_uri in subject_lookup.items():
+            if alt_label in row:
+                g.remove((subj_uri, QUDT.value, None))
+                if pd.notna(row[alt_label]) and str(row[alt_label]).strip() != "":
+                    data_value = row[alt_label]
+                    if hasattr(data_value, 'item'):
+                        data_value = data_value.item()
+                    g.add((subj_uri, QUDT.value, string_literal(data_value, engine)))
+                else:
+                    print(f"Skipping NA value for {alt_label} on row {idx} with row key {clean_row_key}")
+
+                g.add((subj_uri, ROW_PREDICATE, Literal(clean_row_key)))
+                g.add((subj_uri, DCTERMS.license, self.license_uri))
+                g.add((subj_uri, DCTERMS.creator, self.curator_uri))
+
+                if not self.orcid_verified:
+                    g.add((subj_uri, SKOS.note, Literal("Caution: Data curator ORCID was not verified at time of serialization.")))
+
+        # ==========================================
+        # Process Custom RDFS Label Pairs
+        # ==========================================
+        if self.label_pairs:
+            for subj_col, label_col in self.label_pairs:
+                subj_uri = subject_lookup.get(subj_col)
+                if subj_uri and label_col in row:
+                    label_val = row[label_col]
+                    if pd.notna(label_val) and str(label_val).strip() != "":
+                        if hasattr(label_val, 'item'):
+                            label_val = label_val.item()
+                        g.add((subj_uri, RDFS.label, string_literal(str(label_val).strip(), engine)))
+
+        # ==========================================
+        # Add Object & Datatype Properties
+        # ==========================================
+        for relation in self.relations_table:
+            pred_uri = relation.predicate
+            for subj_col, obj_col, subj_idx, _ in relation.pairs:
+                if subj_idx is None or pd.isna(row[subj_col]):
+                    continue
+
+                subj_uri = subject_lookup.get(subj_col)
+                if not subj_uri:
+                    continue
+
+                obj_val = row[obj_col]
+                if hasattr(obj_val, 'item'):
+                    obj_val = obj_val.item()
+                if pd.isna(obj_val):
+                    continue
+
+                if relation.prop_type == "Object Property":
+                    obj_uri = subject_lookup.get(obj_col)
+                    if obj_uri is None:
+                        obj_val_str = str(obj_val).strip()
+                        obj_uri = URIRef(f"{base_uri}{quote(obj_val_str, safe='')}")
+                    g.add((subj_uri, pred_uri, obj_uri))
+                else:
+                    g.add((subj_uri, pred_uri, Literal(obj_val)))
+
+        # Remove empty QUDT values
+        triples_to_remove = [
+            (s, p, o) for s, p, o in g
+            if p == QUDT.value and len(str(o).strip()) == 0
+        ]
+        for triple in triples_to_remove:
+            g.remove(triple)
+
+        # Execute Semantic Remapping Firewall
+        output_file = self.output_path(row_key)
+        g = remap_unknown_types(g, self.ref_classes, self.type_remap, remapped)
+        if engine == "direct":
+            plan.drop_unserializable_subjects(g, subject_lookup)
+            clean_graph = g
+        else:
+            raw_jsonld = g.serialize(format="json-ld", context=context)
+
+            clean_graph = Graph()
+            clean_graph.parse(data=raw_jsonld, format='json-ld')
+
+        if self.write_files:
+            clean_graph.serialize(
+                destination=output_file,
+                format=self.format,
+                context=context,
+                indent=2,
+                auto_compact=True
+            )
+        return clean_graph
+
+    def serialize_rows(self, rows, remapped: dict, keep_graphs: bool = True) -> list:
+        """
+        Serializes `(row_key, idx, row)` tuples in order. A failing row is reported
+        with a warning and left out.
+
+        Args:
+            rows (iterable): `(row_key, idx, row)` tuples.
+            remapped (dict): Collects remapped type counts.
+            keep_graphs (bool, optional): Return the row graphs. Otherwise the written
+                file path (or, without files, the triple count) of each row is
+                returned. Defaults to True. Ignored if `stream_format` is set.
+
+        Returns:
+            list: One entry per successfully serialized row.
+        """
+        results = []
+        for row_key, idx, row in rows:
+            try:
+                g = self.serialize(row_key, idx, row, remapped)
+            except Exception as e:
+                warnings.warn(f"Error processing row {idx} with key {row_key}: {e}")
+                continue
+            if self.stream_format is not None:
+                results.append(self.row_text(g, row_key, idx))
+            elif keep_graphs:
+                results.append(g)
+            else:
+                results.append(self.output_path(row_key) if self.write_files else len(g))
+        return results
+
+
+#### WORKER PROCESSES ####
+
+_worker_serializer = None
+
+
+def _init_worker(serializer: RowSerializer):
+    global _worker_serializer
+    _worker_serializer = serializer
+
+
+def _serialize_chunk(rows: list) -> tuple:
+    # Runs in a worker, see `serialize_rows_parallel`
+    remapped = {}
+    results = _worker_serializer.serialize_rows(rows, remapped, keep_graphs=False)
+    return results, remapped
+
+
+def _chunks(rows, chunk_size: int):
+    chunk = []
+    for item in rows:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def serialize_rows_parallel(serializer: RowSerializer, rows, workers: int, chunk_size: int, remapped: dict, on_chunk=None) -> list:
+    """
+    Serializes `(row_key, idx, row)` tuples in a pool of `workers` processes.
+
+    Rows are sent in contiguous chunks of `chunk_size`; the serializer itself is
+    sent to every worker once. Workers write the row files themselves and only
+    return file paths (or triple counts when no files are written). Chunk results,
+    printed output and warnings are collected in row order, so they do not depend
+    on the number of workers or on scheduling.
+
+    Args:
+        on_chunk (callable, optional): Called with the results of each chunk, in row
+            order, instead of collecting them. Keeps memory bounded when streaming.
+
+    Returns:
+        list: One file path or triple count per successfully serialized row, in row
+            order. Empty if `on_chunk` is given.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(serializer,)) as pool:
+        for chunk_results, chunk_remapped in run_ordered(pool, _chunks(rows, chunk_size), _serialize_chunk, workers):
+            for o, n in chunk_remapped.items():
+                remapped[o] = remapped.get(o, 0) + n
+            if on_chunk is not None:
+                on_chunk(chunk_results)
+            else:
+                results.extend(chunk_results)
+    return results
+
+
+#### STREAMING OUTPUT ####
+
+def open_stream(path: str, compress: bool):
+    """
+    Opens `path` for writing UTF-8 text, gzip-compressed if `compress` is True.
+    """
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8")
+    return open(path, "w", encoding="utf-8")
+
+
+def write_rows_stream(serializer: RowSerializer, rows, handle, remapped: dict, workers: int = 1, chunk_size: int = 256) -> int:
+    """
+    Writes the triples of every row to `handle` as they are produced.
+
+    Rows are serialized in chunks of `chunk_size`, in a pool of `workers` processes
+    if more than one, and each chunk is written as N-Triples/N-Quads text (see
+    `RowSerializer.stream_format`) before the next one is collected. Only a bounded
+    number of chunks is ever held in memory, whatever the number of rows.
+
+    Returns:
+        int: The number of lines (triples or quads) written.
+    """
+    written = 0
+
+    def write(texts):
+        nonlocal written
+        text = "".join(texts)
+        handle.write(text)
+        written += text.count("\n")
+
+    if workers > 1:
+        serialize_rows_parallel(serializer, rows, workers, chunk_size, remapped, on_chunk=write)
+    else:
+        for chunk in _chunks(rows, chunk_size):
+            write(serializer.serialize_rows(chunk, remapped))
+    return written
+
+
+def compact_stream(path: str, format: str, destination: str, context: dict, compress: bool) -> Graph:
+    """
+    Reads a streamed N-Triples/N-Quads file back and saves it as compacted JSON-LD.
+
+    N-Quads graph names are dropped, so the result has the same triples as
+    `MatDatSciDf.serialize_bulk`. Unlike the streaming pass, this loads the whole
+    dataset into memory.
+
+    Returns:
+        rdflib.Graph: The merged graph.
+    """
+    graph = Graph()
+    with (gzip.open(path, "rb") if compress else open(path, "rb")) as source:
+        if format == "nquads":
+            dataset = Dataset()
+            dataset.parse(source, format="nquads")
+            for s, p, o, _ in dataset.quads((None, None, None, None)):
+                graph.add((s, p, o))
+        else:
+            graph.parse(source, format="nt")
+
+    graph.serialize(
+        destination=destination,
+        format="json-ld",
+        context=context,
+        indent=2,
+        auto_compact=True
+    )
+    return graph
@@ -0,0 +1,382 @@
+import re
+import copy
+import json
+import warnings
+import pandas as pd
+from rdflib import Graph, URIRef, BNode, Literal, XSD
+from typing import NamedTuple, Optional
+from .utility import hash6, normalize
+
+
+MDS_BASE = "https://cwrusdle.bitbucket.io/mds/"
+
+# Stand-ins used when expanding template entries to triples ahead of time
+_SUBJECT_PLACEHOLDER = "urn:fairlinked:serialization-plan:subject:{}"
+_TIMESTAMP_PLACEHOLDER = "0001-01-01T00:00:00.000001"
+
+# Column written by `MatDatSciDf.add_row_keys`. It is kept apart from `__rowkey__`,
+# which other producers (e.g. `AnalysisTracker.create_arg_df`) fill with their own ids
+STORED_ROW_KEY_COLUMN = "__stored_rowkey__"
+
+# Study stage → row key prefix
+SSKEY = {
+    "Synthesis": "SYN",
+    "Formulation": "FOR",
+    "Material Processing": "MAT_PRO",
+    "Sample": "SA",
+    "Tool": "TL",
+    "Recipe": "REC",
+    "Result": "RSLT",
+    "Analysis": "AN",
+    "Modeling": "MOD",
+    "": "UNK"
+}
+
+
+class TemplateMismatchError(ValueError):
+    """
+    Raised when the rows of a DataFrame cannot be serialized with a metadata template,
+    e.g. because a column of the template is missing from the DataFrame.
+    """
+
+
+class ColumnInstruction(NamedTuple):
+    """
+    Everything `serialize_row` needs to know about one template entry, resolved once.
+
+    Attributes:
+        alt_label (str): The column name (`skos:altLabel`) of the entry.
+        localname (str): Local name of the entry's `@type`, used to mint subject IRIs.
+        subject_prefix (str): Subject IRI up to the row specific suffix, i.e. `mds:<localname>.`
+        study_stage (str): The entry's `mds:hasStudyStage` value.
+        is_id_col (bool): Whether the subject IRI is minted from the cell value instead of the row key.
+        item (dict): The template entry with empty unit/quantity kind links pruned.
+        raw_item (dict): The untouched template entry, used when a row has no identifier.
+        has_timestamp (bool): Whether `prov:generatedAtTime` is a value object to be stamped per row.
+    """
+    alt_label: str
+    localname: str
+    subject_prefix: str
+    study_stage: str
+    is_id_col: bool
+    item: dict
+    raw_item: dict
+    has_timestamp: bool
+
+
+def string_literal(value, engine: str = "jsonld") -> Literal:
+    """
+    Builds the xsd:string literal `serialize_row` attaches to cell values.
+
+    For the "direct" engine the literal is built the way it comes out of the JSON-LD 
+    round trip of the "jsonld" engine: with an active `@context` rdflib writes 
+    xsd:string literals as native JSON values, so strings come back as plain 
+    literals and numbers/booleans as xsd:integer, xsd:double or xsd:boolean.
+    """
+    if engine == "direct" and isinstance(value, (str, bool, int, float)):
+        return Literal(value)
+    return Literal(value, datatype=XSD.string)
+
+
+def _cell_strings(column: pd.Series) -> pd.Series:
+    # str() of every cell as `df.at` would return it (numpy scalars, Timestamps, pd.NA, ...)
+    return column.astype(object).map(str)
+
+
+def _hash6_column(values: pd.Series) -> pd.Series:
+    # hash6 of every string, hashing each distinct string only once
+    codes, uniques = pd.factorize(values)
+    hashed = pd.Index([str(hash6(u)) for u in uniques], dtype=object)
+    return pd.Series(hashed.take(codes) if len(codes) else [], index=values.index, dtype=object)
+
+
+def _round_trip_term(term):
+    if isinstance(term, Literal) and term.datatype == XSD.string:
+        return string_literal(term.toPython(), engine="direct")
+    return term
+
+
+#### SERIALIZATION PLAN ####
+
+class SerializationPlan:
+    """
+    A metadata template compiled into flat per-column instructions for row serialization.
+
+    Compiling resolves, once per template, what `serialize_row` would otherwise
+    re-derive on every row: copying the template, parsing the `@type` CURIE into a
+    local name, pruning empty unit and quantity kind links, grouping columns by
+    study stage for the row key and deciding which columns mint their subject from
+    an identifier cell. Per row, only the cell values are spliced in.
+
+    Args:
+        graph_template (list[dict]): The `@graph` entries of the metadata template.
+        row_key_cols (list[str], optional): Columns whose values form the row key.
+        id_cols (list[str], optional): Columns whose values identify their entity.
+
+    Raises:
+        ValueError: If a template entry has no `skos:altLabel` while one is required.
+    """
+
+    def __init__(self,
+                graph_template: list,
+                row_key_cols: Optional[list[str]] = None,
+                id_cols: Optional[list[str]] = None):
+
+        self.key = self.make_key(graph_template, row_key_cols, id_cols)
+        alt_labels = [item["skos:altLabel"] for item in graph_template if "skos:altLabel" in item]
+
+        # Row key: from explicit columns, or hashed per study stage
+        self.row_key_cols = None
+        self.hash_groups = []
+        if row_key_cols is None or not any(x in alt_labels for x in row_key_cols):
+            groups = {}
+            for item in graph_template:
+                if "skos:altLabel" not in item or not item["skos:altLabel"]:
+                    raise ValueError("Missing skos:altLabel in template")
+                groups.setdefault(item.get("mds:hasStudyStage", ""), []).append(item["skos:altLabel"])
+            self.hash_groups = [(SSKEY.get(stage, "UNK"), cols) for stage, cols in groups.items()]
+        else:
+            self.row_key_cols = list(set(alt_labels) & set(row_key_cols))
+
+        # Template entries in order: a ColumnInstruction, or a static dict passed through as is
+        self.entries = []
+        for item in graph_template:
+            if "@type" not in item or not item["@type"]:
+                warnings.warn(f"Missing or empty @type in template item: {item}")
+                self.entries.append(item)
+                continue
+            if "skos:altLabel" not in item or not item["skos:altLabel"]:
+                raise ValueError("Missing skos:altLabel in template")
+
+            raw_type = str(item["@type"]).strip()
+            if "://" in raw_type:
+                # Full IRI (e.g., "https://cwrusdle.bitbucket.io/mds/ShearRate")
+                localname = raw_type.split("/")[-1].split("#")[-1]
+            elif ":" in raw_type:
+                # CURIE (e.g., "mds:ShearRate")
+                _, localname = raw_type.split(":", 1)
+            else:
+                # Bare string (e.g., "ShearRate")
+                localname = raw_type
+
+            pruned = copy.deepcopy(item)
+            for link in ("qudt:hasUnit", "qudt:hasQuantityKind"):
+                if link in pruned and isinstance(pruned[link], dict) and not pruned[link].get("@id"):
+                    del pruned[link]
+
+            self.entries.append(ColumnInstruction(
+                alt_label=item["skos:altLabel"],
+                localname=localname,
+                subject_prefix=f"{MDS_BASE}{localname}.",
+                study_stage=item.get("mds:hasStudyStage", ""),
+                is_id_col=id_cols is not None and item["skos:altLabel"] in id_cols,
+                item=pruned,
+                raw_item=copy.deepcopy(item),
+                has_timestamp=isinstance(item.get("prov:generatedAtTime"), dict)
+            ))
+
+        self.columns = [e for e in self.entries if isinstance(e, ColumnInstruction)]
+        self._triple_templates = {}
+
+    @staticmethod
+    def make_key(graph_template, row_key_cols=None, id_cols=None):
+        """
+        Returns a string identifying a template + options combination, used to reuse plans.
+        """
+        return json.dumps(
+            [graph_template, row_key_cols, sorted(id_cols) if id_cols is not None else None],
+            sort_keys=True, default=str
+        )
+
+    def row_key(self, get_value) -> str:
+        """
+        Builds the row key (with trailing '-').
+
+        Args:
+            get_value (callable): Returns the row's cell value for a column name.
+        """
+        if self.row_key_cols is not None:
+            return "".join(str(get_value(x)).strip() + "-" for x in self.row_key_cols)
+
+        row_key = ""
+        for code, cols in self.hash_groups:
+            num = str(hash6("".join([str(x) for x in (get_value(c) for c in cols) if not pd.isna(x)])))
+            row_key += code + num + "-"
+        return row_key
+
+    def row_keys(self, df: pd.DataFrame, stored_column: Optional[str] = None) -> pd.Series:
+        """
+        Builds the row key (with trailing '-') of every row of `df` at once, 
+        column by column, with the distinct key strings hashed once each.
+
+        Args:
+            df (pd.DataFrame): The rows to key.
+            stored_column (str, optional): A column of precomputed keys (without the 
+                trailing '-'). When `df` has it, its values are used and keys are only 
+                computed for rows where it is empty.
+
+        Returns:
+            pd.Series: The same keys as `row_key` would give per row, indexed like `df`.
+
+        Raises:
+            KeyError: If a column needed for the key is not in `df`.
+        """
+        if stored_column is not None and stored_column in df.columns:
+            stored = df[stored_column]
+            keys = _cell_strings(stored) + "-"
+            if stored.isna().any():
+                keys = keys.where(stored.notna(), self.row_keys(df))
+            return keys
+
+        keys = pd.Series("", index=df.index, dtype=object)
+        if self.row_key_cols is not None:
+            for col in self.row_key_cols:
+                keys = keys + _cell_strings(df[col]).str.strip() + "-"
+            return keys
+
+        for code, cols in self.hash_groups:
+            joined = pd.Series("", index=df.index, dtype=object)
+            for col in cols:
+                joined = joined + _cell_strings(df[col]).where(df[col].notna(), "")
+            keys = keys + code + _hash6_column(joined) + "-"
+        return keys
+
+    def subject_for(self, column: ColumnInstruction, row, clean_row_key: str):
+        """
+        Mints the subject IRI of a column for one row, or None if its identifier cell is empty.
+        """
+        if column.is_id_col:
+            raw_identifier = row.get(column.alt_label)
+            if not raw_identifier or pd.isna(raw_identifier):
+                return None
+            entity_identifier = normalize(re.sub(r'[^a-zA-Z0-9_\-\.]', '', str(raw_identifier)))
+            return URIRef(f"{column.subject_prefix}{entity_identifier}")
+        return URIRef(f"{column.subject_prefix}{clean_row_key}")
+
+    def build_row(self, row, idx, clean_row_key: str, timestamp: str):
+        """
+        Splices one row into the compiled template.
+
+        Returns:
+            tuple: (graph_items, subject_lookup) where graph_items is the JSON-LD
+                `@graph` list for the row and subject_lookup maps column → subject IRI.
+        """
+        graph_items = []
+        subject_lookup = {}
+        for entry in self.entries:
+            if not isinstance(entry, ColumnInstruction):
+                graph_items.append(entry)
+                continue
+
+            subject_uri = self.subject_for(entry, row, clean_row_key)
+            if subject_uri is None:
+                warnings.warn(f"Cannot find entity identifier in row {idx}")
+                graph_items.append(entry.raw_item)
+                continue
+
+            item = dict(entry.item)
+            item["@id"] = subject_uri
+            if entry.has_timestamp:
+                item["prov:generatedAtTime"] = dict(item["prov:generatedAtTime"], **{"@value": timestamp})
+            graph_items.append(item)
+            subject_lookup[entry.alt_label] = subject_uri
+
+        return graph_items, subject_lookup
+
+    def _expand(self, item, context):
+        g = Graph()
+        g.parse(data=json.dumps({"@context": context, "@graph": [item]}, default=str), format="json-ld")
+        return [(s, p, _round_trip_term(o)) for s, p, o in g]
+
+    def triple_templates(self, context: dict) -> list:
+        """
+        Expands every template entry to RDF triples once, with the JSON-LD parser and 
+        the template's own `@context`, so rows can be emitted without JSON-LD.
+
+        The subject of each column entry is expanded as a placeholder IRI and its 
+        timestamp as a placeholder literal; both are substituted per row by 
+        `emit_row`.
+
+        Args:
+            context (dict): The metadata template's `@context`.
+
+        Returns:
+            list: One `(placeholder, triples, raw_triples)` tuple per template entry.
+        """
+        context_key = json.dumps(context, sort_keys=True, default=str)
+        if context_key in self._triple_templates:
+            return self._triple_templates[context_key]
+
+        templates = []
+        for i, entry in enumerate(self.entries):
+            if not isinstance(entry, ColumnInstruction):
+                templates.append((None, self._expand(entry, context), None))
+                continue
+
+            placeholder = URIRef(_SUBJECT_PLACEHOLDER.format(i))
+            item = dict(entry.item)
+            item["@id"] = str(placeholder)
+            if entry.has_timestamp:
+                item["prov:generatedAtTime"] = dict(item["prov:generatedAtTime"], **{"@value": _TIMESTAMP_PLACEHOLDER})
+            raw_triples = self._expand(entry.raw_item, context) if entry.is_id_col else None
+            templates.append((placeholder, self._expand(item, context), raw_triples))
+
+        self._triple_templates[context_key] = templates
+        return templates
+
+    @staticmethod
+    def _splice(graph, triples, placeholder, subject, timestamp, bnodes):
+        def term(t):
+            if placeholder is not None and t == placeholder:
+                return subject
+            if isinstance(t, BNode):
+                # Fresh blank nodes per row, as a fresh JSON-LD parse would give
+                return bnodes.setdefault(t, BNode())
+            if isinstance(t, Literal) and str(t) == _TIMESTAMP_PLACEHOLDER:
+                return Literal(timestamp, datatype=t.datatype, lang=t.language)
+            return t
+
+        for s, p, o in triples:
+            graph.add((term(s), p, term(o)))
+
+    def emit_row(self, graph: Graph, row, idx, clean_row_key: str, timestamp: str, context: dict) -> dict:
+        """
+        Adds the template triples of one row directly to `graph`.
+
+        Produces the same triples as parsing the JSON-LD built by `build_row`, 
+        without a JSON-LD round trip per row.
+
+        Returns:
+            dict: Mapping of column → subject IRI for the row.
+        """
+        subject_lookup = {}
+        bnodes = {}
+        for entry, (placeholder, triples, raw_triples) in zip(self.entries, self.triple_templates(context)):
+            if not isinstance(entry, ColumnInstruction):
+                self._splice(graph, triples, None, None, timestamp, bnodes)
+                continue
+
+            subject_uri = self.subject_for(entry, row, clean_row_key)
+            if subject_uri is None:
+                warnings.warn(f"Cannot find entity identifier in row {idx}")
+                self._splice(graph, raw_triples, None, None, timestamp, bnodes)
+                continue
+
+            self._splice(graph, triples, placeholder, subject_uri, timestamp, bnodes)
+            subject_lookup[entry.alt_label] = subject_uri
+
+        return subject_lookup
+
+    @staticmethod
+    def drop_unserializable_subjects(graph: Graph, subject_lookup: dict) -> None:
+        """
+        Removes every triple that mentions a minted subject IRI containing a space.
+
+        JSON-LD processors reject such IRIs, so the JSON-LD round trip of the 
+        "jsonld" engine silently loses those triples; the "direct" engine drops 
+        them here to produce the same graph.
+        """
+        for subject_uri in set(subject_lookup.values()):
+            if " " in subject_uri:
+                graph.remove((subject_uri, None, None))
+                graph.remove((None, None, subject_uri))
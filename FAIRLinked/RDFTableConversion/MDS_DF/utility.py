@@ -10,6 +10,10 @@ import hashlib
 import requests
 from importlib import resources
 import difflib
+import bisect
+import threading
+import weakref
+from collections import Counter
 
 def load_licenses():
     with resources.files(helper_data).joinpath("licenseinfo.json").open() as f:
@@ -18,9 +22,157 @@ def load_licenses():
 
 _CACHED_UNITS = None
 
+# Precompiled unit table written by build_unit_table(), shipped next to qudt_unit.ttl
+UNIT_TABLE_FILE = "qudt_unit.arrow"
+_UNIT_TABLE_FIELDS = ("name", "label", "symbol", "ucum_code", "conversion_multiplier", "description")
+
+
+def _parse_qudt_units(content):
+    """
+    Parses QUDT Turtle content and returns the unit details keyed by unit name.
+    """
+    # 1. Parse the Turtle data into an RDF Graph
+    g = Graph()
+    g.parse(data=content, format="turtle")
+
+    # 2. Corrected Official QUDT Namespaces
+    # QUDT schema elements use http and a trailing hash '#'
+    QUDT = Namespace("http://qudt.org/schema/qudt/")
+
+    unit_details = {}
+
+    # 3. Programmatically find all subjects that are instances of qudt:Unit or qudt:DerivedUnit
+    unit_subjects = set(g.subjects(RDF.type, QUDT.Unit)).union(
+        g.subjects(RDF.type, QUDT.DerivedUnit)
+    )
+
+    for subj in unit_subjects:
+        # Handle splitting the term from the URI safely, accounting for both '/' and '#'
+        unit_uri_str = str(subj)
+        unit_name = unit_uri_str.split('/')[-1].split('#')[-1]
+
+        # Extract English label explicitly
+        labels = g.objects(subj, RDFS.label)
+        label_lit = next((l for l in labels if getattr(l, 'language', None) == 'en'), None)
+        if label_lit is None:
+            label_lit = g.value(subj, RDFS.label)
+
+        symbol_lit = g.value(subj, QUDT.symbol)
+        ucum_lit = g.value(subj, QUDT.ucumCode)
+        mult_lit = g.value(subj, QUDT.conversionMultiplier)
+        desc_lit = g.value(subj, DCTERMS.description)
+
+        # Handle the description formatting safely
+        description = str(desc_lit) if desc_lit else None
+        if description and len(description) > 100:
+            description = description[:100] + '...'
+
+        unit_details[unit_name] = {
+            'name': unit_name,
+            'label': str(label_lit) if label_lit else unit_name,
+            'symbol': str(symbol_lit) if symbol_lit else None,
+            'ucum_code': str(ucum_lit) if ucum_lit else None,
+            'conversion_multiplier': str(mult_lit) if mult_lit else None,
+            'description': description
+        }
+
+    return unit_details
+
+
+def _qudt_ttl_digest():
+    with resources.files(helper_data).joinpath("qudt_unit.ttl").open("rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def build_unit_table(ttl_path=None, output_path=None):
+    """
+    Build step that precompiles the QUDT unit vocabulary into a columnar Arrow IPC file.
+
+    The table holds one row per unit (name, label, symbol, UCUM code, conversion
+    multiplier, description), sorted by unit name, and records the SHA-256 of the
+    source Turtle file in its schema metadata so that `load_units()` can detect a
+    stale table. Re-run this whenever `helper_data/qudt_unit.ttl` is updated:
+
+        python -c "from FAIRLinked.RDFTableConversion.MDS_DF.utility import build_unit_table; build_unit_table()"
+
+    Args:
+        ttl_path (str, optional): QUDT Turtle file. Defaults to the bundled `qudt_unit.ttl`.
+        output_path (str, optional): Destination file. Defaults to `qudt_unit.arrow`
+            in the `helper_data` package.
+
+    Returns:
+        str: Path of the written unit table.
+    """
+    import pyarrow as pa
+
+    if ttl_path is None:
+        with resources.files(helper_data).joinpath("qudt_unit.ttl").open("rb") as f:
+            raw = f.read()
+    else:
+        with open(ttl_path, "rb") as f:
+            raw = f.read()
+
+    if output_path is None:
+        output_path = os.path.join(os.path.dirname(helper_data.__file__), UNIT_TABLE_FILE)
+
+    unit_details = _parse_qudt_units(raw.decode("utf-8"))
+    rows = [unit_details[name] for name in sorted(unit_details)]
+
+    schema = pa.schema(
+        [pa.field(field, pa.string()) for field in _UNIT_TABLE_FIELDS],
+        metadata={"source_sha256": hashlib.sha256(raw).hexdigest()}
+    )
+    table = pa.Table.from_pydict(
+        {field: [row[field] for row in rows] for field in _UNIT_TABLE_FIELDS},
+        schema=schema
+    )
+
+    tmp_path = output_path + ".tmp"
+    with pa.OSFile(tmp_path, "wb") as sink:
+        with pa.ipc.new_file(sink, schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, output_path)
+
+    print(f"✅ Wrote {len(rows)} units to {output_path}")
+    return output_path
+
+
+def _read_unit_table():
+    """
+    Reads the precompiled unit table. Returns None if it is missing, unreadable
+    or was built from a different `qudt_unit.ttl`.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+
+    table_ref = resources.files(helper_data).joinpath(UNIT_TABLE_FILE)
+    if not table_ref.is_file():
+        return None
+
+    try:
+        with resources.as_file(table_ref) as table_path:
+            with pa.memory_map(str(table_path), "r") as source:
+                table = pa.ipc.open_file(source).read_all()
+    except Exception as e:
+        print(f"⚠️ Precompiled unit table could not be read: {e}. Falling back to qudt_unit.ttl.")
+        return None
+
+    metadata = table.schema.metadata or {}
+    if metadata.get(b"source_sha256", b"").decode() != _qudt_ttl_digest():
+        print("⚠️ Precompiled unit table is out of date with qudt_unit.ttl. Falling back to the Turtle file.")
+        return None
+
+    return {row["name"]: row for row in table.to_pylist()}
+
+
 def load_units():
     """
-    Robust unit loader using programmatic rdflib graph traversal and global caching.
+    Robust unit loader with global caching.
+
+    Reads the precompiled unit table (see `build_unit_table`) when it is available
+    and falls back to parsing `qudt_unit.ttl` with rdflib otherwise.
     """
     global _CACHED_UNITS
     
@@ -28,58 +180,19 @@ def load_units():
     if _CACHED_UNITS is not None:
         return _CACHED_UNITS
 
+    # 2. Prefer the precompiled table, which avoids parsing the Turtle file
+    unit_details = _read_unit_table()
+    if unit_details is not None:
+        _CACHED_UNITS = unit_details
+        return _CACHED_UNITS
+
     try:
-        # 2. Read the file content via importlib
+        # 3. Read the file content via importlib
         with resources.files(helper_data).joinpath("qudt_unit.ttl").open() as f:
             content = f.read()
 
-        # 3. Parse the Turtle data into an RDF Graph
-        g = Graph()
-        g.parse(data=content, format="turtle")
-        
-        # 4. Corrected Official QUDT Namespaces
-        # QUDT schema elements use http and a trailing hash '#'
-        QUDT = Namespace("http://qudt.org/schema/qudt/")
-        
-        unit_details = {}
-        
-        # 5. Programmatically find all subjects that are instances of qudt:Unit or qudt:DerivedUnit
-        unit_subjects = set(g.subjects(RDF.type, QUDT.Unit)).union(
-            g.subjects(RDF.type, QUDT.DerivedUnit)
-        )
-        
-        for subj in unit_subjects:
-            # Handle splitting the term from the URI safely, accounting for both '/' and '#'
-            unit_uri_str = str(subj)
-            unit_name = unit_uri_str.split('/')[-1].split('#')[-1]
-            
-            # Extract English label explicitly
-            labels = g.objects(subj, RDFS.label)
-            label_lit = next((l for l in labels if getattr(l, 'language', None) == 'en'), None)
-            if label_lit is None:
-                label_lit = g.value(subj, RDFS.label)
-            
-            symbol_lit = g.value(subj, QUDT.symbol)
-            ucum_lit = g.value(subj, QUDT.ucumCode)
-            mult_lit = g.value(subj, QUDT.conversionMultiplier)
-            desc_lit = g.value(subj, DCTERMS.description)
-            
-            # Handle the description formatting safely
-            description = str(desc_lit) if desc_lit else None
-            if description and len(description) > 100:
-                description = description[:100] + '...'
-                
-            unit_details[unit_name] = {
-                'name': unit_name,
-                'label': str(label_lit) if label_lit else unit_name,
-                'symbol': str(symbol_lit) if symbol_lit else None,
-                'ucum_code': str(ucum_lit) if ucum_lit else None,
-                'conversion_multiplier': str(mult_lit) if mult_lit else None,
-                'description': description
-            }
-        
-        # 6. Store in global cache
-        _CACHED_UNITS = unit_details
+        # 4. Store in global cache
+        _CACHED_UNITS = _parse_qudt_units(content)
         return _CACHED_UNITS
 
     except Exception as e:
@@ -87,6 +200,106 @@ def load_units():
         return {}
 
 
+class UnitIndex:
+    """
+    Multi-key lookup index over a unit table as returned by `load_units()`.
+
+    Unit keys are indexed by case-folded name and label and by exact UCUM code and
+    symbol (these are case-sensitive: "m" is not "M"), so resolving a free-text unit
+    is a handful of dictionary lookups instead of a scan over every unit. A sorted
+    list of the case-folded names and labels backs prefix search and fuzzy
+    suggestions.
+
+    Args:
+        units (dict): Mapping of unit key to a details dict with any of the keys
+            'name', 'label', 'ucum_code' and 'symbol'.
+    """
+
+    FIELDS = ("name", "label", "ucum_code", "symbol")
+    _CASE_FOLDED = ("name", "label")
+
+    def __init__(self, units):
+        self.units = units
+        self._size = len(units)
+        self._position = {}
+        self._keys = {field: {} for field in self.FIELDS}
+        terms = {}
+
+        for position, (key, details) in enumerate(units.items()):
+            self._position[key] = position
+            for field in self.FIELDS:
+                value = details.get(field)
+                if not value:
+                    continue
+                value = str(value)
+                if field in self._CASE_FOLDED:
+                    value = value.casefold()
+                    terms.setdefault(value, []).append(key)
+                self._keys[field].setdefault(value, []).append(key)
+
+        self._terms = terms
+        self._sorted_terms = sorted(terms)
+
+    def lookup(self, text, fields=("name", "ucum_code", "label")):
+        """
+        Returns the unit keys whose `fields` exactly match `text`, in unit table order.
+        """
+        if not text:
+            return []
+        text = str(text).strip()
+        matches = set()
+        for field in fields:
+            value = text.casefold() if field in self._CASE_FOLDED else text
+            matches.update(self._keys[field].get(value, ()))
+        return sorted(matches, key=self._position.__getitem__)
+
+    def prefix_search(self, prefix, limit=10):
+        """
+        Returns up to `limit` unit keys whose name or label starts with `prefix`.
+        """
+        prefix = str(prefix).strip().casefold()
+        if not prefix:
+            return []
+        results = []
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        for term in self._sorted_terms[start:]:
+            if not term.startswith(prefix):
+                break
+            for key in self._terms[term]:
+                if key not in results:
+                    results.append(key)
+            if len(results) >= limit:
+                break
+        return results[:limit]
+
+    def suggest(self, text, limit=5, cutoff=0.75):
+        """
+        Suggests unit keys for a string that has no exact match: prefix matches
+        first, then close matches on name or label.
+        """
+        results = self.prefix_search(text, limit=limit)
+        if len(results) < limit:
+            for term in difflib.get_close_matches(str(text).strip().casefold(), self._sorted_terms, n=limit, cutoff=cutoff):
+                for key in self._terms[term]:
+                    if key not in results:
+                        results.append(key)
+        return results[:limit]
+
+
+_CACHED_UNIT_INDEX = None
+
+def get_unit_index(units):
+    """
+    Returns a `UnitIndex` for `units`, reusing the last index built if it was built
+    for the same (unchanged in size) unit table.
+    """
+    global _CACHED_UNIT_INDEX
+    if (_CACHED_UNIT_INDEX is None or _CACHED_UNIT_INDEX.units is not units
+            or _CACHED_UNIT_INDEX._size != len(units)):
+        _CACHED_UNIT_INDEX = UnitIndex(units)
+    return _CACHED_UNIT_INDEX
+
+
 def hash6(s):
     """
     Takes any string and returns a 6-digit number (100000-999999).
@@ -304,16 +517,82 @@ def get_local_name(uri):
             return uri_str.split('#')[-1]
         return uri_str
 
-def extract_terms_from_ontology(ontology_graph):
+# Terms (and the term index, property table and class set built from them) per live ontology graph, see _ontology_term_entry
+_ONTOLOGY_TERM_CACHE = {}
+_ONTOLOGY_TERM_CACHE_LOCK = threading.Lock()
+# Bumped by clear_ontology_term_cache so that fingerprints taken before a clear no longer match
+_ONTOLOGY_CACHE_GENERATION = 0
+
+
+def ontology_fingerprint(ontology_graph):
     """
-    Extract terms from an RDF graph representing an OWL ontology.
+    Returns the fingerprint that the ontology caches check a graph against: its triple
+    count, its `owl:versionInfo` values and the cache generation.
+
+    Adding or removing triples, or reloading an ontology of another version, changes
+    the fingerprint. An in-place edit that keeps the triple count (e.g.
+    `graph.set((term, RDFS.label, new_label))`) does not; call
+    `clear_ontology_term_cache(graph)` after such edits.
 
     Args:
         ontology_graph (rdflib.Graph): The ontology RDF graph.
 
     Returns:
-        list[dict]: A list of dictionaries containing term IRIs, original labels, and normalized labels.
+        tuple: A hashable value that changes when the graph is detected as changed.
     """
+    versions = tuple(sorted(str(v) for v in ontology_graph.objects(None, OWL.versionInfo)))
+    return (len(ontology_graph), versions, _ONTOLOGY_CACHE_GENERATION)
+
+
+def _ontology_term_entry(ontology_graph):
+    """
+    Returns the cache entry for `ontology_graph`, (re)building its term list when the
+    graph has not been seen before or its fingerprint has changed since.
+    """
+    key = id(ontology_graph)
+    fingerprint = ontology_fingerprint(ontology_graph)
+
+    with _ONTOLOGY_TERM_CACHE_LOCK:
+        entry = _ONTOLOGY_TERM_CACHE.get(key)
+        if entry is not None and entry["graph"]() is ontology_graph and entry["fingerprint"] == fingerprint:
+            return entry
+
+    terms = _extract_terms_from_ontology(ontology_graph)
+    entry = {
+        # Weak reference so cached terms never keep a discarded graph alive
+        "graph": weakref.ref(ontology_graph, lambda _, key=key: _ONTOLOGY_TERM_CACHE.pop(key, None)),
+        "fingerprint": fingerprint,
+        "terms": terms,
+        "term_index": None,
+        "properties": None,
+        "classes": None,
+        "type_remap": {}
+    }
+    with _ONTOLOGY_TERM_CACHE_LOCK:
+        _ONTOLOGY_TERM_CACHE[key] = entry
+    return entry
+
+
+def clear_ontology_term_cache(ontology_graph=None):
+    """
+    Drops cached ontology terms and term indexes, and invalidates the relation tables
+    resolved against them. Needed after in-place edits that `ontology_fingerprint`
+    cannot detect.
+
+    Args:
+        ontology_graph (rdflib.Graph, optional): Only drop the entry of this graph.
+            Defaults to dropping all entries.
+    """
+    global _ONTOLOGY_CACHE_GENERATION
+    with _ONTOLOGY_TERM_CACHE_LOCK:
+        if ontology_graph is None:
+            _ONTOLOGY_TERM_CACHE.clear()
+        else:
+            _ONTOLOGY_TERM_CACHE.pop(id(ontology_graph), None)
+        _ONTOLOGY_CACHE_GENERATION += 1
+
+
+def _extract_terms_from_ontology(ontology_graph):
     MDS = Namespace("https://cwrusdle.bitbucket.io/mds/")
     
     terms = []
@@ -337,6 +616,252 @@ def extract_terms_from_ontology(ontology_graph):
     return terms
 
 
+def extract_terms_from_ontology(ontology_graph):
+    """
+    Extract terms from an RDF graph representing an OWL ontology.
+
+    Results are memoised per graph object. The cache is keyed on the graph's identity
+    and checked against `ontology_fingerprint` (triple count and `owl:versionInfo`), so
+    adding or removing terms invalidates it. Edits that keep the triple count, such as
+    replacing a label with `graph.set(...)`, are not detected: call
+    `clear_ontology_term_cache(graph)` after them. The returned list is shared between
+    callers and must not be modified.
+
+    Args:
+        ontology_graph (rdflib.Graph): The ontology RDF graph.
+
+    Returns:
+        list[dict]: A list of dictionaries containing term IRIs, original labels, and normalized labels.
+    """
+    return _ontology_term_entry(ontology_graph)["terms"]
+
+
+def get_ontology_term_index(ontology_graph):
+    """
+    Returns the `OntologyTermIndex` for the terms of `ontology_graph`, built once and
+    cached alongside the terms returned by `extract_terms_from_ontology`.
+
+    Args:
+        ontology_graph (rdflib.Graph): The ontology RDF graph.
+
+    Returns:
+        OntologyTermIndex: Index over the ontology's class labels.
+    """
+    entry = _ontology_term_entry(ontology_graph)
+    if entry["term_index"] is None:
+        entry["term_index"] = OntologyTermIndex(entry["terms"])
+    return entry["term_index"]
+
+
+def _extract_ontology_properties(ontology_graph):
+    prop_metadata_dict = {}
+    for prop_type, label_type in [(OWL.ObjectProperty, "Object Property"), (OWL.DatatypeProperty, "Datatype Property")]:
+        for prop in ontology_graph.subjects(RDF.type, prop_type):
+            label = ontology_graph.value(prop, RDFS.label)
+            if label:
+                prop_metadata_dict[str(label)] = (str(prop), label_type)
+    return prop_metadata_dict
+
+
+def get_ontology_properties(ontology_graph):
+    """
+    Returns the Object and Datatype properties of `ontology_graph`, keyed by their 
+    rdfs:label. Memoised per graph like `extract_terms_from_ontology`; the returned 
+    dict is shared between callers and must not be modified.
+
+    Args:
+        ontology_graph (rdflib.Graph): The ontology RDF graph.
+
+    Returns:
+        dict: Property label (str) → (property URI (str), "Object Property" or "Datatype Property").
+    """
+    entry = _ontology_term_entry(ontology_graph)
+    if entry["properties"] is None:
+        entry["properties"] = _extract_ontology_properties(ontology_graph)
+    return entry["properties"]
+
+
+def get_ontology_classes(ontology_graph):
+    """
+    Returns the set of `owl:Class` and `rdfs:Class` subjects of `ontology_graph`. 
+    Memoised per graph like `extract_terms_from_ontology`.
+
+    Args:
+        ontology_graph (rdflib.Graph): The ontology RDF graph.
+
+    Returns:
+        frozenset: The class IRIs (and blank nodes) declared in the ontology.
+    """
+    entry = _ontology_term_entry(ontology_graph)
+    if entry["classes"] is None:
+        classes = set(ontology_graph.subjects(predicate=RDF.type, object=OWL.Class))
+        classes.update(ontology_graph.subjects(predicate=RDF.type, object=RDFS.Class))
+        entry["classes"] = frozenset(classes)
+    return entry["classes"]
+
+
+def get_type_remap(ontology_graph):
+    """
+    Returns the memo of `rdf:type` remappings for `ontology_graph`, cached (and 
+    invalidated) together with `get_ontology_classes`. Maps a type to its 
+    replacement, or to None when the type is declared in the ontology.
+
+    Args:
+        ontology_graph (rdflib.Graph): The ontology RDF graph.
+
+    Returns:
+        dict: rdf:type → replacement class or None.
+    """
+    return _ontology_term_entry(ontology_graph)["type_remap"]
+
+
+def _ngrams(text, n=3):
+    # Pad so that short strings and word boundaries still yield grams
+    padded = f"{'$' * (n - 1)}{text}{'$' * (n - 1)}"
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+def _bounded_edit_distance(a, b, max_dist):
+    """
+    Levenshtein distance between `a` and `b`, or `max_dist + 1` as soon as it is
+    known to exceed `max_dist`.
+    """
+    if abs(len(a) - len(b)) > max_dist:
+        return max_dist + 1
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        row_min = i
+        for j, cb in enumerate(b, 1):
+            cost = previous[j - 1] + (ca != cb)
+            cost = min(cost, previous[j] + 1, current[j - 1] + 1)
+            current.append(cost)
+            row_min = min(row_min, cost)
+        if row_min > max_dist:
+            return max_dist + 1
+        previous = current
+    return previous[-1]
+
+
+class OntologyTermIndex:
+    """
+    Reusable matcher from column names to ontology terms.
+
+    Built once over the output of `extract_terms_from_ontology`. Exact matches on
+    the normalized label are a hash lookup. Otherwise candidates are generated from
+    a trigram inverted index, filtered with the q-gram count lemma, and reranked by
+    Levenshtein distance that is abandoned once it exceeds the budget allowed by
+    `cutoff`. The similarity of two normalized labels is
+    `1 - distance / max(len(a), len(b))`.
+
+    Args:
+        ontology_terms (list[dict]): Terms as returned by `extract_terms_from_ontology`.
+        normalizer (callable, optional): Function applied to column names. Must be the
+            one used to build the terms' "normalized" field. Defaults to `normalize`.
+        cutoff (float, optional): Minimum similarity of a fuzzy match. Defaults to 0.8.
+    """
+
+    _Q = 3
+
+    def __init__(self, ontology_terms, normalizer=None, cutoff=0.8):
+        self.ontology_terms = ontology_terms
+        self.normalizer = normalizer or normalize
+        self.cutoff = cutoff
+        self._size = len(ontology_terms)
+
+        # First term for every normalized label, in ontology order
+        self._exact = {}
+        for term in ontology_terms:
+            self._exact.setdefault(term["normalized"], term)
+
+        self._labels = list(self._exact)
+        self._gram_counts = []
+        self._postings = {}
+        for label_id, label in enumerate(self._labels):
+            grams = _ngrams(label, self._Q)
+            self._gram_counts.append(len(grams))
+            # Postings keep each gram's multiplicity in the label for the count lemma
+            for gram, count in Counter(grams).items():
+                self._postings.setdefault(gram, []).append((label_id, count))
+
+    def match(self, column):
+        """
+        Finds the best matching ontology term for a column name.
+
+        Returns:
+            dict or None: The matching term, or None if nothing reaches the cutoff.
+        """
+        norm_col = self.normalizer(column)
+
+        term = self._exact.get(norm_col)
+        if term is not None:
+            return term
+        if not norm_col:
+            return None
+
+        grams = _ngrams(norm_col, self._Q)
+        # Shared grams counted with repeats (multiset intersection), as the lemma requires
+        shared = {}
+        for gram, col_count in Counter(grams).items():
+            for label_id, label_count in self._postings.get(gram, ()):
+                shared[label_id] = shared.get(label_id, 0) + min(col_count, label_count)
+
+        best_id, best_score = None, self.cutoff
+        # Most promising candidates first so the distance budget tightens early
+        for label_id, common in sorted(shared.items(), key=lambda item: (-item[1], item[0])):
+            label = self._labels[label_id]
+            longest = max(len(label), len(norm_col))
+            max_dist = int((1 - best_score) * longest + 1e-9)
+            # q-gram lemma: an edit removes at most q grams
+            if common < max(len(grams), self._gram_counts[label_id]) - self._Q * max_dist:
+                continue
+            dist = _bounded_edit_distance(norm_col, label, max_dist)
+            if dist > max_dist:
+                continue
+            score = 1 - dist / longest
+            if score > best_score or (score == best_score and (best_id is None or label_id < best_id)):
+                best_id, best_score = label_id, score
+
+        return self._exact[self._labels[best_id]] if best_id is not None else None
+
+    def match_columns(self, columns):
+        """
+        Matches many column names at once.
+
+        Args:
+            columns (iterable[str]): Column names.
+
+        Returns:
+            dict: Mapping of each column name to its matching term (or None).
+        """
+        results = {}
+        by_norm = {}
+        for col in columns:
+            norm_col = self.normalizer(col)
+            if norm_col not in by_norm:
+                by_norm[norm_col] = self.match(col)
+            results[col] = by_norm[norm_col]
+        return results
+
+
+_CACHED_TERM_INDEX = None
+
+def get_term_index(ontology_terms, normalizer=None):
+    """
+    Returns an `OntologyTermIndex` for `ontology_terms`, reusing the last index built
+    if it was built for the same (unchanged in size) term list and normalizer.
+    """
+    global _CACHED_TERM_INDEX
+    normalizer = normalizer or normalize
+    cached = _CACHED_TERM_INDEX
+    if (cached is None or cached.ontology_terms is not ontology_terms
+            or cached._size != len(ontology_terms) or cached.normalizer is not normalizer):
+        _CACHED_TERM_INDEX = OntologyTermIndex(ontology_terms, normalizer=normalizer)
+    return _CACHED_TERM_INDEX
+
+
 def find_best_match(column, ontology_terms):
     """
     Find the best matching ontology term for a given column name.
@@ -348,22 +873,7 @@ def find_best_match(column, ontology_terms):
     Returns:
         dict or None: The best-matching ontology term, or None if no good match is found.
     """
-    norm_col = normalize(column)
-
-    # First, try exact normalized match
-    matches = [term for term in ontology_terms if term["normalized"] == norm_col]
-    if matches:
-        return matches[0]
-
-    # Otherwise, find close match using difflib
-    all_norm = [term["normalized"] for term in ontology_terms]
-    close_matches = difflib.get_close_matches(norm_col, all_norm, n=1, cutoff=0.8)
-
-    if close_matches:
-        match_norm = close_matches[0]
-        return next(term for term in ontology_terms if term["normalized"] == match_norm)
-
-    return None
+    return get_term_index(ontology_terms).match(column)
 
 def extract_qudt_units(url="https://qudt.org/vocab/unit/"):
     """
@@ -454,6 +964,7 @@ def extract_quantity_kinds():
 def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
     print(f"\n-- Getting metadata for column: {col} --")
     print("(Type 'skip' or 'exit' to default to UNITLESS)")
+    unit_index = get_unit_index(units)
     
     # --- Part 1: Unit Selection Loop ---
     while True:
@@ -465,11 +976,7 @@ def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
             break
 
         # Search Logic
-        matches = []
-        for key, details in units.items():
-            if (user_input == details.get('ucum_code') or 
-                user_input.lower() == details.get('label').lower()):
-                matches.append(key)
+        matches = unit_index.lookup(user_input, fields=("ucum_code", "label"))
 
         if len(matches) == 1:
             unit = matches[0]
@@ -488,6 +995,9 @@ def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
                 break
         else:
             print(f"No match for '{user_input}'. Try again or type 'exit' to use UNITLESS.")
+            suggestions = unit_index.suggest(user_input)
+            if suggestions:
+                print("Did you mean: " + ", ".join(f"{units[m].get('label', m)} ({units[m].get('ucum_code') or m})" for m in suggestions))
 
     # --- Part 2: Study Stage ---
     valid_study_stages = [
@@ -2,12 +2,12 @@ import pandas as pd
 import json
 import re
 import os
-import difflib
 from rdflib import Graph, Namespace, URIRef
 from rdflib.namespace import RDF, RDFS, OWL, SKOS
-from ..InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from ..InterfaceMDS.ontology_registry import get_shared_ontology_graph
 import requests
 from .MDS_DF.main import MatDatSciDf
+from .MDS_DF.utility import get_unit_index, get_term_index
 
 def normalize(text):
     """
@@ -74,22 +74,8 @@ def find_best_match(column, ontology_terms):
     Returns:
         dict or None: The best-matching ontology term, or None if no good match is found.
     """
-    norm_col = normalize(column)
+    return get_term_index(ontology_terms, normalizer=normalize).match(column)
 
-    # First, try exact normalized match
-    matches = [term for term in ontology_terms if term["normalized"] == norm_col]
-    if matches:
-        return matches[0]
-
-    # Otherwise, find close match using difflib
-    all_norm = [term["normalized"] for term in ontology_terms]
-    close_matches = difflib.get_close_matches(norm_col, all_norm, n=1, cutoff=0.8)
-
-    if close_matches:
-        match_norm = close_matches[0]
-        return next(term for term in ontology_terms if term["normalized"] == match_norm)
-
-    return None
 
 def extract_qudt_units(url="https://qudt.org/vocab/unit/"):
     """
@@ -191,6 +177,7 @@ def extract_quantity_kinds():
 def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
     print(f"\n-- Getting metadata for column: {col} --")
     print("(Type 'skip' or 'exit' to default to UNITLESS)")
+    unit_index = get_unit_index(units)
     
     # --- Part 1: Unit Selection Loop ---
     while True:
@@ -202,11 +189,7 @@ def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
             break
 
         # Search Logic
-        matches = []
-        for key, details in units.items():
-            if (user_input == details.get('ucum_code') or 
-                user_input.lower() == details.get('label').lower()):
-                matches.append(key)
+        matches = unit_index.lookup(user_input, fields=("ucum_code", "label"))
 
         if len(matches) == 1:
             unit = matches[0]
@@ -225,6 +208,9 @@ def prompt_for_missing_fields(col, unit, study_stage, ontology_graph, units):
                 break
         else:
             print(f"No match for '{user_input}'. Try again or type 'exit' to use UNITLESS.")
+            suggestions = unit_index.suggest(user_input)
+            if suggestions:
+                print("Did you mean: " + ", ".join(f"{units[m].get('label', m)} ({units[m].get('ucum_code') or m})" for m in suggestions))
 
     # --- Part 2: Study Stage ---
     valid_study_stages = [
@@ -298,8 +284,7 @@ def jsonld_temp_gen_interface(args):
 
     print(args.ontology_path)
     if args.ontology_path == "default":
-        ontology_graph = Graph()
-        ontology_graph = load_mds_ontology_graph()       
+        ontology_graph = get_shared_ontology_graph()
     else:
         ontology_graph = Graph()
         ontology_graph.parse(source=args.ontology_path)
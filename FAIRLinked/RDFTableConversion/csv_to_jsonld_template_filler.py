@@ -1,16 +1,21 @@
 import os
 import json
+import time
+import warnings
 from pyld import jsonld
 import uuid
 import pandas as pd
 from rdflib import Graph, URIRef, Namespace
 from rdflib.namespace import RDF, OWL, RDFS, DCTERMS
 from urllib.parse import urlparse
-from ..InterfaceMDS.load_mds_ontology import load_mds_ontology_graph
+from ..InterfaceMDS.ontology_registry import get_shared_ontology_graph
 from .. import helper_data as helper_data
 import hashlib
 from importlib import resources
+from tqdm import tqdm
 from .MDS_DF.main import MatDatSciDf
+from .MDS_DF.serialization_plan import TemplateMismatchError
+from .parallel import run_ordered
 
 def load_licenses():
     with resources.files(helper_data).joinpath("licenseinfo.json").open() as f:
@@ -49,14 +54,16 @@ def extract_data_from_csv(
     prop_column_pair_dict=None,   # optional
     ontology_graph=None,          # optional
     base_uri="https://cwrusdle.bitbucket.io/mds/",
-    license=None #optional
+    license=None, #optional
+    chunk_size=None #optional
 ):
     #raise Exception("called exeception")
 
     """
     Converts CSV rows into RDF graphs using a JSON-LD template and optional property mapping,
     writing JSON-LD files. This function assumes that the two rows below the header row contains the unit and the proper
-    ontology name.
+    ontology name. All cells are read as strings, so values are serialized as written in the CSV
+    (e.g. "1", not "1.0", even in a column whose metadata cells are blank).
 
     Parameters
     ----------
@@ -92,15 +99,21 @@ def extract_data_from_csv(
     license : str, optional
         License to be used for the dataset.
 
+    chunk_size : int or None, optional
+        If given, the CSV is read and serialized `chunk_size` data rows at a time, in
+        constant memory. The three metadata rows are read once, and the template and
+        relations are built a single time. Use this for very large CSV files.
+
     Returns
     -------
     List[rdflib.Graph]
-        List of RDFLib Graphs, one per row.
+        List of RDFLib Graphs, one per row. With `chunk_size`, the graphs are not
+        kept and the list holds the path of each written file instead.
     """
 
-    df = pd.read_csv(csv_file)
+    # The template, relations and curator only depend on the header and metadata rows
     mds_df = MatDatSciDf(
-                df = df,
+                df = pd.read_csv(csv_file, nrows=3, dtype=str),
                 metadata_template=metadata_template,
                 orcid=orcid,
                 data_relations_dict=prop_column_pair_dict,
@@ -109,12 +122,38 @@ def extract_data_from_csv(
                 base_uri=base_uri
                 )
 
-    return mds_df.serialize_row(
+    return _serialize_csv(mds_df, csv_file, output_folder, row_key_cols, id_cols, license, chunk_size)
+
+
+def _serialize_csv(mds_df, csv_file, output_folder, row_key_cols, id_cols, license, chunk_size=None, strict=False):
+    """
+    Serializes the data rows of `csv_file` with the template, relations and curator
+    of `mds_df`. See `extract_data_from_csv` for the parameters and return value.
+    With `strict`, a file whose columns do not match the template raises
+    `TemplateMismatchError` instead of warning and writing no rows.
+    """
+    # Cells are read as strings in both modes. Type inference would otherwise depend on
+    # the rows read together (a column with blank metadata cells is read as float,
+    # turning "1" into "1.0", in a full read but not in a chunk)
+    if chunk_size:
+        chunks = pd.read_csv(csv_file, skiprows=range(1, 4), dtype=str, chunksize=chunk_size)
+        return mds_df.serialize_row_chunks(
+                chunks,
+                output_folder=output_folder,
+                row_key_cols=row_key_cols,
+                id_cols=id_cols,
+                license=license,
+                write_files=True,
+                strict=strict
+                )
+
+    return mds_df.with_data(pd.read_csv(csv_file, dtype=str), metadata_rows=True).serialize_row(
             output_folder=output_folder,
             row_key_cols=row_key_cols,
             id_cols=id_cols,
             license=license,
-            write_files=True
+            write_files=True,
+            strict=strict
             )
 
 
@@ -210,6 +249,28 @@ def resolve_predicate(key, ontology_graph):
     return pred_uri, label_type
 
 
+def _license_uri(license_id: str) -> str:
+    """
+    Converts an SPDX short identifier (e.g. "MIT") to its SPDX URI, after checking it
+    against the bundled SPDX license list. A full URI (starting with "http") is
+    returned as-is.
+    """
+    if license_id.startswith("http"):
+        # Full URI provided; assume it's valid
+        return license_id
+
+    spdx_data = load_licenses()
+    valid_ids = {lic["licenseId"] for lic in spdx_data["licenses"]}
+
+    # Check if the provided short ID is valid
+    if license_id not in valid_ids:
+        raise ValueError(
+            f"Invalid SPDX license ID '{license_id}'.\n"
+            f"Please use one from https://spdx.org/licenses/."
+        )
+    return f"https://spdx.org/licenses/{license_id}.html"
+
+
 def write_license_triple(output_folder: str, base_uri: str, license_id: str):
     """
     Creates a compact JSON-LD file defining a single RDF triple that links a dataset to its license.
@@ -262,26 +323,7 @@ def write_license_triple(output_folder: str, base_uri: str, license_id: str):
     """
 
     # --- 1️⃣ Validate and convert SPDX short ID to full URI ---
-    if not license_id.startswith("http"):
-        # Load SPDX license list
-        
-
-        spdx_data = load_licenses()
-
-        valid_ids = {lic["licenseId"] for lic in spdx_data["licenses"]}
-
-        # Check if the provided short ID is valid
-        if license_id not in valid_ids:
-            raise ValueError(
-                f"Invalid SPDX license ID '{license_id}'.\n"
-                f"Please use one from https://spdx.org/licenses/."
-            )
-
-        license_uri = f"https://spdx.org/licenses/{license_id}.html"
-
-    else:
-        # Full URI provided; assume it's valid
-        license_uri = license_id
+    license_uri = _license_uri(license_id)
 
 
     # Create RDF graph
@@ -320,12 +362,21 @@ def extract_from_folder(
     prop_column_pair_dict=None, 
     ontology_graph=None,
     base_uri="https://cwrusdle.bitbucket.io/mds/",
-    license=None
+    license=None,
+    chunk_size=None,
+    workers=1
     ):
     """
     Processes all CSV files in a folder and converts each into RDF/JSON-LD files
     using a metadata template and optional object/datatype property mappings.
 
+    The ontology, license and verified ORCID are set up once for the whole folder
+    and shared by every file. With a metadata template, the template and relations
+    are built once as well. Without one, a template is generated from each file's
+    metadata rows and its relations are discovered from it, once per distinct
+    header and metadata rows. A file that fails is recorded in the manifest and the
+    remaining files are still converted.
+
     Parameters
     ----------
     csv_folder : str
@@ -358,51 +409,188 @@ def extract_from_folder(
     base_uri : str, optional
         Base URI used to construct RDF subject and object URIs. Defaults to the CWRU MDS base.
 
+    chunk_size : int or None, optional
+        Read and serialize each CSV `chunk_size` rows at a time, see `extract_data_from_csv`.
+
+    workers : int, optional
+        Number of worker processes converting files in parallel. Printed output
+        and warnings of each file are replayed in file order. Defaults to 1.
+
     Returns
     -------
-    None
-        Writes JSON-LD files to disk. No return value.
+    list[dict]
+        The conversion manifest, one entry per CSV file (in name order) with keys
+        "file", "output_folder", "status", "rows", "seconds" and "error". The
+        status is "ok", "empty" (the file has no data rows) or "failed" (an error,
+        or columns that do not match the template, so that no row was written).
+        It is also saved as ``extraction_manifest.json`` in `output_base_folder`.
     """
 
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
     os.makedirs(output_base_folder, exist_ok=True)
     # orcid = orcid.replace("-", "")
 
     if (license):
+        license = _license_uri(license)
         write_license_triple(output_base_folder, base_uri, license)
 
-    for filename in os.listdir(csv_folder):
-        if not filename.endswith(".csv"):
-            continue
+    csv_files = sorted(f for f in os.listdir(csv_folder) if f.endswith(".csv"))
+    if not csv_files:
+        return []
 
-        csv_path = os.path.join(csv_folder, filename)
-
-        if row_key_cols:
-            types_used = [
-                entry["@type"].split(":")[-1]
-                for entry in metadata_template.get("@graph", [])
-                if "@type" in entry and entry.get("skos:altLabel") in row_key_cols
-            ]
-        else:
-            types_used = []
+    if row_key_cols:
+        types_used = [
+            entry["@type"].split(":")[-1]
+            for entry in (metadata_template or {}).get("@graph", [])
+            if "@type" in entry and entry.get("skos:altLabel") in row_key_cols
+        ]
+    else:
+        types_used = []
+    type_suffix = "-".join(set(types_used)) or "Unknown"
+
+    # Shared state (ORCID, ontology, template and relations), built once from the
+    # first file's header and metadata rows. Without a template, files with other
+    # header or metadata rows get their own template from `with_metadata_rows`.
+    first_header = pd.read_csv(os.path.join(csv_folder, csv_files[0]), nrows=3, dtype=str)
+    prototype = MatDatSciDf(
+        df=first_header,
+        metadata_template=metadata_template,
+        orcid=orcid,
+        data_relations_dict=prop_column_pair_dict,
+        metadata_rows=True,
+        ontology_graph=ontology_graph,
+        base_uri=base_uri
+    )
+    layouts = None if metadata_template else {_csv_layout(first_header): prototype}
 
-        type_suffix = "-".join(set(types_used)) or "Unknown"
+    tasks = []
+    for filename in csv_files:
         uid = str(uuid.uuid4())[:8]
-        folder_name = f"Dataset-{uid}-{type_suffix}"
-        output_folder = os.path.join(output_base_folder, folder_name)
-
+        output_folder = os.path.join(output_base_folder, f"Dataset-{uid}-{type_suffix}")
         os.makedirs(output_folder, exist_ok=True)
-        
-        extract_data_from_csv(
-            metadata_template=metadata_template, 
-            csv_file=csv_path,
-            orcid=orcid,
-            row_key_cols=row_key_cols, 
-            id_cols=id_cols, 
-            output_folder=output_folder, 
-            prop_column_pair_dict=prop_column_pair_dict, 
-            ontology_graph=ontology_graph, 
-            base_uri=base_uri,
-            license=license)
+        tasks.append((filename, os.path.join(csv_folder, filename), output_folder))
+
+    job = dict(
+        prototype=prototype,
+        layouts=layouts,
+        row_key_cols=row_key_cols,
+        id_cols=id_cols,
+        prop_column_pair_dict=prop_column_pair_dict,
+        license=license,
+        chunk_size=chunk_size
+    )
+
+    manifest = []
+    started = time.perf_counter()
+    progress = tqdm(total=len(tasks), desc="Converting CSV files", unit="file")
+
+    def record(entry):
+        manifest.append(entry)
+        progress.update(1)
+        rows = sum(e["rows"] for e in manifest)
+        progress.set_postfix(rows=rows, rows_per_s=f"{rows / max(time.perf_counter() - started, 1e-9):.0f}")
+
+    if workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        def worker_died(task, error):
+            # The worker process itself died
+            return _failed_entry(task, error, 0.0)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_folder_worker, initargs=(job,)) as pool:
+            for entry in run_ordered(pool, tasks, _convert_folder_task, workers, on_error=worker_died):
+                record(entry)
+    else:
+        for task in tasks:
+            record(_convert_csv_file(job, task))
+    progress.close()
+
+    elapsed = time.perf_counter() - started
+    failed = [e for e in manifest if e["status"] == "failed"]
+    empty = [e for e in manifest if e["status"] == "empty"]
+    converted = len(manifest) - len(failed) - len(empty)
+    rows = sum(e["rows"] for e in manifest)
+    manifest_path = os.path.join(output_base_folder, "extraction_manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+
+    print(f"✅ Converted {converted}/{len(manifest)} CSV files ({rows} rows in {elapsed:.1f}s, {rows / max(elapsed, 1e-9):.0f} rows/s)")
+    if failed:
+        warnings.warn(f"{len(failed)} CSV file(s) failed to convert: {', '.join(e['file'] for e in failed)}. See {manifest_path}")
+    if empty:
+        warnings.warn(f"{len(empty)} CSV file(s) had no data rows: {', '.join(e['file'] for e in empty)}. See {manifest_path}")
+    print(f"📄 Extraction manifest saved to: {manifest_path}")
+
+    return manifest
+
+
+#### FOLDER WORKERS ####
+
+_folder_job = None
+
+
+def _init_folder_worker(job):
+    global _folder_job
+    _folder_job = job
+
+
+def _failed_entry(task, error, seconds):
+    filename, _, output_folder = task
+    return {
+        "file": filename,
+        "output_folder": output_folder,
+        "status": "failed",
+        "rows": 0,
+        "seconds": round(seconds, 3),
+        "error": f"{type(error).__name__}: {error}",
+    }
+
+
+def _convert_csv_file(job, task):
+    # Converts one file of `extract_from_folder` and returns its manifest entry.
+    # Columns that do not match the template (TemplateMismatchError) fail the file
+    filename, csv_path, output_folder = task
+    started = time.perf_counter()
+    try:
+        results = _convert_csv_task(job, csv_path, output_folder)
+    except Exception as e:
+        return _failed_entry(task, e, time.perf_counter() - started)
+    return {
+        "file": filename,
+        "output_folder": output_folder,
+        "status": "ok" if results else "empty",
+        "rows": len(results),
+        "seconds": round(time.perf_counter() - started, 3),
+        "error": None,
+    }
+
+
+def _csv_layout(header: pd.DataFrame) -> tuple:
+    # The header and metadata rows of a file, which its generated template depends on
+    return tuple(header.columns), tuple(tuple(row) for row in header.fillna("").itertuples(index=False))
+
+
+def _convert_csv_task(job, csv_path, output_folder):
+    # Serializes one file of `extract_from_folder` and returns the written rows
+    mds_df = job["prototype"]
+    layouts = job["layouts"]
+    if layouts is not None:
+        header = pd.read_csv(csv_path, nrows=3, dtype=str)
+        layout = _csv_layout(header)
+        if layout not in layouts:
+            layouts[layout] = mds_df.with_metadata_rows(header, job["prop_column_pair_dict"])
+        mds_df = layouts[layout]
+    return _serialize_csv(
+        mds_df, csv_path, output_folder,
+        job["row_key_cols"], job["id_cols"], job["license"], job["chunk_size"], strict=True
+    )
+
+
+def _convert_folder_task(task):
+    # Runs in a worker, see `extract_from_folder`
+    return _convert_csv_file(_folder_job, task)
 
 
 def extract_data_from_csv_interface(args):
@@ -420,7 +608,7 @@ def extract_data_from_csv_interface(args):
     # Load ontology if given
     ontology_graph = None
     if args.ontology_path == "default" or args.ontology_path is None:
-        ontology_graph = load_mds_ontology_graph()
+        ontology_graph = get_shared_ontology_graph()
     else:
         ontology_graph = Graph()
         ontology_graph.parse(args.ontology_path)
@@ -436,7 +624,8 @@ def extract_data_from_csv_interface(args):
         prop_column_pair_dict=args.prop_col,
         ontology_graph=ontology_graph,
         base_uri=args.base_uri,
-        license=args.license
+        license=args.license,
+        chunk_size=getattr(args, "chunk_size", None)
     )
 
 
@@ -0,0 +1,66 @@
+import io
+import warnings
+import contextlib
+from collections import deque
+from typing import Callable, Iterable, Iterator, Optional
+
+
+#### ORDERED PROCESS POOL ####
+
+def run_captured(fn: Callable, task) -> tuple:
+    """
+    Runs `fn(task)` with its printed output and warnings captured, so that they can
+    be replayed by another process.
+
+    Returns:
+        tuple: (result, printed output, list of (warning message, category)).
+    """
+    stdout = io.StringIO()
+    with warnings.catch_warnings(record=True) as caught, contextlib.redirect_stdout(stdout):
+        warnings.simplefilter("always")
+        result = fn(task)
+    return result, stdout.getvalue(), [(str(w.message), w.category) for w in caught]
+
+
+def run_ordered(pool, tasks: Iterable, fn: Callable, workers: int, on_error: Optional[Callable] = None) -> Iterator:
+    """
+    Runs `fn(task)` for every task in a process pool and yields the results in task order.
+
+    At most 2 * `workers` tasks are in flight, so only a bounded number of tasks and
+    results is held in memory whatever the number of tasks. The printed output and
+    warnings of each task are captured in the worker (see `run_captured`) and replayed
+    here just before its result is yielded, so they do not depend on the number of
+    workers or on scheduling.
+
+    Args:
+        pool (concurrent.futures.Executor): The pool running the tasks.
+        tasks (iterable): Arguments of `fn`, one per task. Consumed lazily.
+        fn (callable): A picklable (module-level) function of one argument.
+        workers (int): Number of workers of `pool`.
+        on_error (callable, optional): Called with (task, exception) when a task
+            raises or its worker dies; its return value is yielded instead of the
+            task's result. By default the exception is raised.
+
+    Yields:
+        The result of `fn` for every task, in task order.
+    """
+    def collect(task, future):
+        try:
+            result, output, messages = future.result()
+        except Exception as e:
+            if on_error is None:
+                raise
+            return on_error(task, e)
+        if output:
+            print(output, end="")
+        for message, category in messages:
+            warnings.warn(message, category, stacklevel=2)
+        return result
+
+    pending = deque()
+    for task in tasks:
+        pending.append((task, pool.submit(run_captured, fn, task)))
+        if len(pending) >= 2 * workers:
+            yield collect(*pending.popleft())
+    while pending:
+        yield collect(*pending.popleft())
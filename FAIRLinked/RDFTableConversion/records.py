@@ -0,0 +1,40 @@
+import pandas as pd
+from typing import Iterator, Optional
+
+
+#### FAST ROW ITERATION ####
+
+def iter_records(df: pd.DataFrame, columns: Optional[list] = None) -> Iterator[tuple]:
+    """
+    Iterates over the rows of a DataFrame as plain dictionaries.
+
+    A faster replacement for `df.iterrows()` in the RDF writers. Each column is
+    converted once to an array of Python objects, with its null mask computed once,
+    instead of boxing every row into a `pd.Series`. Unlike `iterrows()`, values keep
+    the dtype of their own column (an integer column is not upcast to float because
+    the frame also has float columns).
+
+    Values are Python-native where pandas provides them (int, float, bool, str,
+    `pd.Timestamp`, ...) and missing values (NaN, NaT, None, pd.NA) are all given
+    as None, so `pd.notna(value)` and `row.get(column)` behave as before.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to iterate over.
+        columns (list, optional): Columns to include. Defaults to all columns.
+
+    Yields:
+        tuple: (index label, dict mapping column name → value) for every row.
+    """
+    columns = list(df.columns) if columns is None else list(columns)
+    arrays = []
+    for col in columns:
+        series = df[col]
+        values = series.to_numpy(dtype=object)
+        mask = series.isna().to_numpy()
+        if mask.any():
+            values = values.copy()
+            values[mask] = None
+        arrays.append(values)
+
+    for idx, *values in zip(df.index, *arrays):
+        yield idx, dict(zip(columns, values))
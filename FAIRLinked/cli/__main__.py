@@ -5,7 +5,7 @@ import ast
 # Import your subpackage entry functions
 from FAIRLinked.InterfaceMDS import add_term_to_ontology, term_search_general, domain_subdomain_viewer, domain_subdomain_directory, domain_subdomain_dir_interface, fuzzy_search_interface, filter_interface
 from FAIRLinked.RDFTableConversion import extract_data_from_csv, extract_from_folder, jsonld_directory_to_csv, jsonld_temp_gen_interface, extract_data_from_csv_interface
-from FAIRLinked.QBWorkflow import rdf_data_cube_workflow_start
+from FAIRLinked.QBWorkflow import rdf_data_cube_workflow_start, data_cube_batch_interface
 
 
 def comma_separated_list(value):
@@ -179,6 +179,12 @@ def main():
         default =None,
         help="(Optional) License used, find valid licenses at https://spdx.org/licenses/"
     )
+    data_extract_parser.add_argument("-cs",
+        "--chunk_size",
+        type=int,
+        default=None,
+        help="(Optional) Read and serialize the CSV this many rows at a time, for very large files"
+    )
     data_extract_parser.set_defaults(func=extract_data_from_csv_interface)
 
     # Deserialize a directory of JSON-LDs back into a CSV
@@ -224,6 +230,22 @@ def main():
     )
     data_cube_workflow_parser.set_defaults(func=lambda args: rdf_data_cube_workflow_start())
 
+    data_cube_batch_parser = subparsers.add_parser(
+        "data-cube",
+        help="Run the RDF Data Cube conversion without prompts, from a run spec",
+        description="""
+        Converts one or more data workbooks to RDF Data Cube without prompts. The run spec (YAML or JSON)
+        gives the ORCID, namespace Excel or map, conversion mode, dataset name, ID columns and output folder.
+        Each workbook is written to its own folder under the output folder, and a data_cube_batch.json
+        report lists the outcome of every workbook.
+        """,
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    data_cube_batch_parser.add_argument("-s", "--spec", required=True, help="Path to the YAML/JSON run spec")
+    data_cube_batch_parser.add_argument("-i", "--inputs", nargs="+",
+        help="(Optional) Data workbooks or glob patterns. Defaults to the 'inputs' of the run spec")
+    data_cube_batch_parser.set_defaults(func=data_cube_batch_interface)
+
 
     # --------------------
     # Dispatch
@@ -43,6 +43,9 @@ setup(
         'dev': [
             'pytest',
             'pytest-cov'
+        ],
+        'yaml': [
+            'PyYAML>=5.1'
         ]
     },
     python_requires='>=3.10.0',
@@ -59,6 +62,6 @@ setup(
             'FAIRLinked=FAIRLinked.cli.__main__:main',
         ],
     },
-    package_data={'FAIRLinked.helper_data': ['*.json', '*.ttl']},
+    package_data={'FAIRLinked.helper_data': ['*.json', '*.ttl', '*.arrow']},
     include_package_data=True
 )
\ No newline at end of file
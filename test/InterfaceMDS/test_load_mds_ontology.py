@@ -0,0 +1,125 @@
+import os
+import pytest
+from unittest.mock import MagicMock, patch
+from rdflib import Graph
+from FAIRLinked.InterfaceMDS import load_mds_ontology
+from FAIRLinked.InterfaceMDS.load_mds_ontology import (
+    load_mds_ontology_graph,
+    list_cached_ontology_versions,
+    get_ontology_cache_dir,
+)
+
+
+"""
+Tests for load_mds_ontology.py — the cached MDS-Onto loader.
+
+HTTP requests are mocked so the tests run offline; every test uses its own
+temporary cache directory.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+def _ontology_ttl(version: str) -> str:
+    return f"""
+    @prefix owl: <http://www.w3.org/2002/07/owl#> .
+    @prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+    @prefix mds: <https://cwrusdle.bitbucket.io/mds/> .
+
+    <https://w3id.org/mds/> a owl:Ontology ; owl:versionInfo "{version}" .
+    mds:Temperature a owl:Class ; rdfs:label "Temperature" .
+    """
+
+
+def _response(status_code=200, text="", etag=None):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.text = text
+    resp.headers = {"ETag": etag} if etag else {}
+    resp.raise_for_status.return_value = None
+    return resp
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    for var in (load_mds_ontology.CACHE_DIR_ENV, load_mds_ontology.OFFLINE_ENV, load_mds_ontology.PINNED_VERSION_ENV):
+        monkeypatch.delenv(var, raising=False)
+
+
+@pytest.fixture
+def mock_get():
+    with patch("FAIRLinked.InterfaceMDS.load_mds_ontology.requests.get") as m:
+        yield m
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestOntologyCache:
+    def test_fetch_writes_snapshot(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"), etag='"abc"')
+        g = load_mds_ontology_graph(cache_dir=str(tmp_path))
+        assert isinstance(g, Graph)
+        assert list_cached_ontology_versions(str(tmp_path)) == ["1.0.0"]
+
+    def test_not_modified_uses_snapshot(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"), etag='"abc"')
+        first = load_mds_ontology_graph(cache_dir=str(tmp_path))
+
+        mock_get.reset_mock()
+        mock_get.return_value = _response(status_code=304)
+        second = load_mds_ontology_graph(cache_dir=str(tmp_path))
+
+        sent_headers = mock_get.call_args.kwargs["headers"]
+        assert sent_headers["If-None-Match"] == '"abc"'
+        assert len(second) == len(first)
+
+    def test_offline_never_calls_network(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"))
+        load_mds_ontology_graph(cache_dir=str(tmp_path))
+        mock_get.reset_mock()
+
+        g = load_mds_ontology_graph(cache_dir=str(tmp_path), offline=True)
+        assert g is not None
+        mock_get.assert_not_called()
+
+    def test_offline_without_cache_returns_none(self, tmp_path, mock_get):
+        assert load_mds_ontology_graph(cache_dir=str(tmp_path), offline=True) is None
+        mock_get.assert_not_called()
+
+    def test_offline_from_environment(self, tmp_path, mock_get, monkeypatch):
+        monkeypatch.setenv(load_mds_ontology.OFFLINE_ENV, "1")
+        monkeypatch.setenv(load_mds_ontology.CACHE_DIR_ENV, str(tmp_path))
+        assert load_mds_ontology_graph() is None
+        mock_get.assert_not_called()
+
+    def test_pinned_version_loaded_without_network(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"))
+        load_mds_ontology_graph(cache_dir=str(tmp_path))
+        mock_get.return_value = _response(text=_ontology_ttl("2.0.0"))
+        load_mds_ontology_graph(cache_dir=str(tmp_path))
+        mock_get.reset_mock()
+
+        g = load_mds_ontology_graph(cache_dir=str(tmp_path), version="1.0.0")
+        assert g is not None
+        mock_get.assert_not_called()
+        assert list_cached_ontology_versions(str(tmp_path)) == ["1.0.0", "2.0.0"]
+
+    def test_pinned_version_mismatch_returns_none(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("2.0.0"))
+        assert load_mds_ontology_graph(cache_dir=str(tmp_path), version="1.0.0") is None
+
+    def test_network_failure_falls_back_to_snapshot(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"))
+        load_mds_ontology_graph(cache_dir=str(tmp_path))
+
+        mock_get.side_effect = ConnectionError("no network")
+        assert load_mds_ontology_graph(cache_dir=str(tmp_path)) is not None
+
+    def test_use_cache_false_writes_nothing(self, tmp_path, mock_get):
+        mock_get.return_value = _response(text=_ontology_ttl("1.0.0"))
+        load_mds_ontology_graph(cache_dir=str(tmp_path), use_cache=False)
+        assert not os.path.exists(get_ontology_cache_dir(str(tmp_path)))
@@ -0,0 +1,110 @@
+import threading
+import pytest
+from unittest.mock import patch
+from rdflib import Graph, URIRef, Literal
+from rdflib.namespace import RDFS
+from FAIRLinked.InterfaceMDS import ontology_registry
+from FAIRLinked.InterfaceMDS.ontology_registry import (
+    SharedOntologyGraph,
+    get_shared_ontology_graph,
+    clear_shared_ontology_graph,
+    ontology_registry_stats,
+)
+
+
+"""
+Tests for ontology_registry.py — the lazily loaded, process-wide MDS-Onto graph.
+
+The underlying loader is mocked so that no network or disk cache is touched.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+def _small_graph():
+    g = Graph()
+    g.add((URIRef("https://cwrusdle.bitbucket.io/mds/Temperature"), RDFS.label, Literal("Temperature")))
+    return g
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    clear_shared_ontology_graph()
+    yield
+    clear_shared_ontology_graph()
+
+
+@pytest.fixture
+def mock_loader():
+    with patch("FAIRLinked.InterfaceMDS.ontology_registry.load_mds_ontology.load_mds_ontology_graph",
+               return_value=_small_graph()) as m:
+        yield m
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestSharedOntology:
+    def test_loads_once_and_shares_graph(self, mock_loader):
+        first = get_shared_ontology_graph()
+        second = get_shared_ontology_graph()
+        assert first is second
+        assert mock_loader.call_count == 1
+
+    def test_reload_loads_again(self, mock_loader):
+        get_shared_ontology_graph()
+        get_shared_ontology_graph(reload=True)
+        assert mock_loader.call_count == 2
+
+    def test_failed_load_is_not_retried(self, mock_loader):
+        mock_loader.return_value = None
+        assert get_shared_ontology_graph() is None
+        assert get_shared_ontology_graph() is None
+        assert mock_loader.call_count == 1
+        assert ontology_registry_stats()["loaded"] is False
+
+    def test_concurrent_first_access_loads_once(self, mock_loader):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_shared_ontology_graph())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert mock_loader.call_count == 1
+        assert all(r is results[0] for r in results)
+
+    def test_stats(self, mock_loader):
+        assert ontology_registry_stats()["loaded"] is False
+        get_shared_ontology_graph()
+        stats = ontology_registry_stats()
+        assert stats["loaded"] is True
+        assert stats["triples"] == 1
+        assert stats["load_seconds"] is not None
+        assert stats["loaded_at"] is not None
+
+
+class TestSharedOntologyDescriptor:
+    def test_descriptor_is_lazy_and_shared(self, mock_loader):
+        class A:
+            mds_graph = SharedOntologyGraph()
+
+        class B:
+            mds_graph = SharedOntologyGraph()
+
+        mock_loader.assert_not_called()
+        assert A.mds_graph is B.mds_graph
+        assert A().mds_graph is A.mds_graph
+        assert mock_loader.call_count == 1
+
+    def test_descriptor_can_be_patched(self, mock_loader):
+        class A:
+            mds_graph = SharedOntologyGraph()
+
+        replacement = Graph()
+        with patch.object(A, "mds_graph", new=replacement):
+            assert A.mds_graph is replacement
+        mock_loader.assert_not_called()
+        assert isinstance(A.__dict__["mds_graph"], SharedOntologyGraph)
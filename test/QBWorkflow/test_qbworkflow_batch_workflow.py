@@ -0,0 +1,144 @@
+import os
+import json
+import shutil
+import pytest
+from unittest.mock import patch
+from rdflib import Graph
+from rdflib.namespace import QB
+
+from FAIRLinked.QBWorkflow.batch_workflow import (
+    BATCH_MANIFEST_FILE,
+    load_run_spec,
+    load_spec_namespaces,
+    run_data_cube_batch,
+)
+from FAIRLinked.QBWorkflow.rdf_transformer import prepare_namespaces
+
+
+"""
+Tests for batch_workflow.py — the non-interactive, run-spec driven RDF Data Cube conversion.
+"""
+
+
+DATA_DIR = 'test/test_data/QB_test_data'
+ORCID = '0000-0001-2345-6789'
+
+
+# =============================================================================
+#                           TEST FIXTURES
+# =============================================================================
+
+@pytest.fixture
+def batch_dir(tmp_path):
+    """Two small workbooks and the namespace template next to a run spec."""
+    for name in ('mock_xrd_data.xlsx', 'namespace_template.xlsx'):
+        shutil.copy(os.path.join(DATA_DIR, name), tmp_path / name)
+    shutil.copy(os.path.join(DATA_DIR, 'mock_xrd_data.xlsx'), tmp_path / 'second_run.xlsx')
+    return tmp_path
+
+
+def _write_spec(folder, **settings):
+    spec = {'orcid': ORCID, 'output_folder': 'out', 'namespace_excel': 'namespace_template.xlsx'}
+    spec.update(settings)
+    path = folder / 'run.json'
+    path.write_text(json.dumps(spec))
+    return str(path)
+
+
+@pytest.fixture
+def no_prompts():
+    """Fails the test if any conversion step falls back to a prompt."""
+    with patch('builtins.input', side_effect=AssertionError("unexpected prompt")):
+        yield
+
+
+# =============================================================================
+#                           TEST: load_run_spec()
+# =============================================================================
+
+class TestLoadRunSpec:
+
+    def test_defaults_and_relative_paths(self, batch_dir):
+        spec = load_run_spec(_write_spec(batch_dir, inputs=['*.xlsx']))
+        assert spec['mode'] == 'entire'
+        assert spec['user_prefix'] == 'mds'
+        assert spec['id_columns'] == [] and spec['workers'] == 1
+        assert spec['output_folder'] == str(batch_dir / 'out')
+        assert spec['namespace_excel'] == str(batch_dir / 'namespace_template.xlsx')
+        assert spec['inputs'] == [str(batch_dir / '*.xlsx')]
+
+    def test_yaml_spec(self, batch_dir):
+        pytest.importorskip('yaml')
+        path = batch_dir / 'run.yaml'
+        path.write_text(f"orcid: {ORCID}\noutput_folder: out\nmode: CRADLE\n"
+                        "namespace_map:\n  ex: http://example.com/ns/\nid_columns: [ExperimentId]\n")
+        spec = load_run_spec(str(path))
+        assert spec['mode'] == 'CRADLE' and spec['id_columns'] == ['ExperimentId']
+        assert str(load_spec_namespaces(spec)['ex']) == 'http://example.com/ns/'
+
+    @pytest.mark.parametrize("settings, message", [
+        ({'orcid': '1234'}, "Invalid ORCID"),
+        ({'mode': 'rows'}, "Invalid mode"),
+        ({'mode': 'row-by-row', 'bundle': 'rar'}, "Invalid bundle"),
+        ({'bundle': 'tar'}, "only applies"),
+        ({'workers': 0}, "workers must be at least 1"),
+        ({'mode': 'row-by-row', 'streaming': True}, "only apply to entire mode"),
+        ({'streaming': 'yes'}, "must be true or false"),
+        ({'id_columns': 'ExperimentId'}, "must be a list"),
+        ({'dataset': 'x'}, "Unknown run spec keys"),
+        ({'namespace_map': {'ex': 'http://example.com/'}}, "not both"),
+    ])
+    def test_invalid_spec(self, batch_dir, settings, message):
+        with pytest.raises(ValueError, match=message):
+            load_run_spec(_write_spec(batch_dir, **settings))
+
+
+# =============================================================================
+#                           TEST: run_data_cube_batch()
+# =============================================================================
+
+class TestRunDataCubeBatch:
+
+    def test_entire_mode_without_prompts(self, batch_dir, no_prompts):
+        spec = load_run_spec(_write_spec(batch_dir, id_columns=['ExperimentId']))
+        results = run_data_cube_batch(spec, [str(batch_dir / 'mock_xrd_data.xlsx'), str(batch_dir / 'second_*.xlsx'),
+                                            str(batch_dir / 'absent.xlsx')])
+
+        assert [r['status'] for r in results] == ['ok', 'ok', 'failed']
+        assert 'absent.xlsx' in results[2]['error']
+
+        manifest = json.loads((batch_dir / 'out' / BATCH_MANIFEST_FILE).read_text())
+        assert manifest['workbooks'] == results
+
+        # Each workbook gets its own folder, named after it, with one dataset named after it
+        for record, name in zip(results, ('mock_xrd_data', 'second_run')):
+            assert os.path.dirname(record['output']) == str(batch_dir / 'out' / name)
+            ttl_files = os.listdir(os.path.join(record['output'], 'ttl'))
+            assert len(ttl_files) == 1 and ttl_files[0].startswith(f'{name}_')
+            g = Graph().parse(os.path.join(record['output'], 'ttl', ttl_files[0]))
+            slices = list(g.subjects(None, QB.Slice))
+            assert len(slices) == record['rows']
+            assert all('Slice_' in str(s) for s in slices)
+
+    def test_namespaces_prepared_once(self, batch_dir, no_prompts):
+        spec = load_run_spec(_write_spec(batch_dir, mode='row-by-row'))
+        with patch('FAIRLinked.QBWorkflow.batch_workflow.prepare_namespaces',
+                   wraps=prepare_namespaces) as batch_prepare, \
+             patch('FAIRLinked.QBWorkflow.rdf_transformer.prepare_namespaces',
+                   wraps=prepare_namespaces) as per_workbook_prepare:
+            results = run_data_cube_batch(spec, [str(batch_dir / 'mock_xrd_data.xlsx'),
+                                                 str(batch_dir / 'second_run.xlsx')])
+        assert [r['status'] for r in results] == ['ok', 'ok']
+        assert batch_prepare.call_count == 1
+        assert per_workbook_prepare.call_count == 0
+
+    def test_unknown_id_column_fails_workbook(self, batch_dir, no_prompts):
+        spec = load_run_spec(_write_spec(batch_dir, mode='row-by-row', id_columns=['NoSuchId']))
+        results = run_data_cube_batch(spec, [str(batch_dir / 'mock_xrd_data.xlsx')])
+        assert results[0]['status'] == 'failed'
+        assert "ID columns not found in the data: ['NoSuchId']" in results[0]['error']
+
+    def test_no_inputs(self, batch_dir):
+        spec = load_run_spec(_write_spec(batch_dir))
+        with pytest.raises(ValueError, match="No input workbooks"):
+            run_data_cube_batch(spec)
@@ -1,5 +1,7 @@
 import os
 import json
+import hashlib
+import random
 import pandas as pd
 import pytest
 import rdflib
@@ -22,6 +24,10 @@ from FAIRLinked.RDFTableConversion.csv_to_jsonld_mapper import prompt_for_missin
 
 
 from FAIRLinked.QBWorkflow.rdf_transformer import convert_row_by_row, prepare_namespaces, convert_entire_dataset, convert_row_by_row_CRADLE
+from FAIRLinked.QBWorkflow.rdf_transformer import RowGraphFactory, RowOutputWriter, create_dsd, compute_file_hash, write_rows
+import tarfile
+import zipfile
+from rdflib.compare import isomorphic
 
 
 
@@ -242,6 +248,54 @@ class TestConvertRowByRow:
                 assert all(c in '0123456789abcdef' for c in hash_value.lower()), \
                     "Hash should only contain hex characters"
 
+    def test_every_row_carries_the_dsd(self, simple_test_dataframe, simple_metadata,
+                                       namespace_map, temp_output_dir, mock_user_input):
+        """Verify the shared DSD is written into each row's TTL and JSON-LD, which hold the same graph."""
+        ns_map = prepare_namespaces(namespace_map, 'mds')
+
+        convert_row_by_row(
+            df=simple_test_dataframe,
+            variable_metadata=simple_metadata,
+            ns_map=ns_map,
+            user_chosen_prefix='mds',
+            orcid='0000-0001-2345-6789',
+            root_folder_path=temp_output_dir,
+            overall_timestamp='20250128120000'
+        )
+
+        for ttl_file in Path(temp_output_dir, 'ttl').glob('*.ttl'):
+            ttl_graph = Graph().parse(str(ttl_file), format='turtle')
+            jsonld_file = Path(temp_output_dir, 'jsonld', ttl_file.stem + '.jsonld')
+            jsonld_graph = Graph().parse(str(jsonld_file), format='json-ld')
+
+            assert len(list(ttl_graph.subjects(RDF.type, QB.DataStructureDefinition))) == 1
+            assert len(list(ttl_graph.objects(None, QB.component))) == 6, \
+                "DSD should list 2 dimensions, measureType, 2 measures and unitMeasure"
+            assert isomorphic(ttl_graph, jsonld_graph), "TTL and JSON-LD should hold the same graph"
+
+
+class TestRowGraphFactory:
+    """Tests for RowGraphFactory, which joins a pre-serialized DSD with each row graph."""
+
+    def test_output_equals_dsd_plus_row(self, simple_metadata, namespace_map):
+        ns_map = prepare_namespaces(namespace_map, 'mds')
+        mds = ns_map['mds']
+        dsd_graph, dsd_uri = create_dsd(simple_metadata, ['ExperimentId', 'Material'],
+                                        ['Temperature', 'Pressure'], ns_map, mds)
+        factory = RowGraphFactory(dsd_graph)
+
+        row_graph = factory.new_graph()
+        row_graph.add((mds['Dataset_1'], RDF.type, QB.DataSet))
+        row_graph.add((mds['Dataset_1'], QB.structure, dsd_uri))
+        row_graph.add((mds['Dataset_1'], URIRef('http://example.org/other#note'), Literal('x')))
+        assert len(row_graph) == 3, "Row graphs should not hold a copy of the DSD"
+
+        expected = dsd_graph + row_graph
+        ttl_graph = Graph().parse(data=factory.to_turtle(row_graph), format='turtle')
+        jsonld_graph = Graph().parse(data=factory.to_jsonld(row_graph), format='json-ld')
+        assert isomorphic(ttl_graph, expected)
+        assert isomorphic(jsonld_graph, expected)
+
 """
     def test_experimental_data(self, xrd_dataframe, simple_metadata, 
                                     namespace_map, temp_output_dir, mock_user_input):
@@ -448,6 +502,208 @@ class TestConvertEntireDataset:
         assert str(creators[0]) == test_orcid, "Creator should match provided ORCID"
 
 
+# =============================================================================
+#                    TEST: convert_entire_dataset(streaming=True)
+# =============================================================================
+
+class TestStreamingEntireDataset:
+    """Tests for the streaming mode of convert_entire_dataset()."""
+
+    @staticmethod
+    def _convert(df, metadata, namespace_map, folder, **kwargs):
+        output_folders = {name: os.path.join(folder, name) for name in ('ttl', 'jsonld', 'hash')}
+        for path in output_folders.values():
+            os.makedirs(path, exist_ok=True)
+        convert_entire_dataset(
+            df=df,
+            variable_metadata=metadata,
+            ns_map=prepare_namespaces(namespace_map, 'mds'),
+            user_chosen_prefix='mds',
+            dataset_name='TestDataset',
+            orcid='0000-0001-2345-6789',
+            output_folder_paths=output_folders,
+            overall_timestamp='20250128120000',
+            id_columns=['ExperimentId'],
+            **kwargs
+        )
+        return output_folders
+
+    def test_same_graph_as_in_memory(self, simple_test_dataframe, simple_metadata,
+                                     namespace_map, temp_output_dir):
+        """Streaming Turtle and JSON-LD hold the graph of the in-memory conversion."""
+        # A repeated ID puts two rows in the same slice, spread over two blocks
+        df = pd.concat([simple_test_dataframe, simple_test_dataframe.iloc[[0]]], ignore_index=True)
+        in_memory = self._convert(df, simple_metadata, namespace_map, os.path.join(temp_output_dir, 'a'))
+        streamed = self._convert(df, simple_metadata, namespace_map, os.path.join(temp_output_dir, 'b'),
+                                 streaming=True)
+
+        expected = Graph().parse(os.path.join(in_memory['ttl'], 'TestDataset.ttl'), format='turtle')
+        ttl = Graph().parse(os.path.join(streamed['ttl'], 'TestDataset.ttl'), format='turtle')
+        jsonld_path = os.path.join(streamed['jsonld'], 'TestDataset.jsonld')
+        jsonld = Graph().parse(jsonld_path, format='json-ld')
+        assert isomorphic(ttl, expected)
+        assert isomorphic(jsonld, expected)
+        assert len(list(ttl.subjects(RDF.type, QB.Slice))) == 3
+
+        with open(os.path.join(streamed['hash'], 'TestDataset.jsonld.sha256')) as f:
+            assert f.read() == compute_file_hash(jsonld_path)
+        assert sorted(os.listdir(streamed['ttl'])) == ['TestDataset.ttl']
+
+    def test_turtle_only(self, simple_test_dataframe, simple_metadata, namespace_map, temp_output_dir):
+        """write_jsonld=False => no JSON-LD; the Turtle file is hashed instead."""
+        folders = self._convert(simple_test_dataframe, simple_metadata, namespace_map, temp_output_dir,
+                                streaming=True, write_jsonld=False)
+        assert os.listdir(folders['jsonld']) == []
+        with open(os.path.join(folders['hash'], 'TestDataset.ttl.sha256')) as f:
+            assert f.read() == compute_file_hash(os.path.join(folders['ttl'], 'TestDataset.ttl'))
+
+    def test_failure_leaves_no_part_files(self, simple_test_dataframe, simple_metadata,
+                                          namespace_map, temp_output_dir):
+        """A conversion failing mid-stream removes its part files."""
+        with patch('FAIRLinked.QBWorkflow.rdf_transformer.create_observation',
+                   side_effect=RuntimeError("boom")):
+            with pytest.raises(RuntimeError):
+                self._convert(simple_test_dataframe, simple_metadata, namespace_map, temp_output_dir,
+                              streaming=True)
+        assert os.listdir(os.path.join(temp_output_dir, 'ttl')) == []
+        assert os.listdir(os.path.join(temp_output_dir, 'jsonld')) == []
+
+
+class TestRowOutputWriter:
+    """Tests for bundled row-by-row outputs written through RowOutputWriter."""
+
+    def _convert(self, df, metadata, namespace_map, output_dir, bundle):
+        convert_row_by_row(
+            df=df,
+            variable_metadata=metadata,
+            ns_map=prepare_namespaces(namespace_map, 'mds'),
+            user_chosen_prefix='mds',
+            orcid='0000-0001-2345-6789',
+            root_folder_path=output_dir,
+            overall_timestamp='20250128120000',
+            bundle=bundle
+        )
+
+    @pytest.mark.parametrize("bundle", ["tar", "zip"])
+    def test_archive_matches_folder_layout(self, bundle, simple_test_dataframe, simple_metadata,
+                                           namespace_map, temp_output_dir, mock_user_input):
+        """Verify archives hold the same ttl/jsonld/hash files as the folder layout, and are hashed."""
+        self._convert(simple_test_dataframe, simple_metadata, namespace_map, temp_output_dir, bundle)
+
+        archive_path = os.path.join(temp_output_dir, f'rows.{bundle}')
+        assert sorted(os.listdir(temp_output_dir)) == [f'rows.{bundle}', f'rows.{bundle}.sha256']
+        with open(archive_path + '.sha256') as f:
+            assert f.read() == compute_file_hash(archive_path)
+
+        if bundle == 'tar':
+            with tarfile.open(archive_path) as archive:
+                members = {name: archive.extractfile(name).read() for name in archive.getnames()}
+        else:
+            with zipfile.ZipFile(archive_path) as archive:
+                members = {name: archive.read(name) for name in archive.namelist()}
+
+        assert len(members) == 9, "Should hold 3 rows x (ttl, jsonld, hash)"
+        for name, data in members.items():
+            if name.startswith('hash/'):
+                jsonld = members['jsonld/' + name[len('hash/'):-len('.sha256')]]
+                assert data.decode() == hashlib.sha256(jsonld).hexdigest()
+
+    def test_nquads_one_named_graph_per_row(self, simple_test_dataframe, simple_metadata,
+                                            namespace_map, temp_output_dir, mock_user_input):
+        """Verify the N-Quads bundle holds one named graph per row, each with the DSD."""
+        self._convert(simple_test_dataframe, simple_metadata, namespace_map, temp_output_dir, 'nquads')
+
+        dataset = rdflib.Dataset()
+        dataset.parse(os.path.join(temp_output_dir, 'rows.nq'), format='nquads')
+        graphs = [g for g in dataset.graphs() if len(g)]
+
+        assert len(graphs) == 3, "Should contain one named graph per row"
+        for g in graphs:
+            assert (g.identifier, RDF.type, QB.DataSet) in g, "Graph should be named after the row's qb:DataSet"
+            assert len(list(g.subjects(RDF.type, QB.DataStructureDefinition))) == 1
+
+    def test_invalid_bundle(self, temp_output_dir):
+        with pytest.raises(ValueError, match="Invalid bundle"):
+            RowOutputWriter(temp_output_dir, 'rar')
+
+
+class TestParallelRowByRow:
+    """Tests for the worker-pool mode of convert_row_by_row() and convert_row_by_row_CRADLE()."""
+
+    @staticmethod
+    def _snapshot(folder):
+        return {
+            str(path.relative_to(folder)): path.read_bytes()
+            for path in Path(folder).rglob('*') if path.is_file()
+        }
+
+    @pytest.mark.parametrize("bundle", [None, "nquads"])
+    def test_workers_write_identical_files(self, bundle, simple_test_dataframe, simple_metadata,
+                                           namespace_map, mock_user_input):
+        """Verify that rows written by worker processes are byte-identical to the serial ones."""
+        jobs = []
+        with patch('FAIRLinked.QBWorkflow.rdf_transformer.write_rows',
+                   side_effect=lambda job, rows, *args, **kwargs: jobs.append((job, list(rows)))):
+            convert_row_by_row(
+                df=simple_test_dataframe,
+                variable_metadata=simple_metadata,
+                ns_map=prepare_namespaces(namespace_map, 'mds'),
+                user_chosen_prefix='mds',
+                orcid='0000-0001-2345-6789',
+                root_folder_path=tempfile.mkdtemp(),
+                overall_timestamp='20250128120000'
+            )
+        job, rows = jobs[0]
+
+        outputs = []
+        for workers in (1, 2):
+            folder = tempfile.mkdtemp()
+            write_rows(job, rows, len(rows), folder, bundle=bundle, workers=workers, chunk_size=1)
+            outputs.append(self._snapshot(folder))
+            shutil.rmtree(folder)
+
+        assert outputs[0] == outputs[1]
+        assert len(outputs[0]) == (9 if bundle is None else 2)
+
+    def test_cradle_workers_keep_naming(self, simple_test_dataframe, simple_metadata,
+                                        namespace_map, temp_output_dir, mock_user_input):
+        """Verify the CRADLE file names (random letters included) do not depend on the workers."""
+        names = []
+        for workers in (1, 2):
+            folder = tempfile.mkdtemp()
+            random.seed(7)
+            convert_row_by_row_CRADLE(
+                df=simple_test_dataframe,
+                variable_metadata=simple_metadata,
+                ns_map=prepare_namespaces(namespace_map, 'mds'),
+                user_chosen_prefix='mds',
+                orcid='0000-0001-2345-6789',
+                root_folder_path=folder,
+                overall_timestamp='20250128120000',
+                workers=workers
+            )
+            names.append(sorted(self._snapshot(folder)))
+            shutil.rmtree(folder)
+
+        assert names[0] == names[1]
+        assert len(names[0]) == 9
+        assert mock_user_input['row_ids'].call_count == 2, "Identifier columns are asked once per run, in the parent"
+
+    def test_invalid_workers(self, simple_test_dataframe, simple_metadata, namespace_map,
+                             temp_output_dir, mock_user_input):
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            convert_row_by_row(
+                df=simple_test_dataframe,
+                variable_metadata=simple_metadata,
+                ns_map=prepare_namespaces(namespace_map, 'mds'),
+                user_chosen_prefix='mds',
+                orcid='0000-0001-2345-6789',
+                root_folder_path=temp_output_dir,
+                overall_timestamp='20250128120000',
+                workers=0
+            )
+
+
 # =============================================================================
 #                    COMPARISON TESTS
 # =============================================================================
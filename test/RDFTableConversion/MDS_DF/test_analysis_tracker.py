@@ -37,7 +37,8 @@ def _build_ontology() -> Graph:
 def patch_mds_graph():
     onto = _build_ontology()
     with patch("FAIRLinked.RDFTableConversion.MDS_DF.analysis_tracker.MatDatSciDf.mds_graph", new=onto), \
-         patch("FAIRLinked.RDFTableConversion.MDS_DF.analysis_tracker.load_mds_ontology_graph", return_value=onto):
+         patch("FAIRLinked.RDFTableConversion.MDS_DF.analysis_tracker.AnalysisTracker.mds_graph", new=onto), \
+         patch("FAIRLinked.RDFTableConversion.MDS_DF.analysis_tracker.AnalysisGroup.mds_graph", new=onto):
         yield onto
 
 
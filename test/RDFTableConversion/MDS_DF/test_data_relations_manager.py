@@ -5,7 +5,9 @@ import pytest
 import pandas as pd
 from rdflib import Graph, URIRef, Literal, Namespace
 from rdflib.namespace import RDF, RDFS, OWL
-from FAIRLinked.RDFTableConversion.MDS_DF.data_relations_manager import DataRelationsDict
+from unittest.mock import patch
+from FAIRLinked.RDFTableConversion.MDS_DF import data_relations_manager
+from FAIRLinked.RDFTableConversion.MDS_DF.data_relations_manager import DataRelationsDict, resolve_relations
 
 
 """
@@ -220,6 +222,39 @@ class TestPrintDataRelations:
         assert "No relations defined" in captured.out
 
 
+class TestResolveRelations:
+    def test_label_curie_and_uri_keys(self, simple_ontology, onto_props):
+        table = resolve_relations({
+            "measuredBy": [("Temperature", "Sensor_ID")],
+            "mds:hasValue": [("Temperature", "Value")],
+            str(MDS_NS.measuredBy): [("Value", "Sensor_ID")],
+        }, simple_ontology, onto_props)
+        assert [r.predicate for r in table] == [MDS_NS.measuredBy, MDS_NS.hasValue, MDS_NS.measuredBy]
+        assert [r.prop_type for r in table] == ["Object Property", "Datatype Property", "Object Property"]
+
+    def test_unresolvable_keys_dropped(self, simple_ontology, onto_props):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            table = resolve_relations({"doesNotExist": [("A", "B")], "mds:untyped": [("A", "B")]},
+                                      simple_ontology, onto_props)
+        assert table == []
+
+    def test_pair_positions(self, simple_ontology, onto_props, simple_df):
+        table = resolve_relations({"measuredBy": [("Temperature", "Missing")]},
+                                  simple_ontology, onto_props, columns=list(simple_df.columns))
+        pair = table[0].pairs[0]
+        assert (pair.subj_idx, pair.obj_idx) == (0, None)
+
+    def test_table_reused_until_relations_change(self, simple_ontology, onto_props):
+        d = DataRelationsDict(prop_col_pair_dict={"measuredBy": [("Temperature", "Sensor_ID")]})
+        first = d.resolve(simple_ontology, onto_props)
+        with patch.object(data_relations_manager, "resolve_relations", side_effect=AssertionError("not cached")):
+            assert d.resolve(simple_ontology, onto_props) is first
+
+        d.prop_pair_dict["hasValue"] = [("Temperature", "Value")]
+        assert len(d.resolve(simple_ontology, onto_props)) == 2
+
+
 class TestSaveRelations:
     def test_saves_json_and_txt(self, tmp_path):
         d = DataRelationsDict({"measuredBy": [("Temperature", "Sensor_ID")]})
@@ -9,6 +9,8 @@ import tempfile
 import shutil
 from pathlib import Path
 from FAIRLinked.RDFTableConversion.MDS_DF.main import MatDatSciDf
+from FAIRLinked.RDFTableConversion.MDS_DF.serialization_plan import TemplateMismatchError
+from FAIRLinked.RDFTableConversion.MDS_DF.utility import resolve_predicate
 
 
 """
@@ -21,6 +23,8 @@ are mocked so that every test is fast and fully offline.
 import warnings
 from unittest.mock import MagicMock, patch, PropertyMock
 from rdflib import Graph, URIRef, Literal, Namespace
+from rdflib.compare import isomorphic
+from datetime import datetime, timezone
 from rdflib.namespace import RDF, RDFS, OWL
 
 # ---------------------------------------------------------------------------
@@ -502,6 +506,16 @@ class TestSerializeRow:
         files = list(out.iterdir())
         assert len(files) >= 2
  
+    def test_serialization_plan_reused_until_template_changes(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=2)
+        m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        plan = m.get_serialization_plan()
+        m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        assert m.get_serialization_plan() is plan
+
+        m.add_column_metadata(col_name="Humidity", rdf_type="mds:Humidity", study_stage="Result")
+        assert m.get_serialization_plan() is not plan
+
     def test_na_values_skipped(self, tmp_path):
         df = pd.DataFrame({"Temperature": [100, None]})
         tmpl = _make_template(["Temperature"])
@@ -516,6 +530,239 @@ class TestSerializeRow:
         values_row1 = list(graphs[1].objects(predicate=QUDT.value))
         assert len(values_row1) == 0
 
+    def test_direct_engine_matches_jsonld(self, tmp_path):
+        df = pd.DataFrame({
+            "Temperature": [100.5, None, 7],
+            "Sample": ["S-1", "S-2", None],
+            "Name": ["first", "second", "third"],
+        })
+        tmpl = _make_template(["Temperature", "Sample", "Name"])
+        m = MatDatSciDf(
+            df=df, metadata_template=tmpl,
+            orcid="0000-0000-0000-0000", ontology_graph=_build_ontology(),
+            data_relations_dict={"measuredBy": [("Temperature", "Sample")]}
+        )
+        fixed = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        with patch("FAIRLinked.RDFTableConversion.MDS_DF.row_serializer.datetime") as mock_dt, \
+             warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            mock_dt.now.return_value = fixed
+            kwargs = dict(write_files=False, id_cols=["Sample"], label_pairs=[("Sample", "Name")])
+            via_jsonld = m.serialize_row(str(tmp_path / "rdf"), **kwargs)
+            direct = m.serialize_row(str(tmp_path / "rdf"), engine="direct", **kwargs)
+
+        assert len(direct) == len(via_jsonld) == 3
+        for a, b in zip(via_jsonld, direct):
+            assert isomorphic(a, b)
+
+    def test_predicates_resolved_once_for_all_rows(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature", "Sensor"], rows=4,
+                       data_relations_dict={"measuredBy": [("Temperature", "Sensor")]})
+        with patch("FAIRLinked.RDFTableConversion.MDS_DF.data_relations_manager.resolve_predicate",
+                   wraps=resolve_predicate) as resolver:
+            graphs = m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+            m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        assert resolver.call_count == len(m.data_relations.prop_pair_dict)
+        assert all((None, MDS_NS.measuredBy, None) in g for g in graphs)
+
+    def test_stored_row_keys_reused(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=2)
+        m.add_row_keys()
+        expected = m.df["__stored_rowkey__"].tolist()
+        assert expected == m.compute_row_keys().tolist()
+
+        m.df["__stored_rowkey__"] = ["first", "second"]
+        graphs = m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        row_keys = [str(o) for g in graphs for o in g.objects(predicate=MDS_NS.row)]
+        assert row_keys == ["first", "second"]
+
+    def test_tracker_rowkey_column_not_reused(self, tmp_path):
+        """A `__rowkey__` column from AnalysisTracker.create_arg_df keeps the hashed naming."""
+        m = make_mdsdf(cols=["Temperature"], rows=2)
+        expected = m.compute_row_keys().tolist()
+        m.df["__rowkey__"] = ["analysis_1", "analysis_2"]
+
+        graphs = m.serialize_row(str(tmp_path / "rdf"), write_files=True, format="nt")
+        row_keys = [str(o) for g in graphs for o in g.objects(predicate=MDS_NS.row)]
+        assert row_keys == expected
+        names = sorted(os.listdir(tmp_path / "rdf"))
+        assert not any("analysis_" in name for name in names)
+
+    def test_missing_template_column_warns_once(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        m.df = m.df.drop(columns=["Temperature"])
+        with pytest.warns(UserWarning, match="missing from the DataFrame") as record:
+            assert m.serialize_row(str(tmp_path / "rdf"), write_files=False) == []
+        assert len(record) == 1
+
+    def test_missing_template_column_raises_when_strict(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        m.df = m.df.drop(columns=["Temperature"])
+        with pytest.raises(TemplateMismatchError, match="missing from the DataFrame"):
+            m.serialize_row(str(tmp_path / "rdf"), write_files=False, strict=True)
+        chunks = [m.df.iloc[:1], m.df.iloc[1:]]
+        with pytest.raises(TemplateMismatchError):
+            m.serialize_row_chunks(chunks, str(tmp_path / "rdf"), write_files=False, strict=True)
+
+    def test_integer_columns_not_upcast(self, tmp_path):
+        df = pd.DataFrame({"Count": [3], "Temperature": [1.5]})
+        m = MatDatSciDf(df=df, metadata_template=_make_template(["Count", "Temperature"]),
+                        orcid="0000-0000-0000-0000", ontology_graph=_build_ontology())
+        graphs = m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        values = {str(v) for v in graphs[0].objects(predicate=QUDT_NS.value)}
+        assert values == {"3", "1.5"}
+
+    def _parallel_df(self):
+        df = pd.DataFrame({"Temperature": [1.0, None, 3.0, 4.0, None], "Sample": ["S1", "S2", None, "S4", "S5"]})
+        return MatDatSciDf(df=df, metadata_template=_make_template(["Temperature", "Sample"]),
+                           orcid="0000-0000-0000-0000", ontology_graph=_build_ontology())
+
+    def test_workers_write_files_in_row_order(self, tmp_path):
+        m = self._parallel_df()
+        sequential = m.serialize_row(str(tmp_path / "seq"), write_files=True, format="nt")
+        paths = m.serialize_row(str(tmp_path / "par"), write_files=True, format="nt", workers=2, chunk_size=2)
+        expected = [f"{key}-or0000000000000000.jsonld" for key in m.compute_row_keys()]
+        assert [os.path.basename(p) for p in paths] == expected
+        for g, path in zip(sequential, paths):
+            parsed = Graph()
+            parsed.parse(path, format="nt")
+            assert len(parsed) == len(g)
+
+    def test_workers_output_and_warnings_deterministic(self, tmp_path, capsys):
+        m = self._parallel_df()
+
+        def run(workers):
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always")
+                counts = m.serialize_row(str(tmp_path / "rdf"), write_files=False, id_cols=["Sample"],
+                                         workers=workers, chunk_size=1)
+            return counts, capsys.readouterr().out, [str(w.message) for w in caught]
+
+        sequential_counts = [len(g) for g in m.serialize_row(str(tmp_path / "rdf"), write_files=False, id_cols=["Sample"])]
+        capsys.readouterr()
+        two, three = run(2), run(3)
+        assert two == three
+        assert two[0] == sequential_counts
+        assert "Cannot find entity identifier in row 2" in two[2]
+
+    def test_invalid_worker_count_raises(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=1)
+        with pytest.raises(ValueError, match="workers"):
+            m.serialize_row(str(tmp_path / "rdf"), write_files=False, workers=0)
+
+    def test_unknown_engine_raises(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=1)
+        with pytest.raises(ValueError, match="engine"):
+            m.serialize_row(str(tmp_path / "rdf"), write_files=False, engine="turbo")
+
+
+class TestSerializeRowChunks:
+    def test_chunks_match_serialize_row(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature", "Pressure"], rows=5)
+        expected = [len(g) for g in m.serialize_row(str(tmp_path / "rdf"), write_files=False)]
+        chunks = (m.df.iloc[i:i + 2] for i in range(0, len(m.df), 2))
+        assert m.serialize_row_chunks(chunks, str(tmp_path / "rdf"), write_files=False) == expected
+
+    def test_written_paths_in_row_order(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        paths = m.serialize_row_chunks([m.df.iloc[:1], m.df.iloc[1:]], str(tmp_path / "rdf"))
+        expected = [f"{key}-or0000000000000000.jsonld" for key in m.compute_row_keys()]
+        assert [os.path.basename(p) for p in paths] == expected
+        assert all(os.path.exists(p) for p in paths)
+
+    def test_setup_runs_once(self, tmp_path, capsys):
+        m = make_mdsdf(cols=["Temperature"], rows=4)
+        m.serialize_row_chunks([m.df.iloc[i:i + 1] for i in range(4)], str(tmp_path / "rdf"), write_files=False)
+        assert capsys.readouterr().out.count("No license provided") == 1
+
+
+class TestFromRdfDir:
+    def test_workers_reconstruct_same_dataframe(self, tmp_path, patch_mds_graph):
+        m = make_mdsdf(cols=["Temperature", "Pressure"], rows=5)
+        m.serialize_row(str(tmp_path / "rdf"))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            serial = MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), ontology_graph=patch_mds_graph)
+            parallel = MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), ontology_graph=patch_mds_graph,
+                                                workers=2, chunk_size=2)
+        assert len(serial.df) == 5
+        pd.testing.assert_frame_equal(parallel.df, serial.df)
+        assert parallel.metadata_template == serial.metadata_template
+
+    def test_invalid_worker_count_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="workers"):
+            MatDatSciDf.from_rdf_dir(str(tmp_path), workers=0)
+
+    def test_findings_frame_backs_report(self, tmp_path, patch_mds_graph):
+        m = make_mdsdf(cols=["Temperature", "Pressure"], rows=3)
+        m.serialize_row(str(tmp_path / "rdf"))
+        template = _make_template(["Temperature", "Pressure"])
+        template["@graph"][1]["qudt:hasUnit"] = {"@id": "unit:PA"}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            r = MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), metadata_template=template,
+                                         ontology_graph=patch_mds_graph)
+        findings = r.import_findings
+        assert make_mdsdf(cols=["Temperature"]).import_findings is None
+        assert list(findings.columns) == ["file", "column", "kind", "expected", "actual", "reference"]
+        units = findings[findings["kind"] == "unit"]
+        assert len(units) == 3
+        assert set(units["column"]) == {"Pressure"}
+        assert set(units["expected"]) == {"unit:PA"} and set(units["actual"]) == {"unit:DEG_C"}
+        report = (tmp_path / "rdf" / "Imported_RDF_Data_import_validation.txt").read_text(encoding="utf-8")
+        assert "UNIT CONFLICTS (3)" in report
+        assert f"{units.iloc[0]['file']}: Pressure Unit is 'unit:DEG_C' (Expected 'unit:PA')" in report
+
+    def test_cached_rerun_reconstructs_same_dataframe(self, tmp_path, patch_mds_graph):
+        m = make_mdsdf(cols=["Temperature", "Pressure"], rows=5)
+        m.serialize_row(str(tmp_path / "rdf"))
+        cache_dir = str(tmp_path / "cache")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            plain = MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), ontology_graph=patch_mds_graph)
+            MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), ontology_graph=patch_mds_graph, cache_dir=cache_dir)
+            with patch("FAIRLinked.RDFTableConversion.MDS_DF.main.read_rdf_records") as read:
+                read.return_value = iter(())
+                cached = MatDatSciDf.from_rdf_dir(str(tmp_path / "rdf"), ontology_graph=patch_mds_graph,
+                                                  cache_dir=cache_dir)
+        assert read.call_args.args[0] == []
+        pd.testing.assert_frame_equal(cached.df, plain.df)
+        assert cached.metadata_template == plain.metadata_template
+
+
+class TestSemanticRemapping:
+    def _data_graph(self, *types):
+        g = Graph()
+        for i, t in enumerate(types):
+            g.add((URIRef(f"https://example.org/s{i}"), RDF.type, t))
+        return g
+
+    def test_unknown_types_remapped_known_kept(self, capsys):
+        m = make_mdsdf()
+        m.ontology.add((MDS_NS.Temperature, RDF.type, OWL.Class))
+        BFO = URIRef("http://purl.obolibrary.org/obo/BFO_0000001")
+        g = m.semantic_remapping(self._data_graph(MDS_NS.Temperature, MDS_NS.Unknown, MDS_NS.Unknown))
+        assert set(g.objects(predicate=RDF.type)) == {MDS_NS.Temperature, BFO}
+        out = capsys.readouterr().out
+        assert out.count("Warning") == 1
+        assert f"{MDS_NS.Unknown} (2)" in out
+
+    def test_class_set_follows_ontology_changes(self):
+        m = make_mdsdf()
+        g = m.semantic_remapping(self._data_graph(MDS_NS.Pressure))
+        assert (None, RDF.type, MDS_NS.Pressure) not in g
+
+        m.ontology.add((MDS_NS.Pressure, RDF.type, OWL.Class))
+        g = m.semantic_remapping(self._data_graph(MDS_NS.Pressure))
+        assert (None, RDF.type, MDS_NS.Pressure) in g
+
+    def test_serialize_row_reports_once(self, tmp_path, capsys):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        m.serialize_row(str(tmp_path / "rdf"), write_files=False)
+        out = capsys.readouterr().out
+        assert out.count("remapped to obo:BFO_0000001") == 1
+        assert f"{MDS_NS.Temperature} (3)" in out
+
 
 class TestSerializeBulk:
     def test_returns_single_graph(self, tmp_path):
@@ -532,3 +779,65 @@ class TestSerializeBulk:
         g2 = m2.serialize_bulk(str(tmp_path / "b2.jsonld"), write_files=False)
         assert len(g2) > len(g1)
 
+    def test_direct_engine(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        result = m.serialize_bulk(str(tmp_path / "bulk.jsonld"), write_files=False, engine="direct")
+        assert len(list(result.objects(predicate=QUDT_NS.value))) == 3
+
+
+class TestSerializeStream:
+    FIXED = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    def _stream_and_bulk(self, m, path, **kwargs):
+        with patch("FAIRLinked.RDFTableConversion.MDS_DF.row_serializer.datetime") as mock_dt, \
+             warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            mock_dt.now.return_value = self.FIXED
+            written = m.serialize_stream(str(path), **kwargs)
+            bulk = m.serialize_bulk(str(path.parent / "bulk.jsonld"), write_files=False)
+        return written, bulk
+
+    def test_ntriples_match_bulk(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature", "Pressure"], rows=4)
+        out = tmp_path / "out" / "data.nt"
+        written, bulk = self._stream_and_bulk(m, out)
+        streamed = Graph()
+        streamed.parse(str(out), format="nt")
+        assert written == len(out.read_text(encoding="utf-8").splitlines())
+        assert isomorphic(streamed, bulk)
+
+    def test_gzipped_nquads_one_graph_per_row(self, tmp_path):
+        import gzip
+        from rdflib import Dataset
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        out = tmp_path / "data.nq.gz"
+        written, bulk = self._stream_and_bulk(m, out, format="nquads")
+        ds = Dataset()
+        with gzip.open(out, "rb") as source:
+            ds.parse(source, format="nquads")
+        names = {c for _, _, _, c in ds.quads((None, None, None, None))}
+        assert len(names) == 3
+        assert len(ds) == written == len(bulk)
+
+    def test_jsonld_post_pass(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=3)
+        jsonld_path = tmp_path / "compact" / "data.jsonld"
+        _, bulk = self._stream_and_bulk(m, tmp_path / "data.nt", jsonld_path=str(jsonld_path))
+        compact = json.loads(jsonld_path.read_text(encoding="utf-8"))
+        assert compact["@context"]["mds"] == BASE_CONTEXT["mds"]
+        parsed = Graph()
+        parsed.parse(str(jsonld_path), format="json-ld")
+        assert isomorphic(parsed, bulk)
+
+    def test_workers_write_same_triples(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=5)
+        sequential = m.serialize_stream(str(tmp_path / "seq.nt"))
+        parallel = m.serialize_stream(str(tmp_path / "par.nt"), workers=2, chunk_size=2)
+        assert parallel == sequential
+        subjects = lambda path: [line.split(" ", 1)[0] for line in path.read_text(encoding="utf-8").splitlines()]
+        assert subjects(tmp_path / "par.nt") == subjects(tmp_path / "seq.nt")
+
+    def test_unsupported_format_raises(self, tmp_path):
+        m = make_mdsdf(cols=["Temperature"], rows=1)
+        with pytest.raises(ValueError, match="streaming format"):
+            m.serialize_stream(str(tmp_path / "data.ttl"), format="turtle")
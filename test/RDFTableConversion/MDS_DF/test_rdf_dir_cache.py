@@ -0,0 +1,151 @@
+import os
+import json
+import pytest
+import datetime
+import decimal
+import pandas as pd
+from rdflib import Graph, Literal, Namespace, XSD
+from rdflib.namespace import RDF, SKOS
+from FAIRLinked.RDFTableConversion.MDS_DF.rdf_dir_reader import list_rdf_files, read_rdf_records
+from FAIRLinked.RDFTableConversion.MDS_DF.rdf_dir_cache import (
+    RDFRecordCache,
+    encode_value,
+    decode_value,
+    MANIFEST_FILE,
+)
+
+
+"""
+Tests for rdf_dir_cache.py — the incremental record cache of MatDatSciDf.from_rdf_dir.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+MDS  = Namespace("https://cwrusdle.bitbucket.io/mds/")
+QUDT = Namespace("http://qudt.org/schema/qudt/")
+UNIT = Namespace("https://qudt.org/vocab/unit/")
+
+
+def _write_row(path, value, tool="T1"):
+    g = Graph()
+    temp, tool_uri = MDS[f"Temperature.{tool}"], MDS[f"Tool.{tool}"]
+    g.add((temp, RDF.type, MDS.Temperature))
+    g.add((temp, SKOS.altLabel, Literal("Temperature")))
+    g.add((temp, QUDT.value, Literal(value)))
+    g.add((temp, QUDT.hasUnit, UNIT.DEG_C))
+    g.add((tool_uri, RDF.type, MDS.Tool))
+    g.add((tool_uri, SKOS.altLabel, Literal("Tool")))
+    g.add((tool_uri, QUDT.hasUnit, UNIT.NUM))
+    g.add((temp, MDS.measuredBy, tool_uri))
+    g.serialize(destination=str(path), format="turtle")
+
+
+class CountingReader:
+    def __init__(self, predicates=(MDS.measuredBy,)):
+        self.predicates = predicates
+        self.read = []
+
+    def __call__(self, files):
+        self.read.extend(filename for _, filename in files)
+        return read_rdf_records(files, self.predicates)
+
+
+def _cached_read(input_dir, cache_dir, reader):
+    cache = RDFRecordCache(str(cache_dir), str(input_dir), reader.predicates)
+    records = list(cache.read(list_rdf_files(str(input_dir)), reader))
+    cache.save()
+    return cache, records
+
+
+@pytest.fixture
+def rdf_dir(tmp_path):
+    folder = tmp_path / "rdf"
+    folder.mkdir()
+    for i, value in enumerate([1.5, 2, "high", decimal.Decimal("1.50")]):
+        _write_row(folder / f"row{i}.ttl", value, tool=f"T{i}")
+    return folder
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestValueEncoding:
+    @pytest.mark.parametrize("value", [
+        "x", 3, -2**63, 10**30, 1.25, float("inf"), True, pd.NA,
+        decimal.Decimal("1.50"),
+        datetime.date(2024, 1, 2),
+        datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc),
+        Literal("not a date", datatype=XSD.dateTime),
+    ])
+    def test_round_trip(self, value):
+        fields = encode_value(value)
+        decoded = decode_value(fields["kind"], fields.get("value"), fields.get("value_int"),
+                               fields.get("value_float"), fields.get("value_bool"),
+                               fields.get("datatype"), fields.get("lang"))
+        assert type(decoded) is type(value)
+        if value is pd.NA:
+            assert decoded is pd.NA
+        else:
+            assert decoded == value
+
+    def test_unsupported_value_not_encoded(self):
+        assert encode_value(object()) is None
+
+
+class TestRDFRecordCache:
+    def test_rerun_parses_only_changed_files(self, rdf_dir, tmp_path):
+        cache_dir = tmp_path / "cache"
+        first = CountingReader()
+        _, records = _cached_read(rdf_dir, cache_dir, first)
+        assert len(first.read) == 4
+        assert (cache_dir / MANIFEST_FILE).exists()
+
+        _write_row(rdf_dir / "row1.ttl", 99, tool="T1")    # changed
+        _write_row(rdf_dir / "row9.ttl", 9, tool="T9")     # new
+        os.remove(rdf_dir / "row2.ttl")                    # deleted
+        os.utime(rdf_dir / "row0.ttl", ns=(0, 10**9))      # touched, same content
+
+        second = CountingReader()
+        cache, records = _cached_read(rdf_dir, cache_dir, second)
+        assert sorted(second.read) == ["row1.ttl", "row9.ttl"]
+        assert (cache.reused, cache.parsed, cache.dropped) == (2, 2, 1)
+
+        expected = list(read_rdf_records(list_rdf_files(str(rdf_dir)), (MDS.measuredBy,)))
+        assert records == expected
+
+        manifest = json.loads((cache_dir / MANIFEST_FILE).read_text())
+        assert sorted(manifest["files"]) == ["row0.ttl", "row1.ttl", "row3.ttl", "row9.ttl"]
+
+        third = CountingReader()
+        _, records = _cached_read(rdf_dir, cache_dir, third)
+        assert third.read == []
+        assert records == expected
+
+    def test_new_predicates_rebuild_cache(self, rdf_dir, tmp_path):
+        _cached_read(rdf_dir, tmp_path / "cache", CountingReader(predicates=()))
+        reader = CountingReader()
+        _, records = _cached_read(rdf_dir, tmp_path / "cache", reader)
+        assert len(reader.read) == 4
+        assert all(record.relations[MDS.measuredBy] for record in records)
+
+    def test_failed_files_not_cached(self, rdf_dir, tmp_path):
+        (rdf_dir / "broken.jsonld").write_text("{not json")
+        _cached_read(rdf_dir, tmp_path / "cache", CountingReader())
+        reader = CountingReader()
+        _, records = _cached_read(rdf_dir, tmp_path / "cache", reader)
+        assert reader.read == ["broken.jsonld"]
+        assert [r.error is not None for r in records].count(True) == 1
+
+    def test_unreadable_cache_is_rebuilt(self, rdf_dir, tmp_path):
+        cache_dir = tmp_path / "cache"
+        _cached_read(rdf_dir, cache_dir, CountingReader())
+        (cache_dir / "columns.parquet").write_text("garbage")
+        reader = CountingReader()
+        with pytest.warns(UserWarning, match="unreadable RDF cache"):
+            _, records = _cached_read(rdf_dir, cache_dir, reader)
+        assert len(reader.read) == 4
+        assert records == list(read_rdf_records(list_rdf_files(str(rdf_dir)), (MDS.measuredBy,)))
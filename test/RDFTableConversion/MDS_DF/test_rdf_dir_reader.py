@@ -0,0 +1,172 @@
+import json
+import pytest
+import warnings
+import pandas as pd
+from unittest.mock import patch
+from rdflib import Graph, URIRef, Literal, Namespace
+from rdflib.namespace import RDF, SKOS
+from FAIRLinked.RDFTableConversion.MDS_DF import rdf_dir_reader
+from FAIRLinked.RDFTableConversion.MDS_DF.rdf_dir_reader import (
+    list_rdf_files,
+    read_rdf_record,
+    read_rdf_records,
+)
+
+
+"""
+Tests for rdf_dir_reader.py — the per-file records used by MatDatSciDf.from_rdf_dir.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+MDS  = Namespace("https://cwrusdle.bitbucket.io/mds/")
+QUDT = Namespace("http://qudt.org/schema/qudt/")
+UNIT = Namespace("https://qudt.org/vocab/unit/")
+
+
+def _write_row(path, value, tool="T1"):
+    g = Graph()
+    temp, tool_uri = MDS[f"Temperature.{value}"], MDS[f"Tool.{tool}"]
+    g.add((temp, RDF.type, MDS.Temperature))
+    g.add((temp, SKOS.altLabel, Literal("Temperature")))
+    g.add((temp, QUDT.value, Literal(value)))
+    g.add((temp, QUDT.hasUnit, UNIT.DEG_C))
+    g.add((tool_uri, RDF.type, MDS.Tool))
+    g.add((tool_uri, SKOS.altLabel, Literal("Tool")))
+    g.add((tool_uri, QUDT.hasUnit, UNIT.NUM))
+    g.add((temp, MDS.measuredBy, tool_uri))
+    g.serialize(destination=str(path), format="turtle")
+
+
+CONTEXT = {
+    "mds": str(MDS),
+    "qudt": str(QUDT),
+    "unit": str(UNIT),
+    "skos": str(SKOS),
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+
+def _jsonld_row(temperature=1.5, **extra):
+    # The shape written by MatDatSciDf.serialize_row
+    return {
+        "@context": CONTEXT,
+        "@graph": [
+            {
+                "@id": "mds:Temperature.K1",
+                "@type": "mds:Temperature",
+                "skos:altLabel": "Temperature ",
+                "skos:definition": "Definition of Temperature",
+                "mds:hasStudyStage": "Synthesis",
+                "qudt:hasUnit": {"@id": "unit:DEG_C"},
+                "qudt:value": temperature,
+                "mds:measuredBy": {"@id": "mds:Tool.K1"},
+                **extra,
+            },
+            {
+                "@id": "mds:Tool.K1",
+                "@type": "http://purl.obolibrary.org/obo/BFO_0000001",
+                "skos:altLabel": "Tool",
+                "qudt:hasUnit": {"@id": "unit:NUM"},
+                "qudt:value": {"@value": "7", "@type": "xsd:integer"},
+            },
+        ],
+    }
+
+
+def _records(path, predicates=(MDS.measuredBy,)):
+    fast = read_rdf_record(str(path), path.name, predicates)
+    slow = read_rdf_record(str(path), path.name, predicates, fast_jsonld=False)
+    return fast, slow
+
+
+def _same(fast, slow):
+    return sorted(map(repr, fast.columns)) == sorted(map(repr, slow.columns)) and fast.relations == slow.relations
+
+
+@pytest.fixture
+def rdf_dir(tmp_path):
+    for i in range(5):
+        _write_row(tmp_path / f"row{i}.ttl", i)
+    (tmp_path / "sub").mkdir()
+    _write_row(tmp_path / "sub" / "row5.ttl", 5)
+    (tmp_path / "broken.jsonld").write_text("{not json")
+    (tmp_path / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestReadRecord:
+    def test_columns_and_relations(self, rdf_dir):
+        record = read_rdf_record(str(rdf_dir / "row3.ttl"), "row3.ttl", (MDS.measuredBy,))
+        assert record.error is None
+        columns = {c.label: c for c in record.columns}
+        assert columns["Temperature"].value == 3
+        assert columns["Temperature"].unit_uri == "unit:DEG_C"
+        assert columns["Temperature"].semantic_type == str(MDS.Temperature)
+        assert columns["Tool"].value is pd.NA
+        assert record.relations[MDS.measuredBy] == {(MDS["Temperature.3"], MDS["Tool.T1"])}
+
+    def test_parse_error_is_returned(self, rdf_dir):
+        record = read_rdf_record(str(rdf_dir / "broken.jsonld"), "broken.jsonld")
+        assert record.error
+        assert record.columns == [] and record.relations == {}
+
+
+class TestReadRecords:
+    def test_lists_supported_files_recursively(self, rdf_dir):
+        names = sorted(name for _, name in list_rdf_files(str(rdf_dir)))
+        assert names == ["broken.jsonld"] + [f"row{i}.ttl" for i in range(6)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, None])
+    def test_workers_keep_file_order(self, rdf_dir, chunk_size):
+        files = list_rdf_files(str(rdf_dir))
+        serial = list(read_rdf_records(files, (MDS.measuredBy,)))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parallel = list(read_rdf_records(files, (MDS.measuredBy,), workers=2, chunk_size=chunk_size))
+        assert parallel == serial
+        assert [r.filename for r in parallel] == [name for _, name in files]
+
+
+class TestFastJsonld:
+    @pytest.mark.parametrize("temperature", [1.5, 3, True, "warm", None, {"@value": "x", "@language": "en"}])
+    def test_matches_rdflib(self, tmp_path, temperature):
+        path = tmp_path / "row.jsonld"
+        path.write_text(json.dumps(_jsonld_row(temperature)))
+        read_rdf_record(str(path), path.name)  # the context's prefixes are bound once with rdflib
+        with patch.object(Graph, "parse", side_effect=AssertionError("rdflib should not be used")):
+            fast = read_rdf_record(str(path), path.name, (MDS.measuredBy,))
+        slow = read_rdf_record(str(path), path.name, (MDS.measuredBy,), fast_jsonld=False)
+        assert fast.error is None and slow.error is None
+        assert _same(fast, slow)
+        assert {c.label: c.value for c in fast.columns}["Tool"] == 7
+
+    @pytest.mark.parametrize("doc", [
+        # Term definitions, vocab-relative types and nested nodes are left to rdflib
+        dict(_jsonld_row(), **{"@context": dict(CONTEXT, value={"@id": "qudt:value"})}),
+        dict(_jsonld_row(), **{"@context": dict(CONTEXT, **{"@vocab": str(MDS)})}),
+        _jsonld_row(**{"mds:measuredBy": {"@id": "mds:Tool.K1", "skos:altLabel": "Tool"}}),
+        _jsonld_row(**{"qudt:value": [1, 2]}),
+    ])
+    def test_other_shapes_fall_back_to_rdflib(self, tmp_path, doc):
+        path = tmp_path / "row.jsonld"
+        path.write_text(json.dumps(doc))
+        with pytest.raises(rdf_dir_reader._NotInProfile):
+            rdf_dir_reader._read_jsonld_fast(str(path), path.name, ())
+        fast, slow = _records(path)
+        assert fast == slow
+
+    def test_non_json_content_falls_back(self, rdf_dir):
+        path = rdf_dir / "turtle.jsonld"
+        path.write_text((rdf_dir / "row1.ttl").read_text())
+        with pytest.raises(rdf_dir_reader._NotInProfile):
+            rdf_dir_reader._read_jsonld_fast(str(path), path.name, ())
+        fast, slow = _records(path)
+        assert fast == slow
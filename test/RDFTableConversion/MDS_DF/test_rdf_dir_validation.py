@@ -0,0 +1,146 @@
+import pytest
+import pandas as pd
+from rdflib import Graph, Literal, Namespace, RDF, RDFS, OWL
+from FAIRLinked.RDFTableConversion.MDS_DF.rdf_dir_reader import ColumnEntry
+from FAIRLinked.RDFTableConversion.MDS_DF.utility import get_ontology_properties
+from FAIRLinked.RDFTableConversion.MDS_DF.data_relations_manager import resolve_relations
+from FAIRLinked.RDFTableConversion.MDS_DF.rdf_dir_validation import (
+    FINDING_COLUMNS,
+    entries_frame,
+    column_findings,
+    relation_findings,
+    validate_import,
+    finding_messages,
+)
+
+
+"""
+Tests for rdf_dir_validation.py — the batch checks behind the from_rdf_dir report.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+MDS = "https://cwrusdle.bitbucket.io/mds/"
+
+
+def _entry(label, value=1, semantic_type=None, unit="unit:K"):
+    return ColumnEntry(label, value, semantic_type or f"{MDS}{label}", unit, "", "")
+
+
+def _entries(*files):
+    return entries_frame([e for f in files for e in f], [len(f) for f in files],
+                         [f"f{i}.jsonld" for i in range(len(files))])
+
+
+def _triples(*rows):
+    return pd.DataFrame(list(rows), columns=["file_no", "predicate", "subject", "object"], dtype=object)
+
+
+class FakeRelation:
+    def __init__(self, prop_key, prop_type, pairs):
+        self.prop_key = prop_key
+        self.predicate = f"{MDS}{prop_key}"
+        self.prop_type = prop_type
+        self.pairs = [(s, o, None, None) for s, o in pairs]
+
+
+SUBJECTS = {"Temperature": f"{MDS}Temperature", "Tool": f"{MDS}Tool"}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestEntriesFrame:
+    def test_file_numbers_and_values(self):
+        entries = _entries([_entry("A"), _entry("B", pd.NA)], [], [_entry("A", None)])
+        assert entries["file_no"].tolist() == [0, 0, 2]
+        assert entries["file"].tolist() == ["f0.jsonld", "f0.jsonld", "f2.jsonld"]
+        # Only pd.NA counts as missing, as in the reconstructed rows
+        assert entries["has_value"].tolist() == [True, False, True]
+
+
+class TestColumnFindings:
+    def test_against_template(self):
+        entries = _entries([_entry("Temperature", unit="unit:DEG_C"), _entry("Tool")],
+                           [_entry("Temperature", semantic_type="mds:Other")])
+        expected = {"Temperature": {"type": f"{MDS}Temperature", "unit": "unit:K"},
+                    "Tool": {"type": None, "unit": ""}}
+        findings = column_findings(entries, expected)
+        assert findings.to_dict("records") == [
+            {"file": "f1.jsonld", "column": "Temperature", "kind": "type", "expected": f"{MDS}Temperature",
+             "actual": "mds:Other", "reference": "template"},
+            {"file": "f0.jsonld", "column": "Temperature", "kind": "unit", "expected": "unit:K",
+             "actual": "unit:DEG_C", "reference": "template"},
+        ]
+
+    def test_against_first_file(self):
+        entries = _entries([_entry("Temperature")],
+                           [_entry("Temperature", unit="")],
+                           [_entry("Temperature", unit="unit:M", semantic_type="mds:Other")])
+        findings = column_findings(entries, {})
+        assert findings[["file", "kind", "expected", "actual", "reference"]].values.tolist() == [
+            ["f2.jsonld", "type", f"{MDS}Temperature", "mds:Other", "f0.jsonld"],
+            ["f2.jsonld", "unit", "unit:K", "unit:M", "f0.jsonld"],
+        ]
+
+
+class TestRelationFindings:
+    def test_object_and_datatype_relations(self):
+        relations = [FakeRelation("measuredBy", "Object Property", [("Temperature", "Tool")]),
+                     FakeRelation("hasValue", "Datatype Property", [("Temperature", "Tool")])]
+        entries = _entries([_entry("Temperature"), _entry("Tool")],
+                           [_entry("Temperature"), _entry("Tool")],
+                           [_entry("Temperature"), _entry("Tool", pd.NA)],
+                           [_entry("Tool")])
+        triples = _triples((0, f"{MDS}measuredBy", SUBJECTS["Temperature"], SUBJECTS["Tool"]),
+                           (0, f"{MDS}hasValue", SUBJECTS["Temperature"], None),
+                           (1, f"{MDS}measuredBy", SUBJECTS["Temperature"], None))
+        findings = relation_findings(entries, triples, relations, SUBJECTS)
+        assert findings[["file", "kind", "reference"]].values.tolist() == [
+            ["f1.jsonld", "object_relation", "measuredBy"],
+            ["f1.jsonld", "datatype_relation", "hasValue"],
+            ["f2.jsonld", "datatype_relation", "hasValue"],
+        ]
+
+    def test_resolved_relations_accepted(self):
+        ns = Namespace(MDS)
+        onto = Graph()
+        onto.add((ns.measuredBy, RDF.type, OWL.ObjectProperty))
+        onto.add((ns.measuredBy, RDFS.label, Literal("measuredBy")))
+        relations = resolve_relations({"measuredBy": [("Temperature", "Tool")]}, onto,
+                                      get_ontology_properties(onto), labels_first=True)
+        entries = _entries([_entry("Temperature"), _entry("Tool")])
+        findings = relation_findings(entries, _triples(), relations, SUBJECTS)
+        assert findings["kind"].tolist() == ["object_relation"]
+
+
+class TestValidateImport:
+    def test_columns_and_messages(self):
+        entries = _entries([_entry("Temperature"), _entry("Tool")],
+                           [_entry("Temperature", unit="unit:M"), _entry("Tool")])
+        relations = [FakeRelation("measuredBy", "Object Property", [("Temperature", "Tool")])]
+        findings = validate_import(entries, _triples(), {}, relations, SUBJECTS)
+        assert list(findings.columns) == FINDING_COLUMNS
+        assert finding_messages(findings).tolist() == [
+            "f1.jsonld: Unit mismatch for 'Temperature' vs f0.jsonld",
+            "f0.jsonld: ObjectProperty Mismatch (Temperature -[measuredBy]-> Tool)",
+            "f1.jsonld: ObjectProperty Mismatch (Temperature -[measuredBy]-> Tool)",
+        ]
+
+    @pytest.mark.parametrize("kind, reference, message", [
+        ("type", "template", "f.ttl: T Type is 'a' (Expected 'e')"),
+        ("unit", "template", "f.ttl: T Unit is 'a' (Expected 'e')"),
+        ("type", "g.ttl", "f.ttl: Type mismatch for 'T' vs g.ttl"),
+        ("datatype_relation", "hasValue", "f.ttl: Missing DatatypeProperty (T -[hasValue]-> Literal)"),
+    ])
+    def test_message_formats(self, kind, reference, message):
+        finding = pd.DataFrame([["f.ttl", "T", kind, "e", "a", reference]], columns=FINDING_COLUMNS)
+        assert finding_messages(finding).tolist() == [message]
+
+    def test_empty_import(self):
+        findings = validate_import(_entries(), _triples(), {}, [], {})
+        assert findings.empty and list(findings.columns) == FINDING_COLUMNS
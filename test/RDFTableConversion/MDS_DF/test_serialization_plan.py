@@ -0,0 +1,174 @@
+import pytest
+import warnings
+import json
+import pandas as pd
+from rdflib import Graph, URIRef, Literal, XSD
+from rdflib.compare import isomorphic
+from FAIRLinked.RDFTableConversion.MDS_DF.serialization_plan import SerializationPlan, ColumnInstruction, string_literal
+from FAIRLinked.RDFTableConversion.MDS_DF.utility import hash6
+
+
+"""
+Tests for serialization_plan.py — the compiled per-column instructions used by
+MatDatSciDf.serialize_row.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+MDS = "https://cwrusdle.bitbucket.io/mds/"
+
+CONTEXT = {
+    "mds": MDS,
+    "qudt": "http://qudt.org/schema/qudt/",
+    "unit": "https://qudt.org/vocab/unit/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "prov": "http://www.w3.org/ns/prov#",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+def _item(col, typ, stage="Synthesis", unit="unit:DEG_C"):
+    return {
+        "@id": f"mds:{col}",
+        "@type": typ,
+        "skos:altLabel": col,
+        "qudt:hasUnit": {"@id": unit},
+        "prov:generatedAtTime": {"@value": "2024-01-01T00:00:00Z", "@type": "xsd:dateTime"},
+        "mds:hasStudyStage": stage,
+    }
+
+
+TEMPLATE = [
+    _item("Temperature", "mds:Temperature"),
+    _item("Sample", f"{MDS}Sample", stage="Sample", unit=""),
+    _item("Tool", "Tool", stage="Tool"),
+]
+
+ROW = {"Temperature": 100, "Sample": "S-1", "Tool": "T1"}
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestCompile:
+    def test_localnames_from_curie_iri_and_bare_type(self):
+        plan = SerializationPlan(TEMPLATE)
+        assert [c.localname for c in plan.columns] == ["Temperature", "Sample", "Tool"]
+        assert all(isinstance(c, ColumnInstruction) for c in plan.columns)
+
+    def test_empty_unit_pruned_once(self):
+        plan = SerializationPlan(TEMPLATE)
+        assert "qudt:hasUnit" not in plan.columns[1].item
+        assert "qudt:hasUnit" in plan.columns[1].raw_item
+
+    def test_missing_alt_label_raises(self):
+        with pytest.raises(ValueError, match="skos:altLabel"):
+            SerializationPlan([{"@type": "mds:Temperature"}])
+
+    def test_entry_without_type_passed_through(self):
+        untyped = {"skos:altLabel": "Notes"}
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            plan = SerializationPlan(TEMPLATE + [untyped])
+        items, lookup = plan.build_row(dict(ROW, Notes="x"), 0, "K", "now")
+        assert items[-1] is untyped
+        assert "Notes" not in lookup
+
+
+class TestRowKey:
+    def test_hashed_per_study_stage(self):
+        plan = SerializationPlan(TEMPLATE)
+        key = plan.row_key(ROW.get)
+        assert key == f"SYN{hash6('100')}-SA{hash6('S-1')}-TL{hash6('T1')}-"
+
+    def test_from_row_key_columns(self):
+        plan = SerializationPlan(TEMPLATE, row_key_cols=["Sample"])
+        assert plan.row_key(ROW.get) == "S-1-"
+
+
+class TestRowKeys:
+    DF = pd.DataFrame({
+        "Temperature": [100.5, None, 7.0, 100.5],
+        "Sample": ["S-1", None, " S-3 ", "S-1"],
+        "Tool": pd.array([1, None, 3, 1], dtype="Int64"),
+        "When": pd.to_datetime(["2024-01-01", "2024-01-02", None, "2024-01-01"]),
+    })
+
+    def _per_row(self, plan, df):
+        return [plan.row_key(lambda col: df.at[idx, col]) for idx in df.index]
+
+    def test_hashed_keys_match_per_row_keys(self):
+        tmpl = TEMPLATE + [_item("When", "mds:Time", stage="Result")]
+        plan = SerializationPlan(tmpl)
+        assert plan.row_keys(self.DF).tolist() == self._per_row(plan, self.DF)
+
+    def test_column_keys_match_per_row_keys(self):
+        plan = SerializationPlan(TEMPLATE, row_key_cols=["Sample", "Temperature"])
+        assert plan.row_keys(self.DF).tolist() == self._per_row(plan, self.DF)
+
+    def test_stored_keys_reused_and_gaps_filled(self):
+        plan = SerializationPlan(TEMPLATE)
+        df = self.DF.assign(__rowkey__=["A", None, "C", "D"])
+        keys = plan.row_keys(df, stored_column="__rowkey__")
+        assert keys.tolist() == ["A-", plan.row_keys(self.DF)[1], "C-", "D-"]
+
+    def test_missing_column_raises(self):
+        plan = SerializationPlan(TEMPLATE)
+        with pytest.raises(KeyError):
+            plan.row_keys(self.DF.drop(columns=["Tool"]))
+
+
+class TestBuildRow:
+    def test_subjects_and_timestamp(self):
+        plan = SerializationPlan(TEMPLATE)
+        items, lookup = plan.build_row(ROW, 0, "KEY", "2025-01-01T00:00:00Z")
+        assert lookup["Temperature"] == URIRef(f"{MDS}Temperature.KEY")
+        assert items[0]["@id"] == lookup["Temperature"]
+        assert items[0]["prov:generatedAtTime"]["@value"] == "2025-01-01T00:00:00Z"
+        # The compiled template itself is left untouched
+        assert plan.columns[0].item["prov:generatedAtTime"]["@value"] == "2024-01-01T00:00:00Z"
+
+    def test_id_columns_use_cell_value(self):
+        plan = SerializationPlan(TEMPLATE, id_cols=["Sample"])
+        _, lookup = plan.build_row(ROW, 0, "KEY", "now")
+        assert lookup["Sample"] == URIRef(f"{MDS}Sample.s1")
+
+    def test_missing_identifier_keeps_raw_item(self):
+        plan = SerializationPlan(TEMPLATE, id_cols=["Sample"])
+        with pytest.warns(UserWarning, match="Cannot find entity identifier"):
+            items, lookup = plan.build_row(dict(ROW, Sample=None), 3, "KEY", "now")
+        assert "Sample" not in lookup
+        assert items[1]["@id"] == "mds:Sample"
+
+    def test_key_tracks_template_changes(self):
+        changed = [dict(TEMPLATE[0], **{"@type": "mds:Pressure"})] + TEMPLATE[1:]
+        assert SerializationPlan.make_key(TEMPLATE) != SerializationPlan.make_key(changed)
+        assert SerializationPlan.make_key(TEMPLATE, id_cols=["Sample"]) != SerializationPlan.make_key(TEMPLATE)
+
+
+class TestEmitRow:
+    def _via_jsonld(self, plan, row, key, timestamp):
+        items, lookup = plan.build_row(row, 0, key, timestamp)
+        g = Graph()
+        g.parse(data=json.dumps({"@context": CONTEXT, "@graph": items}, default=str), format="json-ld")
+        return g, lookup
+
+    def test_same_triples_as_jsonld_parse(self):
+        plan = SerializationPlan(TEMPLATE, id_cols=["Sample"])
+        expected, expected_lookup = self._via_jsonld(plan, ROW, "KEY", "2025-01-01T00:00:00")
+        g = Graph()
+        lookup = plan.emit_row(g, ROW, 0, "KEY", "2025-01-01T00:00:00", CONTEXT)
+        assert lookup == expected_lookup
+        assert isomorphic(g, expected)
+
+    def test_triple_templates_expanded_once_per_context(self):
+        plan = SerializationPlan(TEMPLATE)
+        assert plan.triple_templates(CONTEXT) is plan.triple_templates(dict(CONTEXT))
+
+    def test_string_literal_mirrors_jsonld_round_trip(self):
+        assert string_literal("x") == Literal("x", datatype=XSD.string)
+        assert string_literal("x", engine="direct") == Literal("x")
+        assert string_literal(3, engine="direct").datatype == XSD.integer
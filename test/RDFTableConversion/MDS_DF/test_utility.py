@@ -0,0 +1,255 @@
+import gc
+import pytest
+import pyarrow as pa
+from rdflib import Graph, Literal, URIRef
+from rdflib.namespace import RDF, RDFS, OWL
+from unittest.mock import patch
+from FAIRLinked.RDFTableConversion.MDS_DF import utility
+from FAIRLinked.RDFTableConversion.MDS_DF.utility import (
+    build_unit_table,
+    load_units,
+    UnitIndex,
+    get_unit_index,
+    OntologyTermIndex,
+    find_best_match,
+    normalize,
+    extract_terms_from_ontology,
+    get_ontology_term_index,
+    get_ontology_properties,
+    get_ontology_classes,
+    clear_ontology_term_cache,
+    ontology_fingerprint,
+)
+
+
+"""
+Tests for the lookup structures in MDS_DF/utility.py: the precompiled QUDT unit
+table, the unit index, the ontology term index and the per-graph term cache.
+"""
+
+
+# ---------------------------------------------------------------------------
+# Helpers / Fixtures
+# ---------------------------------------------------------------------------
+
+QUDT_TTL = """
+@prefix qudt: <http://qudt.org/schema/qudt/> .
+@prefix rdfs: <http://www.w3.org/2000/01/rdf-schema#> .
+@prefix unit: <http://qudt.org/vocab/unit/> .
+
+unit:DEG_C a qudt:Unit ;
+    rdfs:label "degree Celsius"@en ;
+    qudt:symbol "°C" ;
+    qudt:ucumCode "Cel" ;
+    qudt:conversionMultiplier 1.0 .
+
+unit:M a qudt:Unit ;
+    rdfs:label "Meter"@en ;
+    qudt:symbol "m" .
+"""
+
+
+@pytest.fixture
+def unit_ttl(tmp_path):
+    path = tmp_path / "units.ttl"
+    path.write_text(QUDT_TTL, encoding="utf-8")
+    return path
+
+
+UNITS = {
+    'DEG_C': {'name': 'DEG_C', 'label': 'degree Celsius', 'ucum_code': 'Cel', 'symbol': '°C'},
+    'M': {'name': 'M', 'label': 'Meter', 'ucum_code': 'm', 'symbol': 'm'},
+    'MilliM': {'name': 'MilliM', 'label': 'Millimeter', 'ucum_code': 'mm', 'symbol': 'mm'},
+    'MO': {'name': 'MO', 'label': 'Month', 'ucum_code': 'mo', 'symbol': 'mo'},
+}
+
+
+def _term(iri, label):
+    return {"iri": iri, "label": label, "normalized": normalize(label), "definition": "", "study_stage": []}
+
+
+TERMS = [
+    _term("mds:Temperature", "Temperature"),
+    _term("mds:Temperature", "Temp"),
+    _term("mds:Pressure", "Pressure"),
+    _term("mds:ExposureTime", "Exposure Time"),
+    _term("mds:Tempering", "Tempering"),
+]
+
+
+def _ontology(*labels):
+    g = Graph()
+    for label in labels:
+        term = URIRef(f"https://cwrusdle.bitbucket.io/mds/{label}")
+        g.add((term, RDF.type, OWL.Class))
+        g.add((term, RDFS.label, Literal(label)))
+    return g
+
+
+@pytest.fixture
+def no_unit_cache():
+    with patch.object(utility, "_CACHED_UNITS", None):
+        yield
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestUnitTable:
+    def test_build_matches_turtle_parse(self, unit_ttl, tmp_path):
+        out = build_unit_table(ttl_path=str(unit_ttl), output_path=str(tmp_path / "units.arrow"))
+        with pa.memory_map(out, "r") as source:
+            table = pa.ipc.open_file(source).read_all()
+
+        rows = {row["name"]: row for row in table.to_pylist()}
+        assert rows == utility._parse_qudt_units(QUDT_TTL)
+        assert table.column("name").to_pylist() == ["DEG_C", "M"]
+        assert rows["M"]["ucum_code"] is None
+
+    def test_load_units_reads_bundled_table(self, no_unit_cache):
+        with patch.object(utility, "_parse_qudt_units", side_effect=AssertionError("Turtle should not be parsed")):
+            units = load_units()
+        assert units
+        assert all(set(u) == set(utility._UNIT_TABLE_FIELDS) for u in units.values())
+
+    def test_stale_table_is_ignored(self, no_unit_cache):
+        with patch.object(utility, "_qudt_ttl_digest", return_value="not-the-build-digest"):
+            assert utility._read_unit_table() is None
+
+    def test_missing_table_falls_back_to_turtle(self, no_unit_cache):
+        with patch.object(utility, "UNIT_TABLE_FILE", "does_not_exist.arrow"), \
+             patch.object(utility, "_parse_qudt_units", return_value={"M": {"name": "M"}}) as parse:
+            assert load_units() == {"M": {"name": "M"}}
+        parse.assert_called_once()
+
+
+class TestUnitIndex:
+    def test_lookup_by_name_label_and_ucum(self):
+        index = UnitIndex(UNITS)
+        assert index.lookup("deg_c") == ["DEG_C"]
+        assert index.lookup("DEGREE CELSIUS") == ["DEG_C"]
+        assert index.lookup("Cel") == ["DEG_C"]
+
+    def test_ucum_is_case_sensitive(self):
+        index = UnitIndex(UNITS)
+        assert index.lookup("mm", fields=("ucum_code",)) == ["MilliM"]
+        assert index.lookup("MM", fields=("ucum_code",)) == []
+
+    def test_multiple_matches_keep_table_order(self):
+        index = UnitIndex({'FT_US': {'label': 'US Survey Foot'}, 'FT': {'label': 'Foot'}, 'FT2': {'label': 'foot'}})
+        assert index.lookup("FOOT") == ["FT", "FT2"]
+
+    def test_name_and_code_hits_are_deduplicated(self):
+        index = UnitIndex(UNITS)
+        # "m" is both the UCUM code and, case-folded, the name of M
+        assert index.lookup("m") == ["M"]
+        assert index.lookup("°C", fields=("symbol",)) == ["DEG_C"]
+
+    def test_prefix_and_fuzzy_suggestions(self):
+        index = UnitIndex(UNITS)
+        assert index.prefix_search("mil") == ["MilliM"]
+        assert set(index.prefix_search("m")) == {"M", "MilliM", "MO"}
+        assert "M" in index.suggest("metre")
+
+    def test_index_is_reused_for_same_table(self):
+        assert get_unit_index(UNITS) is get_unit_index(UNITS)
+        assert get_unit_index(dict(UNITS)) is not get_unit_index(UNITS)
+
+
+class TestOntologyTermIndex:
+    def test_exact_match_returns_first_term(self):
+        index = OntologyTermIndex(TERMS)
+        assert index.match("temperature") is TERMS[0]
+        assert index.match("TEMP")["label"] == "Temp"
+
+    def test_fuzzy_match_within_cutoff(self):
+        index = OntologyTermIndex(TERMS)
+        assert index.match("Presure")["iri"] == "mds:Pressure"
+        assert index.match("exposure_tme")["iri"] == "mds:ExposureTime"
+
+    def test_fuzzy_match_with_repeated_trigrams(self):
+        terms = [{"label": label, "iri": f"mds:{label}", "normalized": normalize(label)}
+                 for label in ("sample_sample_sample_id", "aaaaaaaaab")]
+        index = OntologyTermIndex(terms)
+        assert index.match("Sample Sample Sample IDs")["iri"] == "mds:sample_sample_sample_id"
+        assert index.match("aaaaaaaaac")["iri"] == "mds:aaaaaaaaab"
+
+    def test_no_match_below_cutoff(self):
+        index = OntologyTermIndex(TERMS)
+        assert index.match("Voltage") is None
+        assert index.match("") is None
+
+    def test_match_columns(self):
+        index = OntologyTermIndex(TERMS)
+        result = index.match_columns(["Temperature", "Presure", "Voltage"])
+        assert result["Temperature"]["iri"] == "mds:Temperature"
+        assert result["Presure"]["iri"] == "mds:Pressure"
+        assert result["Voltage"] is None
+
+    def test_find_best_match_uses_index(self):
+        assert find_best_match("Temperatur", TERMS)["iri"] == "mds:Temperature"
+        assert find_best_match("Voltage", TERMS) is None
+
+
+class TestOntologyTermCache:
+    def test_terms_are_memoised_per_graph(self):
+        g = _ontology("Temperature", "Pressure")
+        first = extract_terms_from_ontology(g)
+        with patch.object(utility, "_extract_terms_from_ontology", side_effect=AssertionError("not cached")):
+            assert extract_terms_from_ontology(g) is first
+            assert get_ontology_term_index(g) is get_ontology_term_index(g)
+
+    def test_graphs_do_not_share_entries(self):
+        assert extract_terms_from_ontology(_ontology("Temperature")) != extract_terms_from_ontology(_ontology("Pressure"))
+
+    def test_mutation_invalidates_cache(self):
+        g = _ontology("Temperature")
+        assert get_ontology_term_index(g).match("Pressure") is None
+
+        term = URIRef("https://cwrusdle.bitbucket.io/mds/Pressure")
+        g.add((term, RDF.type, OWL.Class))
+        g.add((term, RDFS.label, Literal("Pressure")))
+
+        assert len(extract_terms_from_ontology(g)) == 2
+        assert get_ontology_term_index(g).match("Pressure")["iri"] == str(term)
+
+    def test_clear_after_in_place_edit(self):
+        g = _ontology("Temperature")
+        assert get_ontology_term_index(g).match("Pressure") is None
+        before = ontology_fingerprint(g)
+
+        # Same triple count: not detected until the graph's entry is cleared
+        term = URIRef("https://cwrusdle.bitbucket.io/mds/Temperature")
+        g.set((term, RDFS.label, Literal("Pressure")))
+        assert ontology_fingerprint(g) == before
+
+        clear_ontology_term_cache(g)
+        assert ontology_fingerprint(g) != before
+        assert get_ontology_term_index(g).match("Pressure")["iri"] == str(term)
+
+    def test_properties_memoised_per_graph(self):
+        g = _ontology("Temperature")
+        g.add((URIRef("https://cwrusdle.bitbucket.io/mds/measuredBy"), RDF.type, OWL.ObjectProperty))
+        g.add((URIRef("https://cwrusdle.bitbucket.io/mds/measuredBy"), RDFS.label, Literal("measuredBy")))
+        props = get_ontology_properties(g)
+        assert props == {"measuredBy": ("https://cwrusdle.bitbucket.io/mds/measuredBy", "Object Property")}
+        assert get_ontology_properties(g) is props
+
+    def test_class_set_invalidated_on_mutation(self):
+        g = _ontology("Temperature")
+        classes = get_ontology_classes(g)
+        assert classes == {URIRef("https://cwrusdle.bitbucket.io/mds/Temperature")}
+        assert get_ontology_classes(g) is classes
+
+        g.add((URIRef("https://cwrusdle.bitbucket.io/mds/Pressure"), RDF.type, RDFS.Class))
+        assert len(get_ontology_classes(g)) == 2
+
+    def test_entry_dropped_with_graph(self):
+        g = _ontology("Temperature")
+        extract_terms_from_ontology(g)
+        key = id(g)
+        assert key in utility._ONTOLOGY_TERM_CACHE
+        del g
+        gc.collect()  # rdflib graphs hold reference cycles
+        assert key not in utility._ONTOLOGY_TERM_CACHE
@@ -3,10 +3,13 @@ import uuid
 import json
 import pandas as pd
 import pytest
+from pathlib import Path
 from rdflib import Graph, URIRef, RDFS, RDF, OWL, Literal
 import FAIRLinked.RDFTableConversion
 from FAIRLinked.RDFTableConversion import extract_data_from_csv, extract_from_folder, generate_prop_metadata_dict
 from rdflib import Namespace
+from unittest.mock import MagicMock, patch
+from FAIRLinked.RDFTableConversion.MDS_DF.main import MatDatSciDf
 
 
 MDS   = Namespace("https://cwrusdle.bitbucket.io/mds/")
@@ -275,3 +278,173 @@ def test_extract_data_with_complex_properties(
 
 
 
+
+
+def test_extract_data_chunked_matches_full_read(
+    sample_metadata_template,
+    complex_sample_csv,
+    tmp_path,
+    sample_ontology_graph
+):
+    prop_dict = {
+        "has age": [("Value1", "AgeColumn")],
+        "has friend": [("Value1", "FriendColumn")],
+    }
+    kwargs = dict(
+        metadata_template=sample_metadata_template,
+        csv_file=str(complex_sample_csv),
+        orcid="0009-0008-4355-0543",
+        row_key_cols=["Value1"],
+        prop_column_pair_dict=prop_dict,
+        ontology_graph=sample_ontology_graph
+    )
+
+    full = extract_data_from_csv(output_folder=str(tmp_path / "full"), **kwargs)
+    paths = extract_data_from_csv(output_folder=str(tmp_path / "chunked"), chunk_size=1, **kwargs)
+
+    # Graphs are not kept in chunked mode, only the written files are listed
+    assert len(paths) == len(full) == 2
+    assert [os.path.dirname(p) for p in paths] == [str(tmp_path / "chunked")] * 2
+    assert sorted(os.path.basename(p) for p in paths) == sorted(os.listdir(tmp_path / "full"))
+
+    EX = Namespace("http://example.org/")
+    for path in paths:
+        g = Graph()
+        g.parse(path, format="json-ld")
+        ages = [str(o) for o in g.objects(predicate=EX.hasAge)]
+        assert ages and ages[0] in ["25", "30"]
+        assert any(isinstance(o, URIRef) for o in g.objects(predicate=EX.hasFriend))
+
+
+def test_extract_data_chunked_matches_full_read_with_blank_metadata(tmp_path):
+    # A column whose three metadata cells are blank must not be read as float
+    template = {
+        "@context": {"ex": "http://example.org/", "qudt": "http://qudt.org/schema/qudt/",
+                     "skos": "http://www.w3.org/2004/02/skos/core#"},
+        "@graph": [
+            {"@type": "ex:Sample", "skos:altLabel": "Value1", "qudt:value": ""},
+            {"@type": "ex:Count", "skos:altLabel": "Count", "qudt:value": ""},
+        ]
+    }
+    csv_path = tmp_path / "blank_metadata.csv"
+    csv_path.write_text("Value1,Count\nex:Sample,\nUNITLESS,\nSample,\nSampleA,1\nSampleB,2\n")
+    kwargs = dict(metadata_template=template, csv_file=str(csv_path), orcid="0009-0008-4355-0543")
+
+    full = extract_data_from_csv(output_folder=str(tmp_path / "full"), **kwargs)
+    paths = extract_data_from_csv(output_folder=str(tmp_path / "chunked"), chunk_size=1, **kwargs)
+
+    def counts(graphs):
+        return sorted(str(o) for g in graphs for s, o in g.subject_objects(QUDT.value) if "Count" in str(s))
+
+    assert counts(full) == counts(Graph().parse(p, format="json-ld") for p in paths) == ["1", "2"]
+
+
+@pytest.fixture
+def csv_folder(tmp_path, complex_sample_csv):
+    folder = tmp_path / "csvs"
+    folder.mkdir()
+    content = complex_sample_csv.read_text()
+    (folder / "a.csv").write_text(content)
+    (folder / "b.csv").write_text(content + "SampleC,41,SampleA,Ada\n")
+    # A data row with more fields than the header cannot be parsed
+    (folder / "c_broken.csv").write_text(content + "SampleD,1,2,3,4,5\n")
+    (folder / "notes.txt").write_text("not a csv")
+    return folder
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_from_folder_records_failures_in_manifest(
+    sample_metadata_template, csv_folder, tmp_path, sample_ontology_graph, workers
+):
+    out = tmp_path / "out"
+    with pytest.warns(UserWarning, match="1 CSV file"):
+        manifest = extract_from_folder(
+            csv_folder=str(csv_folder),
+            metadata_template=sample_metadata_template,
+            orcid="0000-0000-0000-0000",
+            row_key_cols=["Value1"],
+            id_cols=None,
+            output_base_folder=str(out),
+            prop_column_pair_dict={"has age": [("Value1", "AgeColumn")]},
+            ontology_graph=sample_ontology_graph,
+            workers=workers
+        )
+
+    assert [(e["file"], e["status"], e["rows"]) for e in manifest] == [
+        ("a.csv", "ok", 2), ("b.csv", "ok", 3), ("c_broken.csv", "failed", 0)
+    ]
+    assert "ParserError" in manifest[2]["error"]
+    for entry in manifest[:2]:
+        assert len(list(Path(entry["output_folder"]).glob("*.jsonld"))) == entry["rows"]
+    saved = json.loads((out / "extraction_manifest.json").read_text(encoding="utf-8"))
+    assert saved == manifest
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_extract_from_folder_flags_mismatched_and_empty_files(
+    sample_metadata_template, complex_sample_csv, tmp_path, workers
+):
+    folder = tmp_path / "csvs"
+    folder.mkdir()
+    content = complex_sample_csv.read_text()
+    (folder / "a.csv").write_text(content)
+    # Columns that do not match the template, and a file without data rows
+    (folder / "b_mismatch.csv").write_text("Other\nex:Sample\nUNITLESS\nSample\nX\n")
+    (folder / "c_empty.csv").write_text("\n".join(content.splitlines()[:4]) + "\n")
+
+    with pytest.warns(UserWarning) as record:
+        manifest = extract_from_folder(
+            csv_folder=str(folder),
+            metadata_template=sample_metadata_template,
+            orcid="0000-0000-0000-0000",
+            row_key_cols=["Value1"],
+            id_cols=None,
+            output_base_folder=str(tmp_path / "out"),
+            workers=workers
+        )
+
+    assert [(e["file"], e["status"], e["rows"]) for e in manifest] == [
+        ("a.csv", "ok", 2), ("b_mismatch.csv", "failed", 0), ("c_empty.csv", "empty", 0)
+    ]
+    assert manifest[1]["error"].startswith("TemplateMismatchError: ")
+    assert "missing from the DataFrame" in manifest[1]["error"]
+    messages = [str(w.message) for w in record]
+    assert any(m.startswith("1 CSV file(s) failed to convert: b_mismatch.csv") for m in messages)
+    assert any(m.startswith("1 CSV file(s) had no data rows: c_empty.csv") for m in messages)
+
+
+def test_extract_from_folder_without_template_shares_setup(complex_sample_csv, tmp_path, sample_ontology_graph):
+    folder = tmp_path / "csvs"
+    folder.mkdir()
+    content = complex_sample_csv.read_text()
+    (folder / "a.csv").write_text(content)
+    (folder / "b.csv").write_text(content)
+    # Same columns, other metadata rows => a template of its own
+    (folder / "c.csv").write_text(content.replace("Sample,Tool,Recipe,Tool", "Sample,Sample,Sample,Sample"))
+    sample_ontology_graph.bind("ex", "http://example.org/")
+
+    response = MagicMock(status_code=200)
+    with patch("FAIRLinked.RDFTableConversion.MDS_DF.main.requests.get", return_value=response) as orcid_lookup, \
+         patch("FAIRLinked.RDFTableConversion.csv_to_jsonld_template_filler.load_licenses",
+               wraps=FAIRLinked.RDFTableConversion.csv_to_jsonld_template_filler.load_licenses) as filler_licenses, \
+         patch("FAIRLinked.RDFTableConversion.MDS_DF.main.load_licenses") as row_licenses, \
+         patch.object(MatDatSciDf, "get_relation_pairs_onto", autospec=True,
+                      side_effect=MatDatSciDf.get_relation_pairs_onto) as discover:
+        manifest = extract_from_folder(
+            csv_folder=str(folder),
+            metadata_template=None,
+            orcid="0009-0008-4355-0543",
+            row_key_cols=None,
+            id_cols=None,
+            output_base_folder=str(tmp_path / "out"),
+            ontology_graph=sample_ontology_graph,
+            license="MIT"
+        )
+
+    assert [(e["file"], e["status"], e["rows"]) for e in manifest] == [
+        ("a.csv", "ok", 2), ("b.csv", "ok", 2), ("c.csv", "ok", 2)
+    ]
+    assert orcid_lookup.call_count == 1
+    assert filler_licenses.call_count == 1 and row_licenses.call_count == 0
+    # Once for the first layout (a.csv, b.csv) and once for c.csv
+    assert discover.call_count == 2
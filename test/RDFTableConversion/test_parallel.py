@@ -0,0 +1,48 @@
+import time
+import warnings
+import pytest
+from concurrent.futures import ProcessPoolExecutor
+from FAIRLinked.RDFTableConversion.parallel import run_captured, run_ordered
+
+
+"""
+Tests for parallel.py — the ordered process pool shared by the parallel writers and readers.
+"""
+
+
+def _square_noisy(n):
+    # Later tasks finish first, so results arrive out of order
+    time.sleep(0.05 * (3 - n % 4))
+    print(f"task {n}")
+    warnings.warn(f"warning {n}")
+    return n * n
+
+
+def _fail_on_two(n):
+    if n == 2:
+        raise ValueError("two")
+    return n
+
+
+def test_run_captured():
+    result, output, messages = run_captured(_square_noisy, 3)
+    assert result == 9
+    assert output == "task 3\n"
+    assert messages == [("warning 3", UserWarning)]
+
+
+def test_results_output_and_warnings_in_task_order(capsys):
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        with pytest.warns(UserWarning) as record:
+            results = list(run_ordered(pool, range(8), _square_noisy, 2))
+    assert results == [n * n for n in range(8)]
+    assert capsys.readouterr().out == "".join(f"task {n}\n" for n in range(8))
+    assert [str(w.message) for w in record] == [f"warning {n}" for n in range(8)]
+
+
+def test_errors_raise_or_use_on_error():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        with pytest.raises(ValueError, match="two"):
+            list(run_ordered(pool, range(4), _fail_on_two, 2))
+        results = list(run_ordered(pool, range(4), _fail_on_two, 2, on_error=lambda task, e: -task))
+    assert results == [0, 1, -2, 3]
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+from FAIRLinked.RDFTableConversion.records import iter_records
+
+
+"""
+Tests for records.py — the row iterator shared by the RDF writers.
+"""
+
+
+def test_matches_iterrows_values():
+    df = pd.DataFrame({"A": ["x", "y"], "B": [1.5, 2.5]}, index=[10, 20])
+    records = list(iter_records(df))
+    assert [idx for idx, _ in records] == [10, 20]
+    assert [row for _, row in records] == [row.to_dict() for _, row in df.iterrows()]
+
+
+def test_column_dtypes_are_kept():
+    df = pd.DataFrame({"count": [1, 2], "ratio": [0.5, 1.5]})
+    _, row = next(iter_records(df))
+    # iterrows() would give 1.0 here, as the row is upcast to float
+    assert row["count"] == 1 and type(row["count"]) is int
+    assert type(row["ratio"]) is float
+
+
+def test_missing_values_are_none():
+    df = pd.DataFrame({
+        "f": [np.nan, 1.0],
+        "s": [None, "a"],
+        "i": pd.array([pd.NA, 1], dtype="Int64"),
+        "t": pd.to_datetime([None, "2024-01-01"]),
+    })
+    (_, first), (_, second) = iter_records(df)
+    assert first == {"f": None, "s": None, "i": None, "t": None}
+    assert second == {"f": 1.0, "s": "a", "i": 1, "t": pd.Timestamp("2024-01-01")}
+
+
+def test_column_subset():
+    df = pd.DataFrame({"A": [1], "B": [2]})
+    assert list(iter_records(df, columns=["B"])) == [(0, {"B": 2})]